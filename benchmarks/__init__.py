@@ -0,0 +1 @@
+# Benchmarks des systèmes du jeu
@@ -0,0 +1,65 @@
+# Point d'entrée: python -m benchmarks
+import os
+import sys
+import json
+import argparse
+import platform
+
+# Rendu hors écran: aucune fenêtre ni sortie audio
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from benchmarks.bench import bench_level
+from benchmarks.levels import write_levels_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks des systèmes du jeu")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000, 50000],
+                        help="nombres de plateformes des niveaux synthétiques")
+    parser.add_argument("--monsters", type=int, default=200, help="ennemis actifs")
+    parser.add_argument("--projectiles", type=int, default=2000, help="projectiles actifs")
+    parser.add_argument("--particles", type=int, default=2048, help="particules vivantes")
+    parser.add_argument("--repeat", type=int, default=50, help="mesures par benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="graine des niveaux et positions")
+    parser.add_argument("--output", default="benchmark_results.json", help="fichier de résultats JSON")
+    parser.add_argument("--levels-out", metavar="FICHIER",
+                        help="écrit aussi les niveaux générés au format levels.json")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    if args.levels_out:
+        write_levels_file(args.levels_out, args.sizes, args.monsters, args.seed)
+
+    results = []
+    for size in args.sizes:
+        level_results = bench_level(size, args.monsters, args.projectiles, args.particles, args.repeat, args.seed)
+        for r in level_results:
+            print(f"{r['name']:<42} {size:>6} plateformes  p50 {r['p50_ms']:8.3f} ms  p95 {r['p95_ms']:8.3f} ms"
+                  + ("" if r.get("indexed", True) else "  (sans index)"))
+        results.extend(level_results)
+
+    report = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "monsters": args.monsters,
+            "projectiles": args.projectiles,
+            "particles": args.particles,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Résultats écrits dans {args.output}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
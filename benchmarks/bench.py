@@ -0,0 +1,157 @@
+# Micro-benchmarks des systèmes (physique, entités, rendu)
+import time
+import random
+import pygame
+import numpy as np
+from config.constants import *
+from core.chargeur_niveau import apply_level
+from entities.player import Player
+from entities.enemies import EnemySystem, create_monster_from_config
+from entities.projectiles import ProjectileSystem
+from entities.particles import ParticleSystem
+from game.physics import check_block_collision
+from game.replay import KeyState, RECORDED_KEYS
+from rendering.ui import UIManager
+from rendering.background import BackgroundSystem
+from benchmarks.levels import generate_level
+
+# Nombre de rectangles testés par mesure de check_block_collision
+COLLISION_PROBES = 256
+
+
+def summarize(times):
+    """Résume une liste de durées (secondes) en millisecondes"""
+    ms = np.array(times) * 1000
+    return {
+        "samples": len(ms),
+        "mean_ms": float(ms.mean()),
+        "min_ms": float(ms.min()),
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p95_ms": float(np.percentile(ms, 95)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "max_ms": float(ms.max()),
+    }
+
+
+def measure(fn, repeat, setup=None, warmup=3):
+    """Chronomètre repeat appels de fn (setup, hors mesure, avant chaque appel)"""
+    times = []
+    for i in range(warmup + repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            times.append(elapsed)
+    return summarize(times)
+
+
+def _keys(*pressed):
+    """État clavier synthétique (touches maintenues)"""
+    mask = 0
+    for key in pressed:
+        mask |= 1 << RECORDED_KEYS.index(key)
+    return KeyState(mask)
+
+
+def bench_level(platform_count, monster_count, projectile_count, particle_count, repeat, seed=0):
+    """Mesure tous les systèmes sur un niveau synthétique
+
+    Args:
+        platform_count: int - taille du niveau
+        monster_count: int - ennemis actifs
+        projectile_count: int - projectiles actifs
+        particle_count: int - particules vivantes
+        repeat: int - nombre de mesures par benchmark
+        seed: int - graine (niveau et positions)
+
+    Returns:
+        list: un dict de résultats par benchmark
+    """
+    rng = random.Random(seed)
+    level = generate_level(platform_count, monster_count, seed)
+    state = apply_level(level, {})
+    platforms = state["platforms"]
+    platform_types = state["platform_types"]
+    platform_colors = state["platform_colors"]
+    platform_index = state["platform_index"]
+    ground_y = state["GROUND_Y"]
+    ground_start_x = state["GROUND_START_X"]
+    ground_end_x = state["GROUND_END_X"]
+    dt = 1.0 / PHYSICS_HZ
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    camera_offset = pygame.Vector2(state["spawn_point"].x - SCREEN_WIDTH / 2, ground_y - SCREEN_HEIGHT * 0.75)
+    results = []
+
+    def record(name, stats, **extra):
+        stats.update(name=name, platforms=platform_count, **extra)
+        results.append(stats)
+
+    # Collisions blocs: rectangles de la taille du joueur répartis sur le niveau
+    probes = [pygame.Rect(rng.randint(ground_start_x, ground_end_x), rng.randint(ground_y - 2000, ground_y), 40, 90)
+              for _ in range(COLLISION_PROBES)]
+    record("check_block_collision", measure(
+        lambda: [check_block_collision(r, platforms, platform_types, platform_index) for r in probes], repeat),
+        calls_per_sample=COLLISION_PROBES, indexed=True)
+    record("check_block_collision", measure(
+        lambda: [check_block_collision(r, platforms, platform_types) for r in probes], repeat),
+        calls_per_sample=COLLISION_PROBES, indexed=False)
+
+    # Joueur: court et saute vers la droite depuis le spawn
+    player = Player(state["spawn_point"].x, state["spawn_point"].y, rng=rng)
+    keys = _keys(pygame.K_RIGHT, pygame.K_SPACE)
+    steps = [0]
+
+    def player_setup():
+        steps[0] += 1
+        if steps[0] % PHYSICS_HZ == 0:
+            player.reset(state["spawn_point"])
+
+    record("Player.update", measure(
+        lambda: player.update(dt, keys, platforms, platform_types, ground_y, ground_start_x, ground_end_x, platform_index),
+        repeat, setup=player_setup))
+
+    # Ennemis
+    enemies = EnemySystem(rng=rng)
+    enemies.monsters = [create_monster_from_config(cfg) for cfg in state["level_enemy_configs"]]
+    record("EnemySystem.update", measure(
+        lambda: enemies.update(dt, platforms, ground_y, platform_index), repeat),
+        monsters=len(enemies.monsters))
+
+    # Projectiles vers les ennemis: le tableau est recréé avant chaque mesure
+    projectiles = ProjectileSystem()
+    particles = ParticleSystem(rng=np.random.default_rng(seed))
+    monsters = enemies.monsters
+
+    def projectiles_setup():
+        projectiles.clear()
+        for _ in range(projectile_count):
+            projectiles.add_projectile({"pos": (rng.uniform(0, 2600), rng.uniform(ground_y - 400, ground_y)),
+                                        "vel": (0.0, 0.0)})
+        for monster in monsters:
+            monster["hp"] = 1000  # Pas de mort: la charge reste constante
+
+    record("EnemySystem.check_projectile_collision", measure(
+        lambda: enemies.check_projectile_collision(projectiles, particles), repeat, setup=projectiles_setup),
+        monsters=len(monsters), projectiles=projectile_count)
+
+    # Particules
+    def particles_setup():
+        if particles.get_count() < particle_count:
+            particles.clear()
+            particles.create_particles((0.0, 0.0), (255, 255, 255), particle_count)
+
+    record("ParticleSystem.update", measure(lambda: particles.update(dt), repeat, setup=particles_setup),
+           particles=min(particle_count, particles.capacity))
+
+    # Rendu hors écran
+    ui = UIManager()
+    record("UIManager.draw_platforms", measure(
+        lambda: ui.draw_platforms(screen, platforms, platform_colors, platform_types, camera_offset), repeat))
+
+    background = BackgroundSystem(rng=rng)
+    record("BackgroundSystem.draw_parallax_background", measure(
+        lambda: background.draw_parallax_background(screen, camera_offset), repeat))
+
+    return results
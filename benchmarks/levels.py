@@ -0,0 +1,72 @@
+# Niveaux synthétiques pour les benchmarks
+import json
+import random
+from config.constants import *
+
+# Répartition des types de plateformes dans les niveaux générés
+SYNTHETIC_TYPE_WEIGHTS = (("platform", 0.6), ("block", 0.3), ("decor", 0.1))
+
+# Surface moyenne de niveau par plateforme (densité constante quelle que soit la taille)
+SYNTHETIC_SPACING_X = 60
+SYNTHETIC_HEIGHT = 2000
+
+
+def generate_level(platform_count, monster_count=0, seed=0):
+    """Génère un niveau au format de levels.json (voir load_levels / apply_level)
+
+    Les plateformes sont réparties uniformément sur une largeur
+    proportionnelle à leur nombre, la densité reste donc comparable d'une
+    taille à l'autre: les courbes mesurent le passage à l'échelle, pas
+    l'encombrement.
+
+    Args:
+        platform_count: int - nombre de plateformes
+        monster_count: int - nombre d'ennemis (section "enemies")
+        seed: int - graine du générateur
+
+    Returns:
+        dict: niveau
+    """
+    rng = random.Random(seed)
+    width = max(SCREEN_WIDTH * 2, platform_count * SYNTHETIC_SPACING_X)
+    ground_y = GROUND_Y
+    types = [t for t, _ in SYNTHETIC_TYPE_WEIGHTS]
+    weights = [w for _, w in SYNTHETIC_TYPE_WEIGHTS]
+
+    platforms = []
+    for _ in range(platform_count):
+        platforms.append({
+            "x": rng.randint(0, width),
+            "y": rng.randint(ground_y - SYNTHETIC_HEIGHT, ground_y - 40),
+            "w": rng.randint(40, 300),
+            "h": rng.randint(16, 80),
+            "type": rng.choices(types, weights)[0],
+            "color": "#%06x" % rng.randint(0, 0xFFFFFF),
+        })
+
+    enemies = []
+    for _ in range(monster_count):
+        m_type = rng.choice(("basic", "tank", "fast", "flyer"))
+        enemies.append({
+            "x": rng.randint(100, 2500),
+            "y": rng.randint(ground_y - 300, ground_y - 40),
+            "type": m_type,
+            "dir": rng.choice((-1, 1)),
+        })
+
+    return {
+        "name": f"Synthétique {platform_count}",
+        "ground": {"y": ground_y, "start_x": 0, "end_x": width},
+        "spawn": {"x": 100, "y": ground_y - 200},
+        "goal": {"x": width - 100, "y": ground_y - 110, "w": 70, "h": 110},
+        "platforms": platforms,
+        "enemies": enemies,
+    }
+
+
+def write_levels_file(path, sizes, monster_count=0, seed=0):
+    """Écrit un fichier {"levels": [...]} avec un niveau par taille"""
+    levels = [generate_level(n, monster_count, seed + i) for i, n in enumerate(sizes)]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"levels": levels}, f)
+    return levels
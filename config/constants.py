@@ -15,6 +15,8 @@ GRAVITY = 800
 JUMP_FORCE = -600
 MOVE_SPEED = 300
 PROJECTILE_SPEED = 800
+PHYSICS_MAX_SUBSTEP_DT = 1 / 120  # Pas d'intégration max du joueur (s)
+CONTROLLER_MAX_STEP = 16  # Déplacement max par sous-pas du contrôleur (px)
 
 # === Stamina ===
 STAMINA_MAX = 100
@@ -28,13 +30,20 @@ DASH_SPEED = 900
 DASH_DURATION = 0.2
 
 # === Jeu ===
-FPS = 60
+FPS = 60  # Limite d'affichage (0 = non limité), sans effet sur la simulation
 MAX_MONSTERS = 3
 MONSTER_SPAWN_COOLDOWN = 2.0
 DEATH_BELOW_Y = GROUND_Y + 1500
 
+# === Boucle de simulation (pas fixe) ===
+PHYSICS_HZ = 120
+MAX_FRAME_TIME = 0.25  # Temps réel max pris en compte par image (s)
+MAX_STEPS_PER_FRAME = 8  # Plafond de pas simulés par image
+INTERPOLATION_SNAP_DISTANCE = 200  # Au-delà (téléportation), pas d'interpolation
+
 # === Caméra ===
-CAMERA_LAG = 0.05
+CAMERA_LAG = 0.05  # Fraction de rattrapage par image de référence (60 FPS)
+CAMERA_LAG_REFERENCE_FPS = 60
 
 # === Joueur ===
 head_radius = 20
@@ -44,13 +53,21 @@ arm_length = 25
 
 # === Projectiles ===
 projectile_radius = 6
+PROJECTILE_INITIAL_CAPACITY = 256  # Taille initiale des tableaux (doublée au besoin)
+PROJECTILE_SWAP_REMOVE_MAX = 32  # Au-delà, compaction en bloc par masque
 
 # === Ennemis ===
 monster_radius = 25
+PROJECTILE_HASH_CELL_SIZE = 64  # Cellule min. du hachage spatial projectiles/ennemis (agrandie si un ennemi est plus gros)
+
+# === Particules ===
+PARTICLE_CAPACITY = 2048  # Taille du tampon circulaire (les plus anciennes sont remplacées)
+PARTICLE_LIFE_BUCKETS = 16  # Paliers de fondu (un sprite en cache par couleur et palier)
 
 # === Transitions de niveaux ===
 LEVEL_TRANSITION_FADE_OUT = 0.6
 LEVEL_TRANSITION_FADE_IN = 0.6
+LEVEL_PREFETCH_DISTANCE = 1200  # Distance à la porte (px) à partir de laquelle le niveau suivant est préchargé
 
 # === Invulnérabilité ===
 invuln_time = 1.5
@@ -72,3 +89,40 @@ GAME_STATES = {
 
 # === Types de plateformes ===
 PLATFORM_TYPES = ["platform", "block", "decor"]
+
+# === Index spatial des plateformes ===
+PLATFORM_GRID_CELL_SIZE = 256
+
+# === Profileur d'images (F3: afficher, F4: export CSV) ===
+PROFILER_WINDOW = 240  # Images prises en compte pour moyennes et percentiles
+PROFILER_HISTORY = 3600  # Images conservées pour l'export CSV
+PROFILER_REFRESH = 15  # Images entre deux reconstructions de l'overlay
+
+# === Profilage en ligne de commande (--profile) ===
+PROFILE_SNAPSHOT_SECONDS = 10  # Intervalle par défaut entre deux fichiers pstats
+PROFILE_SAMPLE_INTERVAL = 0.005  # Période de l'échantillonneur de piles (secondes)
+
+# === Cache des niveaux préparés (navigation dans le menu) ===
+PREPARED_LEVEL_CACHE_BUDGET = 64 * 1024 * 1024  # Octets (estimation) gardés en mémoire
+
+# === Musique ===
+MUSIC_CROSSFADE_MS = 1500  # Changement de piste (fondu de sortie puis d'entrée), ou fondu d'entrée de la première
+MUSIC_CACHE_BUDGET = 64 * 1024 * 1024  # Octets d'audio compressé gardés en mémoire (une dizaine de pistes)
+MUSIC_TEMP_DIR = "mon_jeu_musique"  # Sous-dossier du dossier temporaire du système
+
+# === Arrière-plan (bandes de montagnes répétables) ===
+MOUNTAIN_STRIP_WIDTH = 2520  # Largeur d'une bande: multiple de la période et du pas
+MOUNTAIN_WAVE_PERIOD = 630  # Période du relief (px)
+MOUNTAIN_VERTEX_STEP = 120  # Espacement des sommets du polygone (px)
+MOUNTAIN_AMPLITUDE = 40  # Amplitude du relief (px)
+
+# === Cache de la géométrie statique (sol et plateformes) ===
+GEOMETRY_CHUNK_SIZE = 512  # Côté d'un morceau précalculé (px)
+GEOMETRY_CACHE_BUDGET = 48 * 1024 * 1024  # Octets de morceaux gardés en mémoire
+
+# === Sprites pré-rendus (joueur, ennemis) ===
+SPRITE_CACHE_SIZE = 512  # Sprites gardés par cache (LRU)
+SPRITE_COLORKEY = (255, 0, 255)  # Couleur transparente des sprites opaques
+
+# === Cache des textes rendus ===
+TEXT_CACHE_SIZE = 256  # Surfaces de texte gardées (LRU)
@@ -1,9 +1,10 @@
 # Chargeur de niveaux
-import json
 import os
 from copy import deepcopy
 import pygame
 from config.constants import *
+from game.spatial import PlatformGrid
+from core.level_index import LevelCollection
 
 def _default_level():
     """Crée un niveau par défaut"""
@@ -65,13 +66,17 @@ def load_levels():
     
     Stratégie de chargement:
     1. Cherche 'level.json' et 'levels.json' (support ancien/nouveau format)
-    2. Parse le JSON et extrait la liste 'levels'
+    2. Indexe la liste 'levels' (positions et noms, voir core.level_index)
+       sans décoder les niveaux: un niveau n'est lu que lorsqu'il est
+       sélectionné
     3. Si aucun fichier trouvé ou invalide, utilise un niveau par défaut
+       (un niveau invalide dans un fichier valide n'est découvert qu'une
+       fois sélectionné: il est alors remplacé par le niveau par défaut,
+       voir core.level_cache.prepare_level)
     
     Returns:
-        list: liste des dictionnaires de niveaux
+        LevelCollection: niveaux indexables (collection[i] -> dict, name(i))
     """
-    levels = []
     levels_dir = os.path.dirname(__file__)
     level_filenames = ["levels (1).json", "level.json", "levels.json"]  # Prioritize levels (1).json for music support
     
@@ -81,20 +86,13 @@ def load_levels():
             continue  # Fichier n'existe pas, passe au suivant
         
         try:
-            with open(level_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                # Vérifie la structure: dict avec clé 'levels' contenant une liste non vide
-                if isinstance(data, dict) and isinstance(data.get("levels"), list) and data["levels"]:
-                    levels = data["levels"]
-                    break  # Arrête après le premier fichier valide trouvé
+            # Vérifie la structure: dict avec clé 'levels' contenant une liste non vide
+            return LevelCollection.from_file(level_path)
         except Exception:
-            continue  # Erreur de parsing, passe au fichier suivant
+            continue  # Erreur de lecture ou structure invalide, passe au fichier suivant
 
     # Si aucun niveau trouvé, crée un niveau par défaut
-    if not levels:
-        levels = [_default_level()]
-    
-    return levels
+    return LevelCollection.from_list([_default_level()])
 
 def apply_level(level, game_state):
     """Applique les données d'un niveau à l'état du jeu
@@ -102,6 +100,7 @@ def apply_level(level, game_state):
     Convertit les données JSON en structures de jeu utilisables:
     - Paramètres du sol (position, limites)
     - Plateformes avec types et couleurs
+    - Index spatial des plateformes (construit une seule fois ici)
     - Objectif (porte/zone de fin)
     - Point de spawn du joueur
     - Configurations des ennemis
@@ -152,6 +151,8 @@ def apply_level(level, game_state):
     game_state["platforms"] = platforms
     game_state["platform_colors"] = platform_colors
     game_state["platform_types"] = platform_types
+    # Index spatial: les systèmes interrogent une zone au lieu de parcourir tout le niveau
+    game_state["platform_index"] = PlatformGrid(platforms, platform_types)
     
     # Configuration de l'objectif (porte/zone de fin)
     g = level.get("goal", {})
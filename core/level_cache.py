@@ -0,0 +1,159 @@
+# Cache des niveaux préparés
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from config.constants import *
+from core.level_compiler import compile_level, get_compiled_level, apply_compiled_level
+from core.chargeur_niveau import _default_level
+from game.spatial import CellBuckets
+
+# Coût estimé d'une plateforme: l'objet Rect et ses 3 entrées de liste
+# (plateformes, couleurs, types; couleurs et types sont partagés)
+_PLATFORM_BYTES = sys.getsizeof(pygame.Rect(0, 0, 0, 0)) + 3 * 8
+
+
+def estimate_level_bytes(state):
+    """Estime la mémoire occupée par un niveau préparé (voir apply_compiled_level)"""
+    total = len(state["platforms"]) * _PLATFORM_BYTES
+    for cells in state["platform_index"].cells.values():
+        if isinstance(cells, CellBuckets):
+            total += sys.getsizeof(cells.slots) + cells.offsets.nbytes + cells.indices.nbytes
+        else:
+            total += sys.getsizeof(cells) + sum(56 + 8 * len(bucket) for bucket in cells.values())
+    total += sum(len(entry.get("data", "")) for entry in state.get("level_music", []))
+    return total
+
+
+class PreparedLevelCache:
+    """Cache LRU des niveaux prêts à jouer, borné en mémoire
+
+    Un niveau préparé est l'état produit par apply_compiled_level (Rects,
+    couleurs, types, index spatial, configs d'ennemis, musique). Il est
+    partagé tel quel par les accès suivants: ces données de niveau ne sont
+    jamais modifiées pendant le jeu.
+
+    Quand la somme des tailles estimées dépasse budget, les niveaux les
+    moins récemment utilisés sont retirés (le plus récent est toujours gardé).
+    """
+
+    def __init__(self, budget=PREPARED_LEVEL_CACHE_BUDGET):
+        self.budget = budget
+        self.entries = OrderedDict()  # clé -> (état, taille)
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        """Retourne l'état préparé de key (et le marque récent), ou None"""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, state):
+        """Ajoute un état préparé et applique le budget mémoire"""
+        if key in self.entries:
+            self.total_bytes -= self.entries.pop(key)[1]
+        size = estimate_level_bytes(state)
+        self.entries[key] = (state, size)
+        self.total_bytes += size
+        while self.total_bytes > self.budget and len(self.entries) > 1:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+
+    def clear(self):
+        """Vide le cache"""
+        self.entries.clear()
+        self.total_bytes = 0
+
+
+def prepare_level(levels, idx):
+    """Compile et prépare le niveau idx d'une LevelCollection (tout thread)
+
+    Les niveaux ne sont décodés qu'ici (voir core.level_index): un niveau
+    invalide (JSON malformé, structure inattendue) est signalé puis remplacé
+    par le niveau par défaut, comme l'était un fichier invalide.
+    """
+    name = levels.name(idx)  # IndexError si idx n'existe pas
+    try:
+        return apply_compiled_level(get_compiled_level(levels, idx), {})
+    except Exception as e:
+        print(f"Niveau invalide: {name} ({e}), niveau par défaut utilisé")
+        return apply_compiled_level(compile_level(_default_level()), {})
+
+
+class LevelPrefetcher:
+    """Prépare des niveaux en arrière-plan pour un PreparedLevelCache
+
+    request() lance la préparation d'un niveau sur un thread; poll(),
+    appelé par le thread principal, range les niveaux prêts dans le cache.
+    get() retourne un niveau préparé: depuis le cache (simple échange de
+    références), en attendant la fin de son préchargement, ou en le
+    préparant sur place.
+
+    Un niveau dont la préparation a échoué n'est jamais relancé: son erreur
+    est gardée et get() la relève.
+    """
+
+    def __init__(self, levels, cache):
+        self.levels = levels
+        self.cache = cache
+        self.pending = {}  # indice -> Future
+        self.failed = {}  # indice -> Future terminée en erreur
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="niveaux")
+
+    def request(self, idx):
+        """Lance le préchargement de idx (sans effet s'il est prêt, en cours ou en échec)"""
+        if idx not in self.pending and idx not in self.cache and idx not in self.failed:
+            self.pending[idx] = self.executor.submit(prepare_level, self.levels, idx)
+
+    def poll(self):
+        """Range les préchargements terminés dans le cache
+
+        Returns:
+            list: états des niveaux devenus prêts
+        """
+        ready = []
+        for idx, future in list(self.pending.items()):
+            if not future.done():
+                continue
+            del self.pending[idx]
+            if future.exception() is not None:
+                self.failed[idx] = future  # Erreur relevée par get()
+                continue
+            state = future.result()
+            self.cache.put(idx, state)
+            ready.append(state)
+        return ready
+
+    def get(self, idx):
+        """Retourne l'état préparé du niveau idx
+
+        Raises:
+            l'erreur de préparation du niveau, s'il a échoué
+        """
+        state = self.cache.get(idx)
+        if state is None:
+            future = self.failed.get(idx) or self.pending.pop(idx, None)
+            if future is None:
+                state = prepare_level(self.levels, idx)
+            elif future.exception() is not None:
+                self.failed[idx] = future
+                raise future.exception()
+            else:
+                state = future.result()
+            self.cache.put(idx, state)
+        return state
+
+    def close(self):
+        """Abandonne les préchargements et arrête le thread"""
+        self.pending.clear()
+        self.failed.clear()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,230 @@
+# Compilation des niveaux (cache binaire)
+import os
+import json
+import hashlib
+import types
+import numpy as np
+import pygame
+from config.constants import *
+from core.chargeur_niveau import apply_level
+from game.spatial import PlatformGrid, CellBuckets
+
+# Version du format compilé (à incrémenter s'il change: invalide le cache)
+_COMPILER_VERSION = 2
+
+# Dossier du cache, à la racine du projet
+LEVEL_CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", ".level_cache")
+
+
+class CompiledLevel:
+    """Niveau précompilé en tableaux compacts
+
+    - rects: (N, 4) int32 - x, y, w, h des plateformes
+    - types: (N,) uint8 - indice dans PLATFORM_TYPES
+    - color_idx: (N,) int32 - indice dans palette
+    - palette: (P, 3) uint8 - couleurs distinctes du niveau
+    - grid: {type: (cx, cy, offsets, indices)} - cellules de PlatformGrid
+      au format CSR (les indices de la cellule k sont
+      indices[offsets[k]:offsets[k + 1]])
+    - meta: dict - nom, sol, objectif, spawn et configs d'ennemis
+    - music: tuple - pistes {"name", "type", "data"} en lecture seule
+      (rangées sur disque à part, une fois par contenu: voir save_compiled)
+    - enemy_templates: tuple - configs d'ennemis en lecture seule, partagées
+      telles quelles par chaque application du niveau
+    """
+
+    def __init__(self, rects, types, color_idx, palette, grid, meta, music=()):
+        self.rects = rects
+        self.types = types
+        self.color_idx = color_idx
+        self.palette = palette
+        self.grid = grid
+        self.meta = meta
+        self.music = tuple(_freeze(m) for m in music)
+        self.enemy_templates = tuple(_freeze(c) for c in meta["level_enemy_configs"])
+
+    def nbytes(self):
+        """Taille approximative en mémoire (octets)"""
+        arrays = [self.rects, self.types, self.color_idx, self.palette]
+        for cells in self.grid.values():
+            arrays.extend(cells)
+        music = sum(len(m["data"]) for m in self.music)
+        return sum(a.nbytes for a in arrays) + music
+
+
+def _freeze(value):
+    """Copie en lecture seule d'une valeur JSON (dict -> mappingproxy, list -> tuple)"""
+    if isinstance(value, dict):
+        return types.MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def compile_level(level):
+    """Compile un niveau (dict de levels.json)
+
+    Le décodage passe par apply_level: le niveau compilé a exactement la
+    même sémantique (conversions, valeurs par défaut, couleurs, types).
+    """
+    state = apply_level(level, {})
+    platforms = state["platforms"]
+
+    rects = np.array([tuple(p) for p in platforms], dtype=np.int32).reshape(-1, 4)
+    types = np.array([PLATFORM_TYPES.index(t) for t in state["platform_types"]], dtype=np.uint8)
+    colors = np.array(state["platform_colors"], dtype=np.uint8).reshape(-1, 3)
+    palette, color_idx = np.unique(colors, axis=0, return_inverse=True)
+
+    grid = {}
+    for ptype, cells in state["platform_index"].cells.items():
+        keys = list(cells)
+        cx = np.array([k[0] for k in keys], dtype=np.int32)
+        cy = np.array([k[1] for k in keys], dtype=np.int32)
+        sizes = [len(cells[k]) for k in keys]
+        offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=offsets[1:])
+        indices = np.array([i for k in keys for i in cells[k]], dtype=np.int32)
+        grid[ptype] = (cx, cy, offsets, indices)
+
+    meta = {
+        "name": level.get("name", ""),
+        "ground": [state["GROUND_Y"], state["GROUND_START_X"], state["GROUND_END_X"]],
+        "goal": list(state["goal_rect"]),
+        "spawn": [state["spawn_point"].x, state["spawn_point"].y],
+        "cell_size": state["platform_index"].cell_size,
+        "level_enemy_configs": state["level_enemy_configs"],
+    }
+    return CompiledLevel(rects, types, color_idx.reshape(-1).astype(np.int32), palette, grid, meta,
+                         state["level_music"])
+
+
+def _music_path(directory, digest):
+    """Fichier d'une musique (base64) du cache, nommé par l'empreinte de son contenu"""
+    return os.path.join(directory, digest + ".b64")
+
+
+def _write_atomic(path, write):
+    """Écrit un fichier via write(f), sans jamais laisser de fichier à moitié écrit"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def save_compiled(compiled, path):
+    """Écrit un niveau compilé (.npz non compressé)
+
+    Les musiques (base64, souvent plusieurs Mo) ne sont pas mises dans meta:
+    chacune est écrite une seule fois dans le dossier du cache, sous
+    l'empreinte de son contenu, et meta n'en garde que la référence.
+    """
+    directory = os.path.dirname(path)
+    music_refs = []
+    for music in compiled.music:
+        raw = music["data"].encode("utf-8")
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        music_path = _music_path(directory, digest)
+        if not os.path.isfile(music_path):
+            _write_atomic(music_path, lambda f: f.write(raw))
+        music_refs.append({"name": music["name"], "type": music["type"], "data_ref": digest})
+
+    meta = {**compiled.meta, "level_music": music_refs}
+    arrays = {
+        "rects": compiled.rects,
+        "types": compiled.types,
+        "color_idx": compiled.color_idx,
+        "palette": compiled.palette,
+        "meta": np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8),
+    }
+    for ptype, cells in compiled.grid.items():
+        for part, array in zip(("cx", "cy", "offsets", "indices"), cells):
+            arrays[f"grid_{ptype}_{part}"] = array
+    # Écriture atomique: un cache à moitié écrit ne doit jamais être relu
+    _write_atomic(path, lambda f: np.savez(f, **arrays))
+
+
+def load_compiled(path):
+    """Relit un niveau compilé écrit par save_compiled
+
+    Raises:
+        OSError: si une musique référencée manque dans le cache
+    """
+    with np.load(path, allow_pickle=False) as data:
+        grid = {}
+        for ptype in PLATFORM_TYPES:
+            if f"grid_{ptype}_cx" in data:
+                grid[ptype] = tuple(data[f"grid_{ptype}_{part}"] for part in ("cx", "cy", "offsets", "indices"))
+        meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+        rects, types, color_idx, palette = data["rects"], data["types"], data["color_idx"], data["palette"]
+
+    directory = os.path.dirname(path)
+    music = []
+    for ref in meta.pop("level_music"):
+        with open(_music_path(directory, ref["data_ref"]), "rb") as f:
+            music.append({"name": ref["name"], "type": ref["type"], "data": f.read().decode("utf-8")})
+    return CompiledLevel(rects, types, color_idx, palette, grid, meta, music)
+
+
+def get_compiled_level(levels, idx, cache_dir=LEVEL_CACHE_DIR):
+    """Retourne le niveau idx d'une LevelCollection, compilé
+
+    Le cache disque est indexé par une empreinte du contenu brut du niveau
+    (et de la version du format): un niveau modifié est recompilé, un
+    niveau inchangé est relu sans décoder son JSON. Un fichier de cache
+    illisible est remplacé. Si le cache ne peut pas être écrit, le niveau
+    compilé est simplement retourné.
+    """
+    raw = levels.raw(idx)
+    digest = hashlib.blake2b(raw, digest_size=16)
+    digest.update(str(_COMPILER_VERSION).encode())
+    path = os.path.join(cache_dir, digest.hexdigest() + ".npz")
+
+    if os.path.isfile(path):
+        try:
+            return load_compiled(path)
+        except Exception:
+            # Cache illisible (tronqué, vide, format inattendu...): supprimé
+            # puis recompilé, sinon il serait relu à chaque lancement
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    compiled = compile_level(levels[idx])
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        save_compiled(compiled, path)
+    except OSError:
+        pass
+    return compiled
+
+
+def apply_compiled_level(compiled, game_state):
+    """Applique un niveau compilé à l'état du jeu (mêmes clés qu'apply_level)
+
+    Les Rects, couleurs et types sont reconstruits directement depuis les
+    tableaux, et l'index spatial depuis ses cellules précalculées. Les
+    configs d'ennemis et les musiques sont en lecture seule: elles sont
+    partagées sans copie (EnemySystem ne copie que l'état de chaque ennemi).
+    """
+    meta = compiled.meta
+    game_state["level_name"] = meta["name"]
+    game_state["GROUND_Y"], game_state["GROUND_START_X"], game_state["GROUND_END_X"] = meta["ground"]
+
+    Rect = pygame.Rect
+    platforms = [Rect(x, y, w, h) for x, y, w, h in compiled.rects.tolist()]
+    palette = list(map(tuple, compiled.palette.tolist()))
+    platform_colors = [palette[i] for i in compiled.color_idx.tolist()]
+    platform_types = [PLATFORM_TYPES[t] for t in compiled.types.tolist()]
+
+    cells = {ptype: CellBuckets(*arrays) for ptype, arrays in compiled.grid.items()}
+
+    game_state["platforms"] = platforms
+    game_state["platform_colors"] = platform_colors
+    game_state["platform_types"] = platform_types
+    game_state["platform_index"] = PlatformGrid.from_cells(platforms, platform_types, cells, meta["cell_size"])
+    game_state["goal_rect"] = Rect(*meta["goal"])
+    game_state["spawn_point"] = pygame.Vector2(*meta["spawn"])
+    game_state["level_enemy_configs"] = compiled.enemy_templates
+    game_state["level_music"] = compiled.music
+    return game_state
@@ -0,0 +1,167 @@
+# Index des niveaux (chargement paresseux)
+import os
+import re
+import json
+
+# Jetons utiles au découpage (m.lastindex donne le type): chaîne JSON complète
+# (sautée d'un bloc, y compris les musiques base64), suivie ou non de ':'
+# (clé), ouverture et fermeture d'objet/tableau
+_TOKEN_RE = re.compile(rb'("[^"\\]*(?:\\.[^"\\]*)*")(\s*:)?|([\[{])|([\]}])')
+_STRING, _KEY, _OPEN, _CLOSE = 1, 2, 3, 4
+
+# Version du format du fichier d'index (à incrémenter s'il change)
+_INDEX_VERSION = 1
+
+
+def scan_levels(data):
+    """Repère chaque niveau de {"levels": [...]} sans décoder le JSON
+
+    Args:
+        data: bytes - contenu du fichier
+
+    Returns:
+        list: [(début, fin, nom ou None), ...] positions en octets de chaque
+              objet niveau (fin exclue)
+
+    Raises:
+        ValueError: si aucune liste "levels" n'est trouvée au premier niveau
+    """
+    entries = []
+    depth = 0
+    levels_depth = None  # Profondeur du tableau "levels" une fois trouvé
+    start = None
+    name = None
+    pending_key = None
+
+    for m in _TOKEN_RE.finditer(data):
+        kind = m.lastindex
+        if kind == _KEY:
+            token = m.group(1)
+            if depth == 1 and levels_depth is None and token == b'"levels"':
+                pending_key = "levels"
+            elif start is not None and depth == levels_depth + 1 and token == b'"name"':
+                pending_key = "name"
+            else:
+                pending_key = None
+        elif kind == _STRING:
+            if pending_key == "name" and depth == levels_depth + 1:
+                name = json.loads(m.group(1))
+            pending_key = None
+        elif kind == _OPEN:
+            depth += 1
+            if pending_key == "levels" and m.group(3) == b"[":
+                levels_depth = depth
+            elif levels_depth is not None and depth == levels_depth + 1 and m.group(3) == b"{":
+                start = m.start()
+                name = None
+            pending_key = None
+        else:
+            if levels_depth is not None:
+                if depth == levels_depth + 1 and start is not None:
+                    entries.append((start, m.end(), name))
+                    start = None
+                elif depth == levels_depth:
+                    break  # Fin du tableau "levels"
+            depth -= 1
+
+    if levels_depth is None:
+        raise ValueError("Liste 'levels' introuvable")
+    return entries
+
+
+def _index_path(path):
+    """Chemin du fichier d'index rangé à côté du fichier de niveaux"""
+    return path + ".index.json"
+
+
+def load_index(path):
+    """Retourne l'index d'un fichier de niveaux, depuis le cache si à jour
+
+    Le cache est invalidé par la date de modification et la taille du
+    fichier. S'il ne peut pas être écrit (dossier en lecture seule), l'index
+    est simplement recalculé au prochain lancement.
+    """
+    stat = os.stat(path)
+    key = {"version": _INDEX_VERSION, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    try:
+        with open(_index_path(path), "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if all(cached.get(k) == v for k, v in key.items()):
+            return [tuple(entry) for entry in cached["levels"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    with open(path, "rb") as f:
+        entries = scan_levels(f.read())
+    try:
+        with open(_index_path(path), "w", encoding="utf-8") as f:
+            json.dump({**key, "levels": entries}, f)
+    except OSError:
+        pass
+    return entries
+
+
+class LevelCollection:
+    """Liste de niveaux dont seuls les noms sont en mémoire
+
+    Un niveau (plateformes, ennemis, musique) n'est décodé que lorsqu'on y
+    accède par collection[i], en relisant sa tranche d'octets dans le
+    fichier. Le dernier niveau décodé est conservé. Les accès peuvent venir
+    de plusieurs threads (préchargement, voir core.level_cache).
+    """
+
+    def __init__(self, path=None, entries=None, levels=None):
+        self.path = path
+        self.entries = entries or []
+        self.levels = levels  # Niveaux déjà en mémoire (niveau par défaut)
+        self._last = (None, None)  # (indice, niveau), remplacé d'un bloc
+
+    @classmethod
+    def from_file(cls, path):
+        """Crée la collection d'un fichier {"levels": [...]} (ValueError si vide)"""
+        entries = load_index(path)
+        if not entries:
+            raise ValueError(f"Aucun niveau dans {path}")
+        return cls(path=path, entries=entries)
+
+    @classmethod
+    def from_list(cls, levels):
+        """Crée une collection de niveaux déjà décodés"""
+        return cls(levels=list(levels))
+
+    def __len__(self):
+        if self.levels is not None:
+            return len(self.levels)
+        return len(self.entries)
+
+    def __getitem__(self, idx):
+        """Retourne le niveau idx (dict), décodé à la demande"""
+        if self.levels is not None:
+            return self.levels[idx]
+        idx = range(len(self.entries))[idx]  # Indices négatifs et IndexError
+        last_index, level = self._last
+        if idx != last_index:
+            level = json.loads(self.raw(idx))
+            self._last = (idx, level)
+        return level
+
+    def raw(self, idx):
+        """Octets JSON du niveau idx, sans le décoder"""
+        if self.levels is not None:
+            return json.dumps(self.levels[idx], sort_keys=True).encode("utf-8")
+        start, end, _ = self.entries[idx]
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            return f.read(end - start)
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def name(self, idx):
+        """Nom du niveau idx, sans le décoder"""
+        if self.levels is not None:
+            name = self.levels[idx].get("name")
+        else:
+            name = self.entries[idx][2]
+        return name if isinstance(name, str) and name else f"Niveau {idx + 1}"
@@ -0,0 +1,284 @@
+# Système de musique (décodage en arrière-plan, lecture en flux, fondus)
+import io
+import os
+import base64
+import binascii
+import hashlib
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from config.constants import *
+
+
+def _sniff_format(raw):
+    """Extension du format audio reconnu à sa signature, ou None"""
+    if raw[:4] == b"OggS":
+        return ".ogg"
+    if raw[:4] == b"RIFF" and raw[8:12] == b"WAVE":
+        return ".wav"
+    if raw[:4] == b"fLaC":
+        return ".flac"
+    if raw[:3] == b"ID3" or (len(raw) > 1 and raw[0] == 0xFF and raw[1] & 0xE0 == 0xE0):
+        return ".mp3"
+    return None
+
+
+def decode_payload(data):
+    """Décode et valide une musique base64 (éventuellement en data URI)
+
+    Args:
+        data: str - champ "data" d'une musique de niveau
+
+    Returns:
+        tuple: (octets, extension du format)
+
+    Raises:
+        ValueError: si le base64 est invalide ou le format non reconnu
+    """
+    if data.startswith("data:"):
+        data = data.partition(",")[2]
+    try:
+        raw = base64.b64decode(data)
+    except (binascii.Error, ValueError) as e:
+        raise ValueError(f"base64 invalide ({e})")
+    ext = _sniff_format(raw)
+    if ext is None:
+        raise ValueError("format audio non reconnu")
+    return raw, ext
+
+
+def _temp_path(raw, ext):
+    """Écrit raw dans le cache temporaire (nommé par empreinte) et retourne son chemin"""
+    directory = os.path.join(tempfile.gettempdir(), MUSIC_TEMP_DIR)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, hashlib.blake2b(raw, digest_size=16).hexdigest() + ext)
+    if not os.path.isfile(path):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(raw)
+        os.replace(tmp_path, path)
+    return path
+
+
+class SilentBackend:
+    """Sortie muette (mode headless, tests): mêmes appels, aucun son"""
+
+    def __init__(self):
+        self.playing = None  # Piste "en cours"
+        self.loops = 0
+
+    def load(self, raw, ext):
+        return {"format": ext, "bytes": len(raw)}
+
+    def nbytes(self, track):
+        return track["bytes"]
+
+    def play(self, track, loops, fade_ms):
+        self.playing = track
+        self.loops = loops
+
+    def stop(self, fade_ms):
+        self.playing = None
+
+    def update(self):
+        pass
+
+
+class MixerBackend:
+    """Sortie pygame.mixer.music: la piste en cours est lue en flux
+
+    Une piste est gardée sous sa forme compressée (octets validés par le
+    thread de décodage): SDL_mixer la décode au fil de la lecture, depuis
+    un tampon en mémoire ou, pour les formats qui exigent un fichier nommé,
+    depuis le cache temporaire indexé par contenu. Aucune piste n'est donc
+    jamais entièrement décodée en PCM (une piste stéréo de 4 minutes en
+    occuperait environ 40 Mo).
+
+    SDL_mixer ne lit qu'un flux de musique à la fois: un changement de
+    piste est un fondu de sortie suivi d'un fondu d'entrée (chacun la moitié
+    de fade_ms), sans superposition. update() démarre la piste suivante
+    quand le fondu de sortie est terminé, sans jamais bloquer.
+
+    Raises:
+        pygame.error: si aucun périphérique audio n'est disponible
+    """
+
+    def __init__(self):
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        self.stream = None  # Tampon lu par SDL_mixer (gardé en vie pendant la lecture)
+        self.queued = None  # (piste, loops, fade_ms) à démarrer après le fondu de sortie
+
+    def load(self, raw, ext):
+        return raw, ext
+
+    def nbytes(self, track):
+        return len(track[0])
+
+    def play(self, track, loops, fade_ms):
+        if fade_ms and pygame.mixer.music.get_busy():
+            pygame.mixer.music.fadeout(fade_ms // 2)
+            self.queued = (track, loops, fade_ms // 2)
+        else:
+            self.queued = None
+            self._start(track, loops, fade_ms)
+
+    def stop(self, fade_ms):
+        self.queued = None
+        if fade_ms:
+            pygame.mixer.music.fadeout(fade_ms)
+        else:
+            pygame.mixer.music.stop()
+
+    def update(self):
+        if self.queued is not None and not pygame.mixer.music.get_busy():
+            track, loops, fade_ms = self.queued
+            self.queued = None
+            self._start(track, loops, fade_ms)
+
+    def _start(self, track, loops, fade_ms):
+        """Charge et démarre une piste (un flux illisible est signalé puis ignoré)"""
+        raw, ext = track
+        try:
+            try:
+                stream = io.BytesIO(raw)
+                pygame.mixer.music.load(stream, ext[1:])
+            except pygame.error:
+                # Certains formats ne se lisent que depuis un fichier nommé
+                stream = None
+                pygame.mixer.music.load(_temp_path(raw, ext))
+            pygame.mixer.music.play(loops=loops, fade_ms=fade_ms)
+        except (pygame.error, OSError) as e:
+            print(f"Musique illisible ({e})")
+            return
+        self.stream = stream
+
+
+class MusicSystem:
+    """Musique des niveaux
+
+    load_music_from_data() confie le décodage base64 et la validation du
+    format à un thread: la boucle principale ne bloque jamais. play()
+    démarre la piste dès qu'elle est prête (au plus tard au prochain
+    update(), appelé à chaque image), avec un fondu depuis la précédente.
+
+    Les pistes prêtes (audio compressé, lu en flux par le backend) sont
+    gardées dans un cache LRU borné en mémoire, indexé par le contenu:
+    revenir à un niveau déjà joué ne décode rien, et redemander la piste en
+    cours ne la redémarre pas.
+    """
+
+    def __init__(self, backend=None, crossfade_ms=MUSIC_CROSSFADE_MS, cache_budget=MUSIC_CACHE_BUDGET):
+        if backend is None:
+            try:
+                backend = MixerBackend()
+            except pygame.error as e:
+                print(f"Audio indisponible ({e}): musique désactivée")
+                backend = SilentBackend()
+        self.backend = backend
+        self.crossfade_ms = crossfade_ms
+        self.cache_budget = cache_budget
+        self.tracks = OrderedDict()  # clé -> (piste prête, taille)
+        self.cache_bytes = 0
+        self.pending = {}  # clé -> (Future, nom) des décodages en cours
+        self.failed = set()  # Clés des musiques invalides
+        self.requested = None  # Clé de la dernière piste chargée
+        self.loops = -1
+        self.play_requested = False
+        self.current = None  # Clé de la piste en cours
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="musique")
+
+    @staticmethod
+    def _key(data):
+        # Le hash d'une str est mémorisé par l'objet: la clé d'une musique de
+        # plusieurs Mo ne coûte qu'une fois (les niveaux préparés sont partagés)
+        return len(data), hash(data)
+
+    def _decode(self, data):
+        """Exécuté par le thread de décodage"""
+        raw, ext = decode_payload(data)
+        return self.backend.load(raw, ext)
+
+    def preload(self, music_info):
+        """Lance le décodage d'une musique sans la sélectionner
+
+        Returns:
+            clé de la piste, ou None si elle est vide ou connue comme invalide
+        """
+        data = music_info.get("data", "")
+        if not isinstance(data, str) or not data:
+            return None
+        key = self._key(data)
+        if key in self.failed:
+            return None
+        if key not in self.tracks and key not in self.pending:
+            future = self.executor.submit(self._decode, data)
+            self.pending[key] = (future, music_info.get("name", ""))
+        return key
+
+    def load_music_from_data(self, music_info):
+        """Charge une musique de niveau ({"name", "type", "data"} en base64)
+
+        Returns:
+            bool: True si la piste est prête ou en cours de décodage, False
+                  si elle est vide ou déjà connue comme invalide
+        """
+        key = self.preload(music_info)
+        if key is None:
+            return False
+        self.requested = key
+        self.play_requested = False
+        return True
+
+    def play(self, loops=-1):
+        """Joue la dernière piste chargée (loops=-1: en boucle)"""
+        self.loops = loops
+        self.play_requested = True
+        self.update()
+
+    def stop(self):
+        """Arrête la musique (en fondu)"""
+        self.play_requested = False
+        if self.current is not None:
+            self.backend.stop(self.crossfade_ms)
+            self.current = None
+
+    def update(self):
+        """Récupère les décodages terminés et démarre la piste demandée"""
+        self.backend.update()
+        for key, (future, name) in list(self.pending.items()):
+            if not future.done():
+                continue
+            del self.pending[key]
+            try:
+                self._store(key, future.result())
+            except (ValueError, OSError, pygame.error) as e:
+                self.failed.add(key)
+                print(f"Musique invalide: {name} ({e})")
+
+        if not self.play_requested:
+            return
+        key = self.requested
+        if key in self.failed:
+            self.play_requested = False
+        elif key in self.tracks:
+            self.tracks.move_to_end(key)
+            if key != self.current:
+                self.backend.play(self.tracks[key][0], self.loops, self.crossfade_ms)
+                self.current = key
+            self.play_requested = False
+
+    def _store(self, key, track):
+        """Ajoute une piste prête et applique le budget mémoire"""
+        size = self.backend.nbytes(track)
+        self.tracks[key] = (track, size)
+        self.cache_bytes += size
+        while self.cache_bytes > self.cache_budget and len(self.tracks) > 1:
+            _, (_, evicted_size) = self.tracks.popitem(last=False)
+            self.cache_bytes -= evicted_size
+
+    def close(self):
+        """Arrête la musique et le thread de décodage"""
+        self.stop()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -2,6 +2,8 @@
 import json
 import os
 import pygame
+from game.metrics import METRICS
+from rendering.text_cache import TEXT_CACHE
 
 def _normalize_key(value):
     """Normalise une clé pour le tutoriel"""
@@ -100,6 +102,7 @@ class TutorialSystem:
         self.index = 0
         self.button_rect = None
         self.image_cache = {}
+        self.wrap_cache = {}  # (texte, police, largeur) -> lignes
     
     def select_tutorial_for_level(self, level):
         """Sélectionne le tutoriel approprié pour le niveau"""
@@ -156,8 +159,14 @@ class TutorialSystem:
         self.index = max(0, self.index)
     
     def _wrap_text_lines(self, text, font, max_width):
-        """Divise le texte en lignes selon la largeur maximale"""
+        """Divise le texte en lignes selon la largeur maximale (résultat mémorisé)"""
+        key = (text, font, max_width)
+        cached = self.wrap_cache.get(key)
+        if cached is not None:
+            return cached
+        
         lines = []
+        self.wrap_cache[key] = lines
         if not text:
             return lines
         
@@ -219,6 +228,7 @@ class TutorialSystem:
         self.button_rect = panel_rect.copy()
         
         panel_surface = pygame.Surface((panel_rect.width, panel_rect.height), pygame.SRCALPHA)
+        METRICS.add("surfaces.tutorial_panel")
         panel_surface.fill((12, 23, 42, 220))
         pygame.draw.rect(panel_surface, (56, 130, 203, 220), panel_surface.get_rect(), 3, border_radius=18)
         
@@ -238,16 +248,16 @@ class TutorialSystem:
         text_color = (235, 245, 255)
         
         for line in wrapped_lines:
-            line_surf = small_font.render(line, True, text_color)
+            line_surf = TEXT_CACHE.render(small_font, line, True, text_color)
             panel_surface.blit(line_surf, (text_x, text_y))
             text_y += line_surf.get_height() + 6
         
         progress_text = f"{self.index + 1}/{len(self.current_texts)}"
-        progress_surf = small_font.render(progress_text, True, (180, 210, 255))
+        progress_surf = TEXT_CACHE.render(small_font, progress_text, True, (180, 210, 255))
         panel_surface.blit(progress_surf, (text_x, panel_rect.height - content_padding - progress_surf.get_height()))
         
         hint_text = "Cliquez pour continuer"
-        hint_surf = small_font.render(hint_text, True, (120, 180, 255))
+        hint_surf = TEXT_CACHE.render(small_font, hint_text, True, (120, 180, 255))
         hint_pos_x = panel_rect.width - content_padding - hint_surf.get_width() - (image_width + 24 if image_surface else 0)
         panel_surface.blit(hint_surf, (max(text_x, hint_pos_x), panel_rect.height - content_padding - hint_surf.get_height()))
         
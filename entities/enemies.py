@@ -2,10 +2,16 @@
 import pygame
 import math
 import random
-from copy import deepcopy
+import numpy as np
 from config.constants import *
 from config.colors import *
 
+# Encodage des cellules (cx, cy) du hachage spatial en une clé entière unique
+_CELL_KEY_OFFSET = 1 << 20
+_CELL_KEY_STRIDE = 1 << 21
+_NEIGHBOR_DX = np.array([-1, -1, -1, 0, 0, 0, 1, 1, 1], dtype=np.int64)
+_NEIGHBOR_DY = np.array([-1, 0, 1, -1, 0, 1, -1, 0, 1], dtype=np.int64)
+
 def _canonical_monster_type(raw_type):
     """Normalise le type d'ennemi"""
     if not raw_type:
@@ -18,30 +24,35 @@ def _canonical_monster_type(raw_type):
     return "basic"
 
 def create_monster_from_config(config, template_id=None):
-    """Crée un ennemi depuis une configuration"""
-    cfg = deepcopy(config)
-    m_type = _canonical_monster_type(cfg.get("type"))
+    """Crée un ennemi depuis une configuration
+
+    La configuration n'est que lue (elle peut être un modèle partagé en
+    lecture seule, voir core.level_compiler): seul l'ennemi créé est modifié
+    ensuite.
+    """
+    m_type = _canonical_monster_type(config.get("type"))
     defaults = MONSTER_TYPE_DEFAULTS[m_type]
 
-    x = float(cfg.get("x", 0))
-    y = float(cfg.get("y", 0))
-    width = cfg.get("w") or cfg.get("width")
-    height = cfg.get("h") or cfg.get("height")
+    x = float(config.get("x", 0))
+    y = float(config.get("y", 0))
+    width = config.get("w") or config.get("width")
+    height = config.get("h") or config.get("height")
 
-    radius = cfg.get("radius")
+    radius = config.get("radius")
     if radius is None:
         if width and height:
             radius = max(width, height) / 2
         else:
             radius = defaults["radius"]
 
-    speed = cfg.get("speed", defaults["speed"])
-    hp = int(cfg.get("hp", defaults["hp"]))
-    dir_val = cfg.get("dir", defaults["dir"])
+    speed = config.get("speed", defaults["speed"])
+    hp = int(config.get("hp", defaults["hp"]))
+    dir_val = config.get("dir", defaults["dir"])
     direction = -1 if float(dir_val) < 0 else 1
 
     monster = {
         "pos": pygame.Vector2(x, y),
+        "prev_pos": pygame.Vector2(x, y),  # Position au pas précédent (rendu)
         "dir": direction,
         "type": m_type,
         "radius": radius,
@@ -51,22 +62,26 @@ def create_monster_from_config(config, template_id=None):
     }
 
     if m_type == "flyer":
-        monster["fly_phase"] = float(cfg.get("fly_phase", 0.0))
-        monster["base_y"] = float(cfg.get("base_y", y))
+        monster["fly_phase"] = float(config.get("fly_phase", 0.0))
+        monster["base_y"] = float(config.get("base_y", y))
     else:
-        monster["vel_y"] = float(cfg.get("vel_y", 0.0))
+        monster["vel_y"] = float(config.get("vel_y", 0.0))
 
     if template_id is not None:
         monster["template_id"] = template_id
 
     return monster
 
-def spawn_random_monster():
-    """Crée un ennemi aléatoire"""
-    x = random.randint(100, 2500)
+def spawn_random_monster(rng=random):
+    """Crée un ennemi aléatoire
+    
+    Args:
+        rng: générateur (random.Random ou module random) - seedable pour les simulations
+    """
+    x = rng.randint(100, 2500)
     
     # Types: tank (gros/lent), fast (petit/rapide), flyer (vole)
-    r = random.random()
+    r = rng.random()
     if r < 0.3:
         m_type = "tank"
         radius = 32
@@ -86,13 +101,14 @@ def spawn_random_monster():
         radius = 22
         speed = 110
         hp = 1
-        base_y = random.randint(GROUND_Y - 280, GROUND_Y - 140)
+        base_y = rng.randint(GROUND_Y - 280, GROUND_Y - 140)
         y = base_y
-        extra = {"fly_phase": random.uniform(0, 6.28), "base_y": base_y}
+        extra = {"fly_phase": rng.uniform(0, 6.28), "base_y": base_y}
 
     data = {
         "pos": pygame.Vector2(x, y),
-        "dir": random.choice([-1, 1]),
+        "prev_pos": pygame.Vector2(x, y),  # Position au pas précédent (rendu)
+        "dir": rng.choice([-1, 1]),
         "type": m_type,
         "radius": radius,
         "speed": speed,
@@ -105,7 +121,8 @@ def spawn_random_monster():
 class EnemySystem:
     """Système de gestion des ennemis"""
     
-    def __init__(self):
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random
         self.monsters = []
         self.level_enemy_configs = []
         self.current_monster_cap = MAX_MONSTERS
@@ -118,8 +135,17 @@ class EnemySystem:
         self.current_monster_cap = 0
         self.monster_spawn_timer = 0.0
     
-    def update(self, dt, platforms, ground_y):
-        """Met à jour tous les ennemis"""
+    def save_previous(self):
+        """Mémorise les positions avant un pas de simulation"""
+        for monster in self.monsters:
+            monster["prev_pos"].update(monster["pos"])
+    
+    def update(self, dt, platforms, ground_y, platform_index=None):
+        """Met à jour tous les ennemis
+        
+        Si un index spatial (PlatformGrid) est fourni, seules les plateformes
+        proches de chaque ennemi sont testées.
+        """
         for monster in self.monsters:
             # Mouvement horizontal
             monster["pos"].x += monster["dir"] * monster["speed"] * dt
@@ -148,7 +174,11 @@ class EnemySystem:
                     monster_rect = pygame.Rect(int(monster["pos"].x - monster["radius"]),
                                                int(monster["pos"].y - monster["radius"]),
                                                monster["radius"]*2, monster["radius"]*2)
-                    for plat in platforms:
+                    if platform_index is not None:
+                        nearby = platform_index.query_rects(monster_rect)
+                    else:
+                        nearby = platforms
+                    for plat in nearby:
                         if monster_rect.colliderect(plat):
                             plat_top = plat.top
                             if feet_y - monster["vel_y"] * dt <= plat_top + 2:
@@ -160,24 +190,100 @@ class EnemySystem:
             if monster["hit_flash"] > 0:
                 monster["hit_flash"] -= dt
     
+    def collect_projectile_hits(self, projectiles):
+        """Détecte toutes les touches projectiles-ennemis de l'image
+        
+        Broadphase: hachage spatial reconstruit à chaque appel. Les projectiles
+        sont triés par clé de cellule, puis chaque ennemi récupère ceux des 9
+        cellules voisines de la sienne (cellule >= portée max, donc aucune
+        touche manquée). Narrowphase: distance au carré, vectorisée sur toutes
+        les paires candidates. Seules les touches réelles sont ensuite
+        résolues une à une, dans l'ordre (projectile, ennemi) du double
+        parcours d'origine. Les suppressions sont différées: un seul compact()
+        des projectiles et une seule passe sur la liste des ennemis.
+        
+        Args:
+            projectiles: ProjectileSystem
+        
+        Returns:
+            list: événements {"pos", "type", "killed", "score"} dans l'ordre des touches
+        """
+        events = []
+        positions = projectiles.positions()
+        monsters = self.monsters
+        if not monsters or len(positions) == 0:
+            return events
+        
+        monster_pos = np.array([(m["pos"].x, m["pos"].y) for m in monsters], dtype=np.float64)
+        reach = np.array([m["radius"] for m in monsters], dtype=np.float64) + projectile_radius
+        size = max(float(PROJECTILE_HASH_CELL_SIZE), float(reach.max()))
+        
+        # Projectiles triés par cellule
+        proj_cells = np.floor(positions / size).astype(np.int64) + _CELL_KEY_OFFSET
+        proj_keys = proj_cells[:, 0] * _CELL_KEY_STRIDE + proj_cells[:, 1]
+        order = np.argsort(proj_keys, kind="stable")
+        sorted_keys = proj_keys[order]
+        
+        # Cellules voisines de chaque ennemi -> plages de projectiles candidats
+        monster_cells = np.floor(monster_pos / size).astype(np.int64) + _CELL_KEY_OFFSET
+        query_keys = ((monster_cells[:, 0, None] + _NEIGHBOR_DX) * _CELL_KEY_STRIDE
+                      + monster_cells[:, 1, None] + _NEIGHBOR_DY).ravel()
+        lo = np.searchsorted(sorted_keys, query_keys, side="left")
+        counts = np.searchsorted(sorted_keys, query_keys, side="right") - lo
+        total = int(counts.sum())
+        if total == 0:
+            return events
+        
+        # Expansion des paires (projectile, ennemi)
+        pair_monster = np.repeat(np.arange(len(monsters)).repeat(len(_NEIGHBOR_DX)), counts)
+        run_starts = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+        pair_proj = order[run_starts + np.arange(total)]
+        
+        delta = positions[pair_proj] - monster_pos[pair_monster]
+        hits = (delta * delta).sum(axis=1) < reach[pair_monster] ** 2
+        hit_proj = pair_proj[hits]
+        hit_monster = pair_monster[hits]
+        sort = np.lexsort((hit_monster, hit_proj))
+        
+        killed = set()
+        consumed = set()
+        for i, j in zip(hit_proj[sort].tolist(), hit_monster[sort].tolist()):
+            if i in consumed or j in killed:
+                continue
+            monster = monsters[j]
+            monster["hp"] -= 1
+            monster["hit_flash"] = 0.2
+            dead = monster["hp"] <= 0
+            if dead:
+                killed.add(j)
+            events.append({
+                "pos": monster["pos"].copy(),
+                "type": monster["type"],
+                "killed": dead,
+                "score": (2 if monster["type"] == "tank" else 1) if dead else 0,
+            })
+            consumed.add(i)
+            projectiles.kill(i)
+        
+        projectiles.compact()
+        if killed:
+            self.monsters = [m for j, m in enumerate(monsters) if j not in killed]
+        return events
+    
     def check_projectile_collision(self, projectiles, particles_system):
-        """Vérifie les collisions projectiles-ennemis"""
-        score = 0
-        for proj in projectiles[:]:
-            for monster in self.monsters[:]:
-                if proj["pos"].distance_to(monster["pos"]) < projectile_radius + monster["radius"]:
-                    monster["hp"] -= 1
-                    monster["hit_flash"] = 0.2
-                    
-                    if monster["hp"] <= 0:
-                        particles_system.create_particles(monster["pos"], PARTICLE_COLORS["explosion"], 12)
-                        self.monsters.remove(monster)
-                        score += 2 if monster["type"] == "tank" else 1
-                    
-                    if proj in projectiles:
-                        projectiles.remove(proj)
-                    break
-        return score
+        """Vérifie les collisions projectiles-ennemis
+        
+        Args:
+            projectiles: ProjectileSystem - les projectiles touchés sont retirés
+            particles_system: ParticleSystem - pour les explosions
+        
+        Returns:
+            int: score gagné
+        """
+        events = self.collect_projectile_hits(projectiles)
+        # Explosions des ennemis détruits, émises en un seul lot
+        particles_system.create_bursts([(e["pos"], PARTICLE_COLORS["explosion"], 12) for e in events if e["killed"]])
+        return sum(e["score"] for e in events)
     
     def check_player_collision(self, player_rect, particles_system):
         """Vérifie les collisions joueur-ennemis"""
@@ -204,7 +310,7 @@ class EnemySystem:
                 spawned = True
         else:
             if len(self.monsters) < self.current_monster_cap:
-                self.monsters.append(spawn_random_monster())
+                self.monsters.append(spawn_random_monster(self.rng))
                 spawned = True
         
         return spawned
@@ -1,41 +1,121 @@
 # Particules
-import pygame
 import math
-import random
+import numpy as np
 from config.constants import *
 from config.colors import *
 
 class ParticleSystem:
-    """Système de gestion des particules"""
-    
-    def __init__(self):
-        self.particles = []
-    
+    """Système de gestion des particules
+
+    Stockage préalloué en tampon circulaire NumPy de capacité fixe
+    (PARTICLE_CAPACITY): positions, vitesses, couleurs et durée de vie,
+    plus les positions du pas précédent (interpolation du rendu).
+    - Les nouvelles particules sont écrites à partir de head; toutes les
+      particules vivant le même temps, l'emplacement sous head est toujours
+      le plus ancien: quand le tampon est plein, ce sont les plus vieilles
+      particules qui sont remplacées
+    - Pour la même raison, les particules vivantes sont toujours les live
+      dernières écrites avant head: l'émission, la gravité et la décroissance
+      de vie sont vectorisées sur cette seule plage (au plus deux tranches
+      contiguës). Le coût par image est borné par la capacité, quel que soit
+      le nombre d'explosions simultanées, et nul sans particule vivante
+    """
+
+    def __init__(self, capacity=PARTICLE_CAPACITY, rng=None):
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)
+        self.prev = np.zeros((capacity, 2), dtype=np.float64)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.life = np.zeros(capacity, dtype=np.float64)
+        self.head = 0
+        self.live = 0  # Nombre de particules vivantes (les dernières écrites)
+        self.rng = rng if rng is not None else np.random.default_rng()
+
     def create_particles(self, pos, color, count=8):
         """Crée des particules d'explosion"""
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 150)
-            self.particles.append({
-                "pos": pygame.Vector2(pos),
-                "vel": pygame.Vector2(math.cos(angle) * speed, math.sin(angle) * speed),
-                "color": color,
-                "life": 1.0
-            })
-    
+        self.create_bursts([(pos, color, count)])
+
+    def create_bursts(self, bursts):
+        """Crée plusieurs gerbes de particules en une seule écriture
+
+        Args:
+            bursts: liste de (pos, color, count)
+        """
+        bursts = [(pos, color, count) for pos, color, count in bursts if count > 0]
+        if not bursts:
+            return
+        counts = np.array([count for _, _, count in bursts])
+        origins = np.repeat(np.array([(pos[0], pos[1]) for pos, _, _ in bursts], dtype=np.float64), counts, axis=0)
+        colors = np.repeat(np.array([color[:3] for _, color, _ in bursts], dtype=np.uint8), counts, axis=0)
+
+        # Au-delà de la capacité, seules les dernières particules émises comptent
+        total = len(origins)
+        if total > self.capacity:
+            origins = origins[-self.capacity:]
+            colors = colors[-self.capacity:]
+            total = self.capacity
+
+        angle = self.rng.uniform(0, 2 * math.pi, total)
+        speed = self.rng.uniform(50, 150, total)
+        slots = (self.head + np.arange(total)) % self.capacity
+
+        self.pos[slots] = origins
+        self.prev[slots] = origins
+        self.vel[slots, 0] = np.cos(angle) * speed
+        self.vel[slots, 1] = np.sin(angle) * speed
+        self.color[slots] = colors
+        self.life[slots] = 1.0
+        self.head = (self.head + total) % self.capacity
+        self.live = min(self.capacity, self.live + total)
+
+    def _live_slices(self):
+        """Tranches du tampon occupées par les particules vivantes, de la plus ancienne à la plus récente"""
+        start = self.head - self.live
+        if start >= 0:
+            return [slice(start, self.head)] if self.live else []
+        return [slice(start + self.capacity, self.capacity), slice(0, self.head)]
+
     def update(self, dt):
-        """Met à jour toutes les particules"""
-        for part in self.particles[:]:
-            part["pos"] += part["vel"] * dt
-            part["vel"].y += GRAVITY * 0.5 * dt
-            part["life"] -= dt * 2
-            if part["life"] <= 0:
-                self.particles.remove(part)
-    
+        """Met à jour les particules vivantes"""
+        if self.live == 0:
+            return
+        dead = 0
+        for s in self._live_slices():
+            self.pos[s] += self.vel[s] * dt
+            self.vel[s, 1] += GRAVITY * 0.5 * dt
+            life = self.life[s]
+            life -= dt * 2
+            np.maximum(life, 0.0, out=life)
+            dead += int(np.count_nonzero(life == 0.0))
+        # Les mortes sont toujours les plus anciennes: la plage se raccourcit
+        self.live -= dead
+
+    def save_previous(self):
+        """Mémorise les positions avant un pas de simulation"""
+        for s in self._live_slices():
+            self.prev[s] = self.pos[s]
+
+    def alive(self, alpha=1.0):
+        """Retourne (positions, couleurs, vies) des particules vivantes
+
+        Args:
+            alpha: float - positions interpolées entre le pas précédent (0)
+                   et le pas courant (1)
+        """
+        idx = np.arange(self.head - self.live, self.head) % self.capacity
+        pos = self.pos[idx]
+        if alpha < 1.0:
+            prev = self.prev[idx]
+            pos = prev + (pos - prev) * alpha
+        return pos, self.color[idx], self.life[idx]
+
     def clear(self):
         """Supprime toutes les particules"""
-        self.particles = []
-    
+        self.life[:] = 0.0
+        self.head = 0
+        self.live = 0
+
     def get_count(self):
         """Retourne le nombre de particules"""
-        return len(self.particles)
+        return self.live
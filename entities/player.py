@@ -4,11 +4,14 @@ import math
 import random
 from config.constants import *
 from config.colors import *
+from game.controller import CharacterController
+from game.metrics import METRICS
 
 class Player:
     """Classe représentant le joueur"""
     
-    def __init__(self, x, y):
+    def __init__(self, x, y, rng=None):
+        self.rng = rng if rng is not None else random
         self.pos = pygame.Vector2(x, y)
         self.vel_y = 0
         self.direction = 1
@@ -26,15 +29,16 @@ class Player:
         self.dash_timer = 0.0
         self.dash_direction = 1
         self.on_ground = False
+        self.controller = CharacterController(head_radius * 2, head_radius * 2 + body_height + leg_height)
     
-    def update(self, dt, keys, platforms, platform_types, ground_y, ground_start_x, ground_end_x):
+    def update(self, dt, keys, platforms, platform_types, ground_y, ground_start_x, ground_end_x, platform_index=None):
         """Met à jour l'état du joueur à chaque frame
         
         Gère tous les aspects du joueur:
         - Mouvements horizontaux (Q/D, flèches)
         - Sauts simples et doubles avec gestion de la stamina
         - Dash avec cooldown et consommation de stamina
-        - Gravité et collisions
+        - Gravité et collisions (contrôleur balayé, sous-pas si dt est grand)
         - Régénération de stamina avec délais
         - Animations (cycle de marche, clignements, recul de tir)
         
@@ -44,18 +48,20 @@ class Player:
             platforms: list - liste des plateformes
             platform_types: list - types des plateformes
             ground_y, ground_start_x, ground_end_x: paramètres du sol
+            platform_index: PlatformGrid ou None - index spatial des plateformes
         
         Returns:
             bool: True si le joueur est en mouvement, False sinon
         """
-        # Mouvements horizontaux
+        # Mouvements horizontaux (vitesse souhaitée, appliquée par le contrôleur)
         moving = False
+        move_x = 0
         if keys[pygame.K_q] or keys[pygame.K_LEFT]:
-            self.pos.x -= MOVE_SPEED * dt
+            move_x -= MOVE_SPEED
             self.direction = -1
             moving = True
         if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            self.pos.x += MOVE_SPEED * dt
+            move_x += MOVE_SPEED
             self.direction = 1
             moving = True
         
@@ -65,7 +71,7 @@ class Player:
             self.walk_cycle = 0
         
         # Détection sol/plateforme
-        self.on_ground = self._check_ground_collision(platforms, platform_types, ground_y, ground_start_x, ground_end_x)
+        self.on_ground = self._check_ground_collision(platforms, platform_types, ground_y, ground_start_x, ground_end_x, platform_index)
         
         # Saut
         space_pressed = keys[pygame.K_SPACE]
@@ -104,21 +110,23 @@ class Player:
         self.jump_was_pressed = space_pressed
         self.dash_was_pressed = dash_pressed
         
-        # Gravité
-        self.vel_y += GRAVITY * dt
-        self.pos.y += self.vel_y * dt
-        
-        # Collisions avec les plateformes
-        self._handle_platform_collisions(platforms, platform_types)
+        # Gravité, déplacement et collisions (sol, plateformes et blocs)
+        # Un grand dt (chargement, pause GC) est découpé en sous-pas pour garder
+        # une intégration stable; le balayage empêche de traverser les solides
+        self.controller.set_level(platforms, platform_types, platform_index, ground_y, ground_start_x, ground_end_x)
+        steps = max(1, math.ceil(dt / PHYSICS_MAX_SUBSTEP_DT))
+        step_dt = dt / steps
+        for _ in range(steps):
+            self.vel_y += GRAVITY * step_dt
+            dx = move_x * step_dt
+            if self.dash_timer > 0:
+                dx += self.dash_direction * DASH_SPEED * step_dt
+                self.dash_timer = max(0.0, self.dash_timer - step_dt)
+            self._move(dx, self.vel_y * step_dt)
         
         # Limites
         self.pos.x = max(head_radius, self.pos.x)
         
-        # Dash
-        if self.dash_timer > 0:
-            self.pos.x += self.dash_direction * DASH_SPEED * dt
-            self.dash_timer = max(0.0, self.dash_timer - dt)
-        
         # Gestion de la stamina avec système de régénération par paliers
         # La stamina ne se régénère qu'après un délai d'inactivité (STAMINA_REGEN_DELAY)
         self.stamina_idle_timer += dt
@@ -140,7 +148,7 @@ class Player:
         self.blink_timer -= dt
         if self.blink_timer <= 0 and self.blink_close <= 0:
             self.blink_close = 0.12
-            self.blink_timer = random.uniform(2.0, 5.0)
+            self.blink_timer = self.rng.uniform(2.0, 5.0)
         if self.blink_close > 0:
             self.blink_close -= dt
         if self.shoot_recoil > 0:
@@ -148,18 +156,33 @@ class Player:
         
         return moving
     
-    def _check_ground_collision(self, platforms, platform_types, ground_y, ground_start_x, ground_end_x):
+    def _nearby_platforms(self, platforms, platform_types, platform_index, rect, ptype='platform'):
+        """Retourne les indices des plateformes d'un type proches d'une zone
+        
+        Interroge l'index spatial si disponible, sinon parcourt tout le niveau.
+        """
+        if platform_index is not None:
+            nearby = platform_index.query(rect, ptype)
+        else:
+            nearby = [i for i in range(min(len(platforms), len(platform_types))) if platform_types[i] == ptype]
+        if METRICS.enabled:
+            # Candidats testés par _check_ground_collision (moins si atterrissage)
+            METRICS.add("rect_tests.ground_check", len(nearby))
+        return nearby
+    
+    def _check_ground_collision(self, platforms, platform_types, ground_y, ground_start_x, ground_end_x, platform_index=None):
         """Vérifie si le joueur est au sol et gère l'atterrissage
         
         Logique complexe de détection du sol:
         1. Vérifie d'abord le sol infini (limité en X)
-        2. Ensuite vérifie les plateformes semi-solides
+        2. Ensuite vérifie les plateformes semi-solides et le dessus des blocs
         3. Ajuste la position et la vélocité si atterrissage
         
         Args:
             platforms: list - rectangles des plateformes
             platform_types: list - types des plateformes
             ground_y, ground_start_x, ground_end_x: paramètres du sol
+            platform_index: PlatformGrid ou None - index spatial des plateformes
         
         Returns:
             bool: True si le joueur est au sol, False sinon
@@ -179,56 +202,45 @@ class Player:
         
         # Vérification des plateformes (seulement celles de type 'platform')
         # Les plateformes ont une zone de détection élargie de 5px pour faciliter l'atterrissage
-        for i, plat in enumerate(platforms):
-            if i < len(platform_types) and platform_types[i] == 'platform':
-                # Vérifie si le joueur est dans la zone X de la plateforme et proche verticalement
-                if plat.left - 5 < self.pos.x < plat.right + 5 and abs(feet_y - plat.top) <= 6:
-                    # Ajuste la position pour que les pieds touchent exactement le haut de la plateforme
-                    self.pos.y = plat.top - (head_radius + body_height + leg_height)
-                    self.vel_y = 0
-                    return True
+        probe = (self.pos.x - 6, feet_y - 7, 12, 14)
+        for i in self._nearby_platforms(platforms, platform_types, platform_index, probe):
+            plat = platforms[i]
+            # Vérifie si le joueur est dans la zone X de la plateforme et proche verticalement
+            if plat.left - 5 < self.pos.x < plat.right + 5 and abs(feet_y - plat.top) <= 6:
+                # Ajuste la position pour que les pieds touchent exactement le haut de la plateforme
+                self.pos.y = plat.top - (head_radius + body_height + leg_height)
+                self.vel_y = 0
+                return True
+        
+        # Dessus des blocs: le joueur doit chevaucher le bloc horizontalement
+        probe = (self.pos.x - head_radius, feet_y - 7, head_radius * 2, 14)
+        for i in self._nearby_platforms(platforms, platform_types, platform_index, probe, 'block'):
+            block = platforms[i]
+            if block.left < self.pos.x + head_radius and block.right > self.pos.x - head_radius and abs(feet_y - block.top) <= 6:
+                self.pos.y = block.top - (head_radius + body_height + leg_height)
+                self.vel_y = 0
+                return True
         
         return False
     
-    def _handle_platform_collisions(self, platforms, platform_types):
-        """Gère les collisions avec les plateformes pendant la chute
+    def _move(self, dx, dy):
+        """Déplace le joueur via le contrôleur et applique les contacts
         
-        Cette méthode est différente de _check_ground_collision:
-        - Elle ne gère que l'atterrissage sur les plateformes (pas le sol)
-        - Elle utilise une prédiction pour éviter les "téléportations"
-        - Elle ne s'active que si le joueur descend (vel_y >= 0)
+        - Atterrissage (sol, plateforme ou bloc): arrête la chute et rend le double saut
+        - Plafond (dessous d'un bloc): arrête la montée
         
         Args:
-            platforms: list - rectangles des plateformes
-            platform_types: list - types des plateformes
+            dx, dy: float - déplacement souhaité pour ce sous-pas
         """
-        # Crée le rectangle de collision complet du joueur
-        # Utilise la tête comme base et ajoute le corps et les jambes
-        player_rect = pygame.Rect(
-            self.pos.x - head_radius,
-            self.pos.y - head_radius,
-            head_radius * 2,
-            head_radius * 2 + body_height + leg_height
-        )
+        result = self.controller.move(self.pos.x - head_radius, self.pos.y - head_radius, dx, dy)
+        self.pos.x = result["left"] + head_radius
+        self.pos.y = result["top"] + head_radius
         
-        # Ne vérifie les collisions que si le joueur descend ou est stationnaire
-        # Évite les collisions lorsqu'on saute à travers une plateforme
-        if self.vel_y >= 0:
-            for i, plat in enumerate(platforms):
-                if i < len(platform_types) and platform_types[i] == 'platform':
-                    if player_rect.colliderect(plat):
-                        # Calcul de la position des pieds et du haut de la plateforme
-                        feet_y = self.pos.y + head_radius + body_height + leg_height
-                        plat_top = plat.top
-                        
-                        # Vérification critique: prédit où étaient les pieds à la frame précédente
-                        # Utilise dt approximatif (0.016s = 60 FPS) pour la prédiction
-                        # Évite que le joueur ne "téléporte" à travers une plateforme
-                        if feet_y - self.vel_y * 0.016 <= plat_top:
-                            # Atterrissage validé: ajuste position et arrête la chute
-                            self.pos.y = plat_top - (head_radius + body_height + leg_height)
-                            self.vel_y = 0
-                            break  # Une seule plateforme à la fois
+        if result["landed"]:
+            self.vel_y = 0
+            self.air_jumps_left = 1
+        elif result["hit_ceiling"]:
+            self.vel_y = 0
     
     def get_rect(self):
         """Retourne le rectangle de collision du joueur"""
@@ -1,34 +1,128 @@
 # Projectiles
-import pygame
+import numpy as np
 from config.constants import *
 
 class ProjectileSystem:
-    """Système de gestion des projectiles"""
-    
-    def __init__(self):
-        self.projectiles = []
-    
+    """Système de gestion des projectiles
+
+    Stockage en "structure de tableaux" NumPy plutôt qu'une liste de dicts:
+    - pos, vel: tableaux (capacité, 2) de positions/vitesses
+    - prev: positions au pas de simulation précédent (interpolation du rendu)
+    - alive: masque des projectiles encore actifs
+    - count: nombre de projectiles actifs (toujours rangés dans [0, count))
+
+    La mise à jour et le test de sortie d'écran sont vectorisés; les
+    projectiles supprimés sont marqués dans alive puis retirés en bloc par
+    compact() (échange avec le dernier élément, sans décalage de liste).
+    """
+
+    def __init__(self, capacity=PROJECTILE_INITIAL_CAPACITY):
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)
+        self.prev = np.zeros((capacity, 2), dtype=np.float64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.count = 0
+
+    def _grow(self):
+        """Double la capacité des tableaux"""
+        capacity = max(1, len(self.pos) * 2)
+        for name in ("pos", "vel", "prev", "alive"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
     def add_projectile(self, projectile_data):
-        """Ajoute un projectile"""
+        """Ajoute un projectile depuis un dict {pos, vel} (voir Player.shoot)"""
         if projectile_data:
-            self.projectiles.append(projectile_data)
-    
+            if self.count >= len(self.pos):
+                self._grow()
+            i = self.count
+            self.pos[i] = (projectile_data["pos"][0], projectile_data["pos"][1])
+            self.vel[i] = (projectile_data["vel"][0], projectile_data["vel"][1])
+            self.prev[i] = self.pos[i]
+            self.alive[i] = True
+            self.count += 1
+
     def update(self, dt, camera_offset):
         """Met à jour tous les projectiles"""
-        for proj in self.projectiles[:]:
-            proj["pos"] += proj["vel"] * dt
-            
-            # Supprime les projectiles trop éloignés de l'écran
-            if (proj["pos"].x < camera_offset.x - 200 or 
-                proj["pos"].x > camera_offset.x + SCREEN_WIDTH + 200 or
-                proj["pos"].y < camera_offset.y - 200 or 
-                proj["pos"].y > camera_offset.y + SCREEN_HEIGHT + 200):
-                self.projectiles.remove(proj)
-    
+        n = self.count
+        if n == 0:
+            return
+        pos = self.pos[:n]
+        pos += self.vel[:n] * dt
+
+        # Supprime les projectiles trop éloignés de l'écran
+        x = pos[:, 0]
+        y = pos[:, 1]
+        self.alive[:n] &= ((x >= camera_offset.x - 200) & (x <= camera_offset.x + SCREEN_WIDTH + 200) &
+                           (y >= camera_offset.y - 200) & (y <= camera_offset.y + SCREEN_HEIGHT + 200))
+        self.compact()
+
+    def save_previous(self):
+        """Mémorise les positions avant un pas de simulation"""
+        self.prev[:self.count] = self.pos[:self.count]
+
+    def interpolated_positions(self, alpha):
+        """Positions (count, 2) entre le pas précédent (alpha=0) et le pas courant (alpha=1)"""
+        n = self.count
+        if alpha >= 1.0:
+            return self.pos[:n]
+        prev = self.prev[:n]
+        return prev + (self.pos[:n] - prev) * alpha
+
+    def positions(self):
+        """Retourne la vue (count, 2) des positions des projectiles actifs
+
+        Les indices de cette vue sont ceux attendus par kill(); ils restent
+        valides jusqu'au prochain compact().
+        """
+        return self.pos[:self.count]
+
+    def velocities(self):
+        """Retourne la vue (count, 2) des vitesses des projectiles actifs"""
+        return self.vel[:self.count]
+
+    def kill(self, index):
+        """Marque un projectile comme détruit (retiré au prochain compact())"""
+        self.alive[index] = False
+
+    def compact(self):
+        """Retire les projectiles morts
+
+        Peu de morts: chaque mort est remplacé par le dernier projectile actif
+        (parcours des indices décroissants). Beaucoup de morts: recopie en bloc
+        des survivants via le masque.
+        """
+        n = self.count
+        dead = np.flatnonzero(~self.alive[:n])
+        if len(dead) == 0:
+            return
+        if len(dead) <= PROJECTILE_SWAP_REMOVE_MAX:
+            for i in dead[::-1].tolist():
+                last = self.count - 1
+                if i != last:
+                    self.pos[i] = self.pos[last]
+                    self.vel[i] = self.vel[last]
+                    self.prev[i] = self.prev[last]
+                self.alive[i] = True
+                self.alive[last] = False
+                self.count = last
+        else:
+            keep = self.alive[:n]
+            k = int(np.count_nonzero(keep))
+            self.pos[:k] = self.pos[:n][keep]
+            self.vel[:k] = self.vel[:n][keep]
+            self.prev[:k] = self.prev[:n][keep]
+            self.alive[:k] = True
+            self.alive[k:n] = False
+            self.count = k
+
     def clear(self):
         """Supprime tous les projectiles"""
-        self.projectiles = []
-    
+        self.alive[:self.count] = False
+        self.count = 0
+
     def get_count(self):
         """Retourne le nombre de projectiles"""
-        return len(self.projectiles)
+        return self.count
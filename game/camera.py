@@ -1,7 +1,24 @@
 # Caméra
+import math
 import pygame
 from config.constants import *
 
+
+def view_rect(camera_offset, size=(SCREEN_WIDTH, SCREEN_HEIGHT), margin=0):
+    """Zone du monde visible à l'écran pour un décalage de caméra
+    
+    Args:
+        camera_offset: pygame.Vector2 - décalage de la caméra (coin haut gauche)
+        size: (largeur, hauteur) - taille de la cible de rendu
+        margin: int - agrandissement de chaque côté (objets qui débordent)
+    
+    Returns:
+        pygame.Rect: zone monde (arrondie vers l'extérieur)
+    """
+    left = math.floor(camera_offset.x) - margin
+    top = math.floor(camera_offset.y) - margin
+    return pygame.Rect(left, top, size[0] + 2 * margin + 1, size[1] + 2 * margin + 1)
+
 class Camera:
     """Système de caméra avec effet de suivi fluide"""
     
@@ -9,13 +26,26 @@ class Camera:
         self.offset = pygame.Vector2(0, 0)
         self.lag = CAMERA_LAG
     
-    def update(self, target_pos):
-        """Met à jour la position de la caméra pour suivre une cible"""
+    def update(self, target_pos, dt=None):
+        """Met à jour la position de la caméra pour suivre une cible
+        
+        Le lissage CAMERA_LAG est défini pour une image à CAMERA_LAG_REFERENCE_FPS:
+        avec dt, il est converti en facteur exponentiel pour que le suivi soit
+        identique quelle que soit la fréquence de mise à jour.
+        
+        Args:
+            target_pos: pygame.Vector2 - position à suivre
+            dt: float ou None - durée du pas (None = facteur brut par appel)
+        """
         target_x = target_pos.x - SCREEN_WIDTH // 2
         target_y = target_pos.y - SCREEN_HEIGHT // 2
         
-        self.offset.x += (target_x - self.offset.x) * self.lag
-        self.offset.y += (target_y - self.offset.y) * self.lag
+        factor = self.lag
+        if dt is not None:
+            factor = 1.0 - (1.0 - self.lag) ** (dt * CAMERA_LAG_REFERENCE_FPS)
+        
+        self.offset.x += (target_x - self.offset.x) * factor
+        self.offset.y += (target_y - self.offset.y) * factor
     
     def set_position(self, x, y):
         """Définit directement la position de la caméra"""
@@ -29,3 +59,13 @@ class Camera:
     def screen_to_world(self, screen_pos):
         """Convertit les coordonnées d'écran en coordonnées du monde"""
         return pygame.Vector2(screen_pos[0] + self.offset.x, screen_pos[1] + self.offset.y)
+    
+    def visible_rect(self, margin=0, offset=None):
+        """Zone du monde visible (voir view_rect)
+        
+        Args:
+            margin: int - agrandissement de chaque côté
+            offset: pygame.Vector2 ou None - décalage de rendu (interpolé),
+                    par défaut celui de la caméra
+        """
+        return view_rect(self.offset if offset is None else offset, margin=margin)
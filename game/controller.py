@@ -0,0 +1,185 @@
+# Contrôleur de personnage (collisions balayées)
+import math
+from config.constants import *
+from game.metrics import METRICS
+
+class CharacterController:
+    """Déplace une boîte englobante (AABB) contre tous les solides du niveau
+
+    Un seul chemin de code pour le sol, les plateformes et les blocs:
+    - Le déplacement est balayé axe par axe (X puis Y): la boîte s'arrête au
+      premier obstacle rencontré sur sa trajectoire, quelle que soit la
+      distance parcourue, donc pas de traversée même avec un grand dt
+    - Les grands déplacements sont découpés en sous-pas d'au plus
+      CONTROLLER_MAX_STEP pixels pour que l'ordre X/Y reste fidèle dans les coins
+    - Les blocs ('block') sont pleins sur les 4 côtés
+    - Les plateformes ('platform') ne bloquent que par le dessus (traversables en sautant)
+    - Le sol est un demi-plan limité horizontalement à [start_x, end_x]
+    """
+
+    # Tolérance (pixels) pour considérer un contact comme "déjà au bord"
+    EPSILON = 0.01
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.platforms = []
+        self.platform_types = []
+        self.platform_index = None
+        self.ground_y = GROUND_Y
+        self.ground_start_x = GROUND_START_X
+        self.ground_end_x = GROUND_END_X
+
+    def set_level(self, platforms, platform_types, platform_index, ground_y, ground_start_x, ground_end_x):
+        """Définit la géométrie du niveau contre laquelle se déplacer"""
+        self.platforms = platforms
+        self.platform_types = platform_types
+        self.platform_index = platform_index
+        self.ground_y = ground_y
+        self.ground_start_x = ground_start_x
+        self.ground_end_x = ground_end_x
+
+    def _nearby(self, left, top, width, height, ptype):
+        """Retourne les rectangles d'un type proches d'une zone"""
+        platforms = self.platforms
+        if self.platform_index is not None:
+            nearby = [platforms[i] for i in self.platform_index.query((left, top, width, height), ptype)]
+        else:
+            types = self.platform_types
+            nearby = [plat for i, plat in enumerate(platforms) if i < len(types) and types[i] == ptype]
+        if METRICS.enabled:
+            # Chaque rectangle retourné est testé une fois par l'appelant
+            METRICS.add("rect_tests.controller", len(nearby))
+        return nearby
+
+    def depenetrate(self, left, top):
+        """Sort la boîte des blocs qu'elle chevauche (axe de moindre pénétration)
+
+        Returns:
+            tuple: (left, top) corrigés
+        """
+        w, h = self.width, self.height
+        for block in self._nearby(left, top, w, h, 'block'):
+            overlap_x = min(left + w, block.right) - max(left, block.left)
+            overlap_y = min(top + h, block.bottom) - max(top, block.top)
+            if overlap_x <= self.EPSILON or overlap_y <= self.EPSILON:
+                continue
+            if overlap_x < overlap_y:
+                # Pousse vers le côté le plus proche
+                left = block.left - w if left + w / 2 < block.centerx else block.right
+            else:
+                top = block.top - h if top + h / 2 < block.centery else block.bottom
+        return left, top
+
+    def _sweep_x(self, left, top, dx):
+        """Balaye la boîte horizontalement
+
+        Returns:
+            tuple: (dx autorisé, True si un bloc a arrêté le mouvement)
+        """
+        w, h = self.width, self.height
+        eps = self.EPSILON
+        hit = False
+        if dx > 0:
+            right = left + w
+            for block in self._nearby(right, top, dx, h, 'block'):
+                if block.top < top + h and block.bottom > top and block.left >= right - eps:
+                    gap = max(0.0, block.left - right)
+                    if gap < dx:
+                        dx = gap
+                        hit = True
+        elif dx < 0:
+            for block in self._nearby(left + dx, top, -dx, h, 'block'):
+                if block.top < top + h and block.bottom > top and block.right <= left + eps:
+                    gap = max(0.0, left - block.right)
+                    if gap < -dx:
+                        dx = -gap
+                        hit = True
+        return dx, hit
+
+    def _sweep_y(self, left, top, dy):
+        """Balaye la boîte verticalement
+
+        Returns:
+            tuple: (dy autorisé, rectangle/sol touché ou None)
+            Le sol est signalé par la chaîne 'ground'.
+        """
+        w, h = self.width, self.height
+        eps = self.EPSILON
+        hit = None
+        if dy > 0:
+            bottom = top + h
+            # Blocs et plateformes: seuls ceux dont le dessus est sous les pieds comptent
+            candidates = self._nearby(left, bottom, w, dy, 'block') + self._nearby(left, bottom, w, dy, 'platform')
+            for plat in candidates:
+                if plat.left < left + w and plat.right > left and plat.top >= bottom - eps:
+                    gap = max(0.0, plat.top - bottom)
+                    if gap < dy:
+                        dy = gap
+                        hit = plat
+            # Sol limité horizontalement (test sur le centre, comme la détection du sol)
+            center_x = left + w / 2
+            if self.ground_start_x <= center_x <= self.ground_end_x and self.ground_y >= bottom - eps:
+                gap = max(0.0, self.ground_y - bottom)
+                if gap < dy:
+                    dy = gap
+                    hit = 'ground'
+        elif dy < 0:
+            for block in self._nearby(left, top + dy, w, -dy, 'block'):
+                if block.left < left + w and block.right > left and block.bottom <= top + eps:
+                    gap = max(0.0, top - block.bottom)
+                    if gap < -dy:
+                        dy = -gap
+                        hit = block
+        return dy, hit
+
+    def move(self, left, top, dx, dy):
+        """Déplace la boîte de (dx, dy) en résolvant toutes les collisions
+
+        Args:
+            left, top: float - coin supérieur gauche de la boîte
+            dx, dy: float - déplacement souhaité pour ce pas de temps
+
+        Returns:
+            dict: {"left", "top", "hit_x", "landed", "hit_ceiling", "support"}
+            support vaut le rectangle (ou 'ground') sur lequel la boîte s'est posée
+        """
+        left, top = self.depenetrate(left, top)
+
+        # Sous-pas pour les grands déplacements
+        steps = max(1, math.ceil(max(abs(dx), abs(dy)) / CONTROLLER_MAX_STEP))
+        step_x = dx / steps
+        step_y = dy / steps
+
+        hit_x = False
+        landed = False
+        hit_ceiling = False
+        support = None
+        for _ in range(steps):
+            if step_x:
+                allowed_x, blocked = self._sweep_x(left, top, step_x)
+                left += allowed_x
+                if blocked:
+                    hit_x = True
+                    step_x = 0.0
+            if step_y:
+                allowed_y, touched = self._sweep_y(left, top, step_y)
+                top += allowed_y
+                if touched is not None:
+                    if step_y > 0:
+                        landed = True
+                        support = touched
+                    else:
+                        hit_ceiling = True
+                    step_y = 0.0
+            if not step_x and not step_y:
+                break
+
+        return {
+            "left": left,
+            "top": top,
+            "hit_x": hit_x,
+            "landed": landed,
+            "hit_ceiling": hit_ceiling,
+            "support": support,
+        }
@@ -9,13 +9,23 @@ class InputManager:
         self.keys = pygame.key.get_pressed()
         self.mouse_pos = pygame.mouse.get_pos()
         self.mouse_pressed = pygame.mouse.get_pressed()
+        self.playback = False  # Entrées fournies par feed() (rejeu) plutôt que lues
     
     def update(self):
         """Met à jour l'état des entrées"""
+        if self.playback:
+            return
         self.keys = pygame.key.get_pressed()
         self.mouse_pos = pygame.mouse.get_pos()
         self.mouse_pressed = pygame.mouse.get_pressed()
     
+    def feed(self, keys, mouse_pos, mouse_pressed):
+        """Impose l'état des entrées (rejeu) au lieu de le lire chez pygame"""
+        self.playback = True
+        self.keys = keys
+        self.mouse_pos = mouse_pos
+        self.mouse_pressed = mouse_pressed
+    
     def is_key_pressed(self, key):
         """Vérifie si une touche est pressée"""
         return self.keys[key]
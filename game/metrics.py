@@ -0,0 +1,100 @@
+# Compteurs du moteur (appels de dessin, tests de collision, surfaces)
+import sys
+import json
+from collections import Counter
+import pygame
+
+# Fonctions de pygame.draw comptées quand les métriques sont actives
+_DRAW_FUNCTIONS = ("rect", "line", "lines", "aaline", "aalines", "circle", "ellipse", "arc", "polygon")
+
+
+class MetricsRegistry:
+    """Registre de compteurs par image
+
+    Les chemins chauds y déclarent leur travail:
+    - rect_tests.<chemin>: tests rectangle/rectangle (collisions)
+    - surfaces.<usage>: Surfaces temporaires créées pendant l'image
+    - draw_calls.<module>: appels pygame.draw.*, comptés automatiquement par
+      module appelant (les fonctions de pygame.draw sont enveloppées tant
+      que le registre est actif, et restaurées ensuite)
+    - cull.<chemin>.drawn / .culled: objets dessinés / écartés hors de la vue
+
+    Inactif, add() se limite à un test et les chemins les plus chauds
+    testent `METRICS.enabled` avant de compter. end_frame() archive les
+    compteurs de l'image (last_frame) et les écrit en JSON lines si un
+    fichier est ouvert.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.counters = Counter()
+        self.last_frame = {}
+        self.frame = 0
+        self.output = None
+        self._original_draw = {}
+
+    def enable(self, jsonl_path=None):
+        """Active les compteurs (et l'export JSON lines si un chemin est donné)"""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.counters.clear()
+        self.frame = 0
+        if jsonl_path:
+            self.output = open(jsonl_path, "w", encoding="utf-8")
+        self._wrap_draw()
+
+    def disable(self):
+        """Désactive les compteurs et ferme l'export"""
+        if not self.enabled:
+            return
+        self.enabled = False
+        self._unwrap_draw()
+        if self.output:
+            self.output.close()
+            self.output = None
+
+    def add(self, name, n=1):
+        """Ajoute n au compteur name pour l'image en cours"""
+        if self.enabled:
+            self.counters[name] += n
+
+    def cull(self, path, drawn, total):
+        """Compte les objets dessinés et écartés d'un chemin de rendu"""
+        if self.enabled:
+            self.counters["cull." + path + ".drawn"] += drawn
+            self.counters["cull." + path + ".culled"] += total - drawn
+
+    def end_frame(self):
+        """Archive les compteurs de l'image et repart de zéro"""
+        if not self.enabled:
+            return
+        self.last_frame = dict(self.counters)
+        if self.output:
+            self.output.write(json.dumps({"frame": self.frame, **self.last_frame}) + "\n")
+        self.counters.clear()
+        self.frame += 1
+
+    def _wrap_draw(self):
+        """Remplace les fonctions de pygame.draw par des versions qui comptent"""
+        counters = self.counters
+        for name in _DRAW_FUNCTIONS:
+            original = getattr(pygame.draw, name)
+            self._original_draw[name] = original
+
+            def counted(*args, _original=original, **kwargs):
+                module = sys._getframe(1).f_globals.get("__name__", "?")
+                counters["draw_calls." + module.rsplit(".", 1)[-1]] += 1
+                return _original(*args, **kwargs)
+
+            setattr(pygame.draw, name, counted)
+
+    def _unwrap_draw(self):
+        """Restaure les fonctions de pygame.draw"""
+        for name, original in self._original_draw.items():
+            setattr(pygame.draw, name, original)
+        self._original_draw = {}
+
+
+# Registre global du jeu
+METRICS = MetricsRegistry()
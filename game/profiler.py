@@ -0,0 +1,163 @@
+# Profileur d'images
+import csv
+import time
+from collections import deque
+from contextlib import nullcontext
+import pygame
+import numpy as np
+from config.constants import *
+
+_NULL_SECTION = nullcontext()
+
+
+class _Section:
+    """Chronomètre d'une section (gestionnaire de contexte)"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, time.perf_counter() - self.start)
+
+
+class FrameProfiler:
+    """Mesure le temps de chaque phase de l'image (mise à jour et rendu)
+
+    Les sections sont délimitées par `with profiler.section("nom"):`; une
+    section traversée plusieurs fois dans l'image (plusieurs pas de
+    simulation) cumule ses durées. Désactivé, section() retourne un contexte
+    vide partagé: le coût se limite à un appel de méthode.
+
+    L'overlay affiche moyenne, p95 et p99 des PROFILER_WINDOW dernières
+    images pour chaque section, le temps hors sections ("autre") et un
+    graphe des durées d'image.
+    """
+
+    def __init__(self, window=PROFILER_WINDOW, history=PROFILER_HISTORY):
+        self.enabled = False
+        self.window = window
+        self.history = deque(maxlen=history)  # (durée totale, {section: durée})
+        self.sections = []  # Ordre d'affichage (ordre de première apparition)
+        self.current = {}
+        self.frame_start = None
+        self.panel = None  # Overlay rendu, reconstruit toutes les PROFILER_REFRESH images
+        self.panel_age = 0
+
+    def toggle(self):
+        """Active/désactive la mesure et l'overlay"""
+        self.enabled = not self.enabled
+        self.current = {}
+        self.frame_start = None  # L'image en cours n'est mesurée qu'en partie
+        self.panel = None
+        return self.enabled
+
+    def section(self, name):
+        """Retourne le contexte qui chronomètre la section name"""
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def add(self, name, seconds):
+        """Ajoute une durée à une section de l'image en cours"""
+        if name not in self.current:
+            self.current[name] = 0.0
+            if name not in self.sections:
+                self.sections.append(name)
+        self.current[name] += seconds
+
+    def begin_frame(self):
+        """Début d'une image"""
+        if self.enabled:
+            self.current = {}
+            self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Fin d'une image: archive ses mesures"""
+        if self.enabled and self.frame_start is not None:
+            self.history.append((time.perf_counter() - self.frame_start, self.current))
+        self.current = {}
+
+    def stats(self):
+        """Statistiques (ms) des dernières images
+
+        Returns:
+            list: (nom, moyenne, p95, p99) pour chaque section, puis "autre"
+                  et "image" (durée totale)
+        """
+        frames = list(self.history)[-self.window:]
+        if not frames:
+            return []
+        table = np.array([[timings.get(name, 0.0) for name in self.sections] + [total]
+                          for total, timings in frames]) * 1000
+        other = table[:, -1] - table[:, :-1].sum(axis=1)
+        columns = [(name, table[:, i]) for i, name in enumerate(self.sections)]
+        columns += [("autre", other), ("image", table[:, -1])]
+        return [(name, float(values.mean()), float(np.percentile(values, 95)), float(np.percentile(values, 99)))
+                for name, values in columns]
+
+    def dump_csv(self, path=None):
+        """Écrit une ligne par image conservée (durées en ms) et retourne le chemin"""
+        if path is None:
+            path = time.strftime("profil_%Y%m%d_%H%M%S.csv")
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["image", "total_ms"] + [f"{name}_ms" for name in self.sections])
+            for i, (total, timings) in enumerate(self.history):
+                writer.writerow([i, f"{total * 1000:.4f}"] +
+                                [f"{timings.get(name, 0.0) * 1000:.4f}" for name in self.sections])
+        return path
+
+    def draw(self, screen, font):
+        """Dessine l'overlay (tableau des sections et graphe des durées d'image)"""
+        if not self.enabled:
+            return
+        if self.panel is None or self.panel_age >= PROFILER_REFRESH:
+            self.panel = self._build_panel(font)
+            self.panel_age = 0
+        self.panel_age += 1
+        screen.blit(self.panel, (SCREEN_WIDTH - self.panel.get_width() - 10, 10))
+
+    def _build_panel(self, font):
+        """Rend le tableau des sections et le graphe sur une surface"""
+        rows = self.stats()
+        line_height = font.get_linesize()
+        graph_height = 60
+        width = 320
+        height = 16 + line_height * (len(rows) + 1) + graph_height + 8
+
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        columns = (8, 130, 193, 256)  # Nom, moyenne, p95, p99 (ms)
+        y = 8
+        for x, label in zip(columns, ("section (ms)", "moy", "p95", "p99")):
+            panel.blit(font.render(label, True, (200, 200, 200)), (x, y))
+        y += line_height
+        for name, *values in rows:
+            color = (255, 220, 120) if name == "image" else (230, 230, 230)
+            panel.blit(font.render(name, True, color), (columns[0], y))
+            for x, value in zip(columns[1:], values):
+                panel.blit(font.render(f"{value:6.2f}", True, color), (x, y))
+            y += line_height
+
+        # Graphe: une barre par image, ligne de repère à 1000/FPS ms
+        y += 8
+        graph_rect = pygame.Rect(8, y, width - 16, graph_height)
+        pygame.draw.rect(panel, (40, 40, 40, 200), graph_rect)
+        budget_ms = 1000 / (FPS or 60)
+        scale = graph_height / (budget_ms * 2)
+        totals = [total * 1000 for total, _ in list(self.history)[-graph_rect.width:]]
+        for i, ms in enumerate(totals):
+            bar = min(graph_height, int(ms * scale))
+            color = (90, 200, 90) if ms <= budget_ms else (230, 80, 60)
+            x = graph_rect.right - len(totals) + i
+            pygame.draw.line(panel, color, (x, graph_rect.bottom - 1), (x, graph_rect.bottom - bar))
+        budget_y = graph_rect.bottom - int(budget_ms * scale)
+        pygame.draw.line(panel, (255, 255, 255, 160), (graph_rect.left, budget_y), (graph_rect.right, budget_y))
+
+        return panel
@@ -0,0 +1,185 @@
+# Enregistrement et rejeu des entrées
+import json
+import struct
+import pygame
+import numpy as np
+from config.constants import *
+from game.seed import check_seed
+
+# Touches lues par la simulation (voir Player.update), une par bit du masque
+RECORDED_KEYS = (
+    pygame.K_q, pygame.K_d, pygame.K_LEFT, pygame.K_RIGHT,
+    pygame.K_SPACE, pygame.K_LSHIFT, pygame.K_RSHIFT,
+)
+
+# Format binaire (petit-boutiste):
+# - en-tête: magie, version, graine, index du niveau
+# - par image: durée réelle (double, pour rejouer l'accumulateur à l'identique),
+#   masque des touches, position et boutons de la souris, nombre d'événements
+# - par événement: type, touche, caractère (unicode), bouton, position
+_MAGIC = b"RPLY"
+_VERSION = 2
+_HEADER = struct.Struct("<4sHQi")
+_FRAME = struct.Struct("<dHhhBH")
+_EVENT = struct.Struct("<BiIBhh")
+
+# Types d'événements enregistrés (ceux traités par Game._handle_events)
+_EVENT_QUIT = 0
+_EVENT_KEYDOWN = 1
+_EVENT_MOUSEBUTTONDOWN = 2
+
+
+def keys_to_mask(keys):
+    """Convertit pygame.key.get_pressed() en masque de RECORDED_KEYS"""
+    mask = 0
+    for bit, key in enumerate(RECORDED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def buttons_to_mask(buttons):
+    """Convertit pygame.mouse.get_pressed() en masque (bit 0 = bouton gauche)"""
+    mask = 0
+    for bit, pressed in enumerate(buttons[:3]):
+        if pressed:
+            mask |= 1 << bit
+    return mask
+
+
+class KeyState:
+    """État du clavier rejoué, indexable comme pygame.key.get_pressed()"""
+
+    def __init__(self, mask=0):
+        self.mask = mask
+
+    def __getitem__(self, key):
+        for bit, recorded in enumerate(RECORDED_KEYS):
+            if recorded == key:
+                return bool(self.mask & (1 << bit))
+        return False
+
+
+class ReplayFrame:
+    """Entrées d'une image rejouée"""
+
+    def __init__(self, frame_time, keys, mouse_pos, mouse_pressed, events):
+        self.frame_time = frame_time
+        self.keys = keys
+        self.mouse_pos = mouse_pos
+        self.mouse_pressed = mouse_pressed
+        self.events = events
+
+
+class InputRecorder:
+    """Enregistre les entrées de chaque image dans un fichier binaire
+
+    La graine et le niveau de départ sont écrits dans l'en-tête: avec la
+    durée de chaque image, ils suffisent à rejouer la partie à l'identique.
+
+    Raises:
+        ValueError: si la graine n'est pas normalisée (voir game.seed; celle
+                    de Game.seed l'est toujours)
+    """
+
+    def __init__(self, path, seed, level_id):
+        header = _HEADER.pack(_MAGIC, _VERSION, check_seed(seed), level_id)
+        self.file = open(path, "wb")
+        self.file.write(header)
+        self.frames = 0
+
+    def record_frame(self, frame_time, keys, mouse_pos, mouse_pressed, events):
+        """Enregistre une image
+
+        Args:
+            frame_time: float - durée réelle de l'image (secondes)
+            keys: pygame.key.get_pressed()
+            mouse_pos: (x, y) - position de la souris
+            mouse_pressed: pygame.mouse.get_pressed()
+            events: liste des événements pygame de l'image
+        """
+        packed = []
+        for event in events:
+            if event.type == pygame.QUIT:
+                packed.append(_EVENT.pack(_EVENT_QUIT, 0, 0, 0, 0, 0))
+            elif event.type == pygame.KEYDOWN:
+                char = ord(event.unicode) if len(event.unicode) == 1 else 0
+                packed.append(_EVENT.pack(_EVENT_KEYDOWN, event.key, char, 0, 0, 0))
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                packed.append(_EVENT.pack(_EVENT_MOUSEBUTTONDOWN, 0, 0, event.button, event.pos[0], event.pos[1]))
+
+        self.file.write(_FRAME.pack(frame_time, keys_to_mask(keys), mouse_pos[0], mouse_pos[1],
+                                    buttons_to_mask(mouse_pressed), len(packed)))
+        self.file.write(b"".join(packed))
+        self.frames += 1
+
+    def close(self):
+        """Ferme le fichier"""
+        self.file.close()
+
+
+class InputReplayer:
+    """Relit un fichier écrit par InputRecorder, image par image"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.data = f.read()
+        magic, version, self.seed, self.level_id = _HEADER.unpack_from(self.data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Fichier de rejeu invalide: {path}")
+        self.offset = _HEADER.size
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        """Retourne la ReplayFrame suivante"""
+        if self.offset >= len(self.data):
+            raise StopIteration
+        frame_time, key_mask, mouse_x, mouse_y, button_mask, count = _FRAME.unpack_from(self.data, self.offset)
+        self.offset += _FRAME.size
+
+        events = []
+        for _ in range(count):
+            kind, key, char, button, x, y = _EVENT.unpack_from(self.data, self.offset)
+            self.offset += _EVENT.size
+            if kind == _EVENT_QUIT:
+                events.append(pygame.event.Event(pygame.QUIT))
+            elif kind == _EVENT_KEYDOWN:
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=chr(char) if char else "", mod=0))
+            elif kind == _EVENT_MOUSEBUTTONDOWN:
+                events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=button, pos=(x, y)))
+
+        mouse_pressed = tuple(bool(button_mask & (1 << bit)) for bit in range(3))
+        return ReplayFrame(frame_time, KeyState(key_mask), (mouse_x, mouse_y), mouse_pressed, events)
+
+
+class FrameTimeStats:
+    """Durées de traitement des images d'un rejeu, pour comparer les versions"""
+
+    def __init__(self):
+        self.times = []
+
+    def add(self, seconds):
+        """Ajoute la durée d'une image (secondes)"""
+        self.times.append(seconds)
+
+    def summary(self):
+        """Retourne un dict de statistiques (millisecondes)"""
+        if not self.times:
+            return {"frames": 0}
+        ms = np.array(self.times) * 1000
+        return {
+            "frames": len(ms),
+            "total_s": float(ms.sum() / 1000),
+            "mean_ms": float(ms.mean()),
+            "p50_ms": float(np.percentile(ms, 50)),
+            "p95_ms": float(np.percentile(ms, 95)),
+            "p99_ms": float(np.percentile(ms, 99)),
+            "max_ms": float(ms.max()),
+        }
+
+    def save(self, path):
+        """Écrit le résumé au format JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
@@ -0,0 +1,26 @@
+# Graine des tirages aléatoires
+import random
+
+# Graines acceptées partout: numpy.random.default_rng (entier positif) et
+# en-tête des fichiers de rejeu (entier non signé 64 bits)
+SEED_RANGE = 2 ** 64
+
+
+def normalize_seed(seed):
+    """Ramène une graine entière dans [0, SEED_RANGE)
+
+    Une graine négative ou trop grande (ex: --seed -1) désigne ainsi
+    toujours la même partie, au lieu de faire échouer numpy. Sans graine
+    (None), une graine est tirée au hasard: une partie connaît toujours la
+    sienne, et peut donc toujours être enregistrée puis rejouée.
+    """
+    if seed is None:
+        return random.SystemRandom().randrange(SEED_RANGE)
+    return int(seed) % SEED_RANGE
+
+
+def check_seed(seed):
+    """Vérifie qu'une graine est déjà normalisée (ValueError sinon)"""
+    if not isinstance(seed, int) or not 0 <= seed < SEED_RANGE:
+        raise ValueError(f"Graine invalide: {seed!r} (entier de [0, 2**64) attendu, voir normalize_seed)")
+    return seed
@@ -0,0 +1,128 @@
+# Profilage d'une session de jeu (cProfile + piles échantillonnées)
+import os
+import sys
+import time
+import cProfile
+import threading
+from collections import Counter
+from config.constants import *
+
+
+class StackSampler(threading.Thread):
+    """Échantillonne la pile d'un thread à intervalle fixe
+
+    Produit des piles "repliées" (fonction;fonction;... nombre), le format
+    d'entrée de flamegraph.pl / speedscope.
+    """
+
+    def __init__(self, thread_id, interval=PROFILE_SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.active = False  # Échantillonnage en pause tant que False
+        self.counts = Counter()
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            if not self.active:
+                continue
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                with self.lock:
+                    self.counts[";".join(reversed(stack))] += 1
+
+    def stop(self):
+        """Arrête le thread"""
+        self.stop_event.set()
+        self.join()
+
+    def write(self, path):
+        """Écrit les piles repliées cumulées"""
+        with self.lock:
+            items = sorted(self.counts.items())
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in items:
+                f.write(f"{stack} {count}\n")
+
+
+class SessionProfiler:
+    """Profile une session sous cProfile avec des instantanés périodiques
+
+    Toutes les every_seconds secondes ou every_frames images profilées, les
+    statistiques de l'intervalle écoulé sont écrites dans
+    out_dir/profile_NNNN.pstats (lisible avec pstats ou snakeviz) puis
+    remises à zéro. En parallèle, un échantillonneur cumule les piles du
+    thread principal dans out_dir/stacks.collapsed, pour les flame graphs.
+
+    Avec playing_only, le profilage est suspendu hors de l'état PLAYING
+    (menus, pause).
+    """
+
+    def __init__(self, out_dir, every_seconds=PROFILE_SNAPSHOT_SECONDS, every_frames=None, playing_only=False):
+        os.makedirs(out_dir, exist_ok=True)
+        self.out_dir = out_dir
+        self.every_seconds = every_seconds
+        self.every_frames = every_frames
+        self.playing_only = playing_only
+        self.profile = cProfile.Profile()
+        self.active = False
+        self.snapshots = 0
+        self.frames_since_snapshot = 0
+        self.last_snapshot = time.perf_counter()
+        self.sampler = StackSampler(threading.get_ident())
+        self.sampler.start()
+
+    def _set_active(self, active):
+        """Démarre/suspend la mesure (cProfile et échantillonneur)"""
+        if active == self.active:
+            return
+        if active:
+            self.profile.enable()
+        else:
+            self.profile.disable()
+        self.sampler.active = active
+        self.active = active
+
+    def tick(self, playing):
+        """À appeler une fois par image
+
+        Args:
+            playing: bool - le jeu est dans l'état PLAYING
+        """
+        self._set_active(playing or not self.playing_only)
+        if self.active:
+            self.frames_since_snapshot += 1
+
+        now = time.perf_counter()
+        due = ((self.every_frames and self.frames_since_snapshot >= self.every_frames) or
+               (self.every_seconds and now - self.last_snapshot >= self.every_seconds))
+        if due:
+            self.snapshot()
+
+    def snapshot(self):
+        """Écrit les statistiques de l'intervalle écoulé et repart de zéro"""
+        self.last_snapshot = time.perf_counter()
+        if self.frames_since_snapshot == 0:
+            return  # Rien n'a été profilé (menus avec playing_only)
+        was_active = self.active
+        self._set_active(False)
+        self.snapshots += 1
+        self.profile.dump_stats(os.path.join(self.out_dir, f"profile_{self.snapshots:04d}.pstats"))
+        self.sampler.write(os.path.join(self.out_dir, "stacks.collapsed"))
+        self.profile = cProfile.Profile()
+        self.frames_since_snapshot = 0
+        self._set_active(was_active)
+
+    def close(self):
+        """Dernier instantané et arrêt de l'échantillonneur"""
+        self.snapshot()
+        self._set_active(False)
+        self.sampler.stop()
+        self.sampler.write(os.path.join(self.out_dir, "stacks.collapsed"))
@@ -0,0 +1,133 @@
+# Index spatial des plateformes (broadphase)
+import pygame
+import numpy as np
+from config.constants import *
+
+class CellBuckets:
+    """Cellules d'une grille au format compact (CSR), lues comme un dict
+
+    Les indices de la cellule k sont indices[offsets[k]:offsets[k + 1]];
+    seule la table clé -> k est un dict Python (clés (cx, cy) packées en
+    un entier), ce qui rend la reconstruction depuis le cache de niveaux
+    quasi immédiate. Les listes d'indices sont produites à la lecture.
+    """
+
+    # Décalage des coordonnées de cellule dans la clé packée
+    _KEY_STRIDE = 1 << 32
+
+    def __init__(self, cx, cy, offsets, indices):
+        keys = cx.astype(np.int64) * self._KEY_STRIDE + cy
+        self.slots = dict(zip(keys.tolist(), range(len(keys))))
+        self.cx = cx
+        self.cy = cy
+        self.offsets = offsets
+        self.indices = indices
+
+    def get(self, key, default=None):
+        k = self.slots.get(key[0] * self._KEY_STRIDE + key[1])
+        if k is None:
+            return default
+        return self.indices[self.offsets[k]:self.offsets[k + 1]].tolist()
+
+    def __getitem__(self, key):
+        bucket = self.get(key)
+        if bucket is None:
+            raise KeyError(key)
+        return bucket
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __iter__(self):
+        return zip(self.cx.tolist(), self.cy.tolist())
+
+    def items(self):
+        return ((key, self.get(key)) for key in self)
+
+
+class PlatformGrid:
+    """Grille uniforme indexant les plateformes d'un niveau par type
+
+    Construite une seule fois par apply_level: chaque plateforme est
+    enregistrée dans toutes les cellules qu'elle recouvre, dans une grille
+    séparée par type ('platform', 'block', 'decor'). Les requêtes ne
+    parcourent donc que les cellules touchées par la zone demandée, quel
+    que soit le nombre total de plateformes du niveau.
+    """
+
+    def __init__(self, platforms, platform_types, cell_size=PLATFORM_GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self.platforms = platforms
+        self.platform_types = platform_types
+        # {type: {(cx, cy): [indices]}}
+        self.cells = {ptype: {} for ptype in PLATFORM_TYPES}
+
+        for i, plat in enumerate(platforms):
+            ptype = platform_types[i] if i < len(platform_types) else "platform"
+            grid = self.cells.setdefault(ptype, {})
+            x0, y0, x1, y1 = self._cell_span(plat.left, plat.top, plat.right, plat.bottom)
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = grid.get((cx, cy))
+                    if bucket is None:
+                        grid[(cx, cy)] = [i]
+                    else:
+                        bucket.append(i)
+
+    @classmethod
+    def from_cells(cls, platforms, platform_types, cells, cell_size=PLATFORM_GRID_CELL_SIZE):
+        """Reconstruit une grille depuis des cellules déjà calculées
+
+        Args:
+            cells: dict - {type: {(cx, cy): [indices]} ou CellBuckets}
+                   (voir core.level_compiler)
+        """
+        grid = cls.__new__(cls)
+        grid.cell_size = cell_size
+        grid.platforms = platforms
+        grid.platform_types = platform_types
+        grid.cells = {ptype: {} for ptype in PLATFORM_TYPES}
+        grid.cells.update(cells)
+        return grid
+
+    def _cell_span(self, left, top, right, bottom):
+        """Retourne les bornes (incluses) des cellules couvertes par une zone"""
+        size = self.cell_size
+        # right/bottom sont exclusifs pour un pygame.Rect
+        return (int(left // size), int(top // size),
+                int(max(left, right - 1) // size), int(max(top, bottom - 1) // size))
+
+    def query(self, rect, ptype=None):
+        """Retourne les indices des plateformes proches d'une zone
+
+        Le résultat est un sur-ensemble (test par cellule, pas par rectangle)
+        trié dans l'ordre du niveau, pour conserver la priorité d'origine
+        des parcours linéaires.
+
+        Args:
+            rect: pygame.Rect ou tuple (x, y, w, h) - zone monde à interroger
+            ptype: str ou None - type de plateforme ('platform', 'block'...),
+                   None pour tous les types
+
+        Returns:
+            list: indices dans la liste des plateformes
+        """
+        left, top, width, height = rect
+        x0, y0, x1, y1 = self._cell_span(left, top, left + width, top + height)
+        grids = [self.cells.get(ptype, {})] if ptype is not None else self.cells.values()
+
+        found = set()
+        for grid in grids:
+            if not grid:
+                continue
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = grid.get((cx, cy))
+                    if bucket:
+                        found.update(bucket)
+        return sorted(found)
+
+    def query_rects(self, rect, ptype=None):
+        """Retourne les rectangles des plateformes proches d'une zone"""
+        platforms = self.platforms
+        return [platforms[i] for i in self.query(rect, ptype)]
@@ -0,0 +1,45 @@
+# Pas de temps fixe pour la simulation
+from config.constants import *
+
+class FixedTimestep:
+    """Accumulateur de temps pour une simulation à pas fixe
+
+    Le temps réel écoulé entre deux images est accumulé puis consommé par
+    pas de durée fixe (1 / PHYSICS_HZ). La physique ne dépend donc plus de
+    la fréquence d'affichage:
+    - Les pics de dt (chargement, pause GC) sont bornés par MAX_FRAME_TIME
+    - Le nombre de pas par image est plafonné (MAX_STEPS_PER_FRAME) pour
+      éviter la "spirale de la mort" quand le rendu ralentit; le retard
+      excédentaire est abandonné
+    - alpha (0..1) indique où se situe l'image entre les deux derniers états
+      simulés, pour interpoler le rendu
+    """
+
+    def __init__(self, hz=PHYSICS_HZ, max_frame_time=MAX_FRAME_TIME, max_steps=MAX_STEPS_PER_FRAME):
+        self.step = 1.0 / hz
+        self.max_frame_time = max_frame_time
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped_time = 0.0
+
+    def advance(self, frame_time):
+        """Ajoute le temps d'une image et retourne le nombre de pas à simuler"""
+        self.accumulator += min(max(0.0, frame_time), self.max_frame_time)
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            # Plafond atteint: on rattrape ce qu'on peut et on oublie le reste
+            self.dropped_time += (steps - self.max_steps) * self.step
+            steps = self.max_steps
+            self.accumulator = (self.accumulator - steps * self.step) % self.step
+        else:
+            self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self):
+        """Fraction du pas suivant déjà écoulée (facteur d'interpolation)"""
+        return min(1.0, max(0.0, self.accumulator / self.step))
+
+    def reset(self):
+        """Vide l'accumulateur"""
+        self.accumulator = 0.0
@@ -2,15 +2,21 @@
 import pygame # truc de base
 import sys
 import os
+import argparse
+import random
+import time
+import json
+import numpy as np
 
 # Import des modules de configuration
 from config.constants import *
 from config.colors import *
 
 # Import des modules core
-from core.chargeur_niveau import load_levels, apply_level
+from core.chargeur_niveau import load_levels
+from core.level_cache import PreparedLevelCache, LevelPrefetcher
 from core.tutoriel import TutorialSystem
-from core.music_system import MusicSystem
+from core.music_system import MusicSystem, SilentBackend
 
 # Import des entités
 from entities.player import Player
@@ -19,49 +25,87 @@ from entities.projectiles import ProjectileSystem
 from entities.particles import ParticleSystem
 
 from rendering.background import BackgroundSystem
+from rendering.static_geometry import StaticGeometryCache
+from rendering.text_cache import FONTS, TEXT_CACHE
 from rendering.entities_renderer import EntitiesRenderer
 from rendering.ui import UIManager
 
 # Import des systèmes de jeu
-from game.physics import check_block_collision, resolve_block_collision, circle_rect_collision
+from game.physics import circle_rect_collision
 from game.camera import Camera
 from game.input import InputManager
 from game.game_state import GameState
+from game.timestep import FixedTimestep
+from game.replay import InputRecorder, InputReplayer, FrameTimeStats
+from game.seed import normalize_seed
+from game.profiler import FrameProfiler
+from game.session_profiler import SessionProfiler
+from game.metrics import METRICS
 
 class Game:
     """Classe principale du jeu"""
     
-    def __init__(self):
+    def __init__(self, fps=FPS, headless=False, seed=None, level_cache_budget=PREPARED_LEVEL_CACHE_BUDGET):
+        """Initialise le jeu
+        
+        Args:
+            fps: int - limite d'affichage (0 = non limité)
+            headless: bool - sans fenêtre (pilotes SDL "dummy"), pour les
+                      simulations, benchmarks et tests d'endurance
+            seed: int ou None - graine de tous les tirages aléatoires du jeu
+                  (ramenée dans [0, 2**64), tirée au hasard si None: voir
+                  game.seed)
+            level_cache_budget: int - mémoire (octets) des niveaux préparés
+                                gardés en cache
+        """
+        self.headless = headless
+        if headless:
+            # Doit être défini avant pygame.init()
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
         
         # Initialisation de l'écran
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Mon Jeu")
         
+        # Aléatoire: un générateur par partie, transmis à chaque système
+        self.seed = seed = normalize_seed(seed)
+        self.rng = random.Random(seed)
+        
         # Horloge et polices
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont(None, 48)
-        self.small_font = pygame.font.SysFont(None, 32)
-        self.title_font = pygame.font.SysFont(None, 96)
-        self.fword_font = pygame.font.SysFont(None, 180)
+        self.fps = fps  # Limite d'affichage (0 = non limité)
+        self.timestep = FixedTimestep()
+        self.font = FONTS.sysfont(None, 48)
+        self.small_font = FONTS.sysfont(None, 32)
+        self.title_font = FONTS.sysfont(None, 96)
+        self.fword_font = FONTS.sysfont(None, 180)
+        self.profiler_font = FONTS.sysfont(None, 22)
         
         # Systèmes du jeu
         self.input_manager = InputManager()
+        self.profiler = FrameProfiler()
+        self.session_profiler = None  # SessionProfiler (--profile)
         self.game_state = GameState()
         self.camera = Camera()
         self.ui_manager = UIManager()
-        self.background_system = BackgroundSystem()
+        self.background_system = BackgroundSystem(rng=self.rng)
+        self.static_geometry = StaticGeometryCache(self.ui_manager, self.background_system)
         self.entities_renderer = EntitiesRenderer()
         self.tutorial_system = TutorialSystem()
-        self.music_system = MusicSystem()
+        self.music_system = MusicSystem(backend=SilentBackend() if headless else None)
+        self.music_key = None  # Piste en cours (voir _play_level_music)
         
         # Systèmes d'entités
-        self.particle_system = ParticleSystem()
+        self.particle_system = ParticleSystem(rng=np.random.default_rng(seed))
         self.projectile_system = ProjectileSystem()
-        self.enemy_system = EnemySystem()
+        self.enemy_system = EnemySystem(rng=self.rng)
         
         # Niveaux
         self.levels = load_levels()
+        self.level_cache = PreparedLevelCache(level_cache_budget)
+        self.level_prefetcher = LevelPrefetcher(self.levels, self.level_cache)
         self.selected_level_idx = 0
         
         # État du jeu
@@ -69,6 +113,7 @@ class Game:
         self.platforms = []
         self.platform_colors = []
         self.platform_types = []
+        self.platform_index = None
         self.goal_rect = pygame.Rect(0, 0, 0, 0)
         self.spawn_point = pygame.Vector2(0, 0)
         self.ground_y = GROUND_Y
@@ -80,7 +125,14 @@ class Game:
         
         # Variables de contrôle
         self.running = True
-        self.dt = 0
+        self.dt = self.timestep.step  # La simulation avance toujours par pas fixes
+        
+        # États précédents pour l'interpolation du rendu
+        self.prev_player_pos = self.player.pos.copy()
+        self.prev_camera_offset = self.camera.offset.copy()
+        self.render_offset = self.camera.offset.copy()
+        self.render_player_pos = self.player.pos.copy()
+        self.render_alpha = 1.0
         
         # Menu GUI state
         self.menu_gui_open = False
@@ -91,23 +143,16 @@ class Game:
         self._setup_menu_gui()
     
     def _apply_current_level(self):
-        """Applique le niveau actuel"""
-        level = self.levels[self.selected_level_idx]
-        
-        # Met à jour les données du niveau
-        game_state_data = {
-            "GROUND_Y": self.ground_y,
-            "GROUND_START_X": self.ground_start_x,
-            "GROUND_END_X": self.ground_end_x,
-            "platforms": self.platforms,
-            "platform_colors": self.platform_colors,
-            "platform_types": self.platform_types,
-            "goal_rect": self.goal_rect,
-            "spawn_point": self.spawn_point,
-            "level_enemy_configs": []
-        }
-        
-        game_state_data = apply_level(level, game_state_data)
+        """Applique le niveau actuel
+        
+        Le niveau est compilé (voir core.level_compiler) puis préparé une
+        seule fois: les accès suivants, par exemple en naviguant dans le
+        menu, réutilisent l'état gardé dans self.level_cache. Le niveau
+        suivant est préparé en arrière-plan à l'approche de la porte (voir
+        _update): le changement de niveau n'est alors qu'un échange de
+        références.
+        """
+        game_state_data = self.level_prefetcher.get(self.selected_level_idx)
         
         # Mettre à jour les variables locales
         self.ground_y = game_state_data["GROUND_Y"]
@@ -120,28 +165,44 @@ class Game:
         self.platforms = game_state_data["platforms"]
         self.platform_colors = game_state_data["platform_colors"]
         self.platform_types = game_state_data["platform_types"]
+        self.platform_index = game_state_data["platform_index"]
         self.goal_rect = game_state_data["goal_rect"]
         self.spawn_point = game_state_data["spawn_point"]
         self.enemy_system.level_enemy_configs = game_state_data["level_enemy_configs"]
+        self.static_geometry.set_level(self.platforms, self.platform_colors, self.platform_types, self.platform_index,
+                                       self.ground_y, self.ground_start_x, self.ground_end_x)
         
         # Charger et jouer la musique du niveau
         level_music = game_state_data.get("level_music", [])
         if level_music:
             # Joue la première piste musicale trouvée
-            if self.music_system.load_music_from_data(level_music[0]):
-                self.music_system.play(loops=-1)
-                print(f"Musique chargée: {level_music[0].get('name', 'Inconnue')}")
+            self._play_level_music(level_music[0])
         else:
-            self.music_system.stop()
+            self._stop_music()
         
         # Créer le joueur
         if self.player is None:
-            self.player = Player(self.spawn_point.x, self.spawn_point.y)
+            self.player = Player(self.spawn_point.x, self.spawn_point.y, rng=self.rng)
         
         # Configurer le tutoriel
-        self.tutorial_system.select_tutorial_for_level(level)
+        self.tutorial_system.select_tutorial_for_level({"name": game_state_data["level_name"]})
+    
+    def _play_level_music(self, music_info):
+        """Joue une piste, sauf si c'est déjà celle en cours (pas de redémarrage)"""
+        key = (music_info.get("name", ""), hash(music_info.get("data", "")))
+        if key == self.music_key:
+            return
+        if self.music_system.load_music_from_data(music_info):
+            self.music_system.play(loops=-1)
+            self.music_key = key
+            print(f"Musique: {music_info.get('name', 'Inconnue')}")
     
-    def _handle_events(self):
+    def _stop_music(self):
+        """Arrête la musique"""
+        self.music_system.stop()
+        self.music_key = None
+    
+    def _handle_events(self, events=None):
         """Gère tous les événements pygame (clavier, souris, fenêtre)
         
         Logique complexe de gestion d'états:
@@ -151,8 +212,14 @@ class Game:
         - Easter eggs et fonctionnalités spéciales
         
         Les événements sont routés selon l'état actuel du jeu
+        
+        Args:
+            events: liste d'événements à traiter (rejeu), ou None pour lire
+                    la file pygame
         """
-        for event in pygame.event.get():
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             
@@ -166,6 +233,15 @@ class Game:
                     elif self.game_state.is_paused():
                         self.game_state.set_state(GAME_STATES["PLAYING"])  # Pause -> Jeu
                 
+                elif event.key == pygame.K_F3:
+                    # Profileur d'images: overlay des temps par section
+                    self.profiler.toggle()
+                
+                elif event.key == pygame.K_F4:
+                    # Export CSV des temps par image du profileur
+                    if self.profiler.history:
+                        print(f"Profil écrit dans {self.profiler.dump_csv()}")
+                
                 elif event.key == pygame.K_TAB:
                     # Toggle menu GUI
                     self.menu_gui_open = not self.menu_gui_open
@@ -197,7 +273,7 @@ class Game:
                     # Retour au menu depuis la pause
                     self.game_state.set_state(GAME_STATES["MENU"])
                     self.tutorial_system.hide_display()  # Cache le tutoriel
-                    self.music_system.stop()  # Arrête la musique au menu
+                    self._stop_music()  # Arrête la musique au menu
                 
                 elif self.game_state.is_menu():
                     # Navigation entre niveaux dans le menu
@@ -209,7 +285,7 @@ class Game:
                         self._apply_current_level()  # Recharge le niveau sélectionné
             
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                mouse_pos = pygame.mouse.get_pos()
+                mouse_pos = event.pos
                 
                 # Gestion du menu GUI
                 if self.menu_gui_open:
@@ -238,7 +314,7 @@ class Game:
                     elif pause_menu_rect.collidepoint(mouse_pos):
                         self.game_state.set_state(GAME_STATES["MENU"])
                         self.tutorial_system.hide_display()
-                        self.music_system.stop()  # Arrête la musique au menu
+                        self._stop_music()  # Arrête la musique au menu
                     elif pause_quit_rect.collidepoint(mouse_pos):
                         self.running = False
                 
@@ -271,32 +347,24 @@ class Game:
         if self.game_state.is_paused():
             return
         
+        profiler = self.profiler
+        
         # Mise à jour des entrées
-        self.input_manager.update()
-        
-        # Mise à jour du joueur
-        moving = self.player.update(
-            self.dt, 
-            self.input_manager.keys,
-            self.platforms,
-            self.platform_types,
-            self.ground_y,
-            self.ground_start_x,
-            self.ground_end_x
-        )
-        
-        # Collisions avec les blocs
-        player_rect = self.player.get_rect()
-        block_collision = check_block_collision(player_rect, self.platforms, self.platform_types)
-        if block_collision:
-            old_vel_y = self.player.vel_y
-            self.player.pos, self.player.vel_y = resolve_block_collision(
-                player_rect, self.player.pos, self.player.vel_y, block_collision,
-                head_radius, body_height, leg_height
+        with profiler.section("entrées"):
+            self.input_manager.update()
+        
+        # Mise à jour du joueur (déplacement et collisions sol/plateformes/blocs)
+        with profiler.section("joueur"):
+            moving = self.player.update(
+                self.dt, 
+                self.input_manager.keys,
+                self.platforms,
+                self.platform_types,
+                self.ground_y,
+                self.ground_start_x,
+                self.ground_end_x,
+                self.platform_index
             )
-            # Reset jumps when landing on a block (falling and velocity stopped)
-            if old_vel_y > 0 and self.player.vel_y == 0:
-                self.player.air_jumps_left = 1
         
         # Vérifier si le joueur est mort
         if self.player.is_dead(DEATH_BELOW_Y):
@@ -304,9 +372,14 @@ class Game:
             self.player.reset(self.spawn_point)
             self.particle_system.create_particles(self.player.pos, PARTICLE_COLORS["damage"], 15)
         
+        # Préchargement du niveau suivant à l'approche de la porte
+        next_idx = (self.selected_level_idx + 1) % len(self.levels)
+        if self.player.pos.distance_squared_to(self.goal_rect.center) < LEVEL_PREFETCH_DISTANCE ** 2:
+            self.level_prefetcher.request(next_idx)
+        
         # Collision avec la porte/objectif
         if self.player.get_feet_rect().colliderect(self.goal_rect) and not self.game_state.level_transition_active:
-            next_idx = (self.selected_level_idx + 1) % len(self.levels)
+            self.level_prefetcher.request(next_idx)
             self.game_state.start_level_transition(next_idx)
         
         # Gestion complexe de la transition entre niveaux
@@ -331,29 +404,33 @@ class Game:
             self.tutorial_system.start_display()  # Affiche le tutoriel du nouveau niveau
         
         # Mise à jour de la caméra
-        self.camera.update(self.player.pos)
+        self.camera.update(self.player.pos, self.dt)
         
         # Mise à jour des projectiles
-        self.projectile_system.update(self.dt, self.camera.offset)
+        with profiler.section("projectiles"):
+            self.projectile_system.update(self.dt, self.camera.offset)
         
         # Mise à jour des ennemis
-        self.enemy_system.update(self.dt, self.platforms, self.ground_y)
-        
-        # Collisions projectiles-ennemis
-        score_gained = self.enemy_system.check_projectile_collision(self.projectile_system.projectiles, self.particle_system)
-        self.game_state.score += score_gained
+        with profiler.section("ennemis"):
+            self.enemy_system.update(self.dt, self.platforms, self.ground_y, self.platform_index)
         
-        # Collisions joueur-ennemis
-        if not self.game_state.is_invulnerable:
-            if self.enemy_system.check_player_collision(self.player.get_rect(), self.particle_system):
-                self.game_state.player_hit()
-                self.player.reset(self.spawn_point)
+        with profiler.section("collisions"):
+            # Collisions projectiles-ennemis
+            score_gained = self.enemy_system.check_projectile_collision(self.projectile_system, self.particle_system)
+            self.game_state.score += score_gained
+            
+            # Collisions joueur-ennemis
+            if not self.game_state.is_invulnerable:
+                if self.enemy_system.check_player_collision(self.player.get_rect(), self.particle_system):
+                    self.game_state.player_hit()
+                    self.player.reset(self.spawn_point)
         
         # Mise à jour de l'invulnérabilité
         self.game_state.update_invulnerability(self.dt)
         
         # Mise à jour des particules
-        self.particle_system.update(self.dt)
+        with profiler.section("particules"):
+            self.particle_system.update(self.dt)
         
         # Effet de particules lors de l'atterrissage pour le feedback visuel
         # Détecte le moment exact où le joueur touche le sol après être en l'air
@@ -373,14 +450,38 @@ class Game:
         # Mise à jour des nuages
         self.background_system.update_clouds(self.dt, self.camera.offset)
     
-    def _render(self):
-        """Rendu graphique"""
+    def _save_previous_state(self):
+        """Mémorise l'état avant un pas de simulation (pour l'interpolation)"""
+        self.prev_player_pos.update(self.player.pos)
+        self.prev_camera_offset.update(self.camera.offset)
+        self.enemy_system.save_previous()
+        self.projectile_system.save_previous()
+        self.particle_system.save_previous()
+    
+    def _interpolate(self, previous, current, alpha):
+        """Interpole entre deux états, sans lisser les téléportations (respawn, niveau)"""
+        if previous.distance_squared_to(current) > INTERPOLATION_SNAP_DISTANCE ** 2:
+            return current.copy()
+        return previous.lerp(current, alpha)
+    
+    def _render(self, alpha=1.0):
+        """Rendu graphique
+        
+        Args:
+            alpha: float - position de l'image entre les deux derniers pas
+                   de simulation (0 = état précédent, 1 = état courant)
+        """
+        self.render_offset = self._interpolate(self.prev_camera_offset, self.camera.offset, alpha)
+        self.render_player_pos = self._interpolate(self.prev_player_pos, self.player.pos, alpha)
+        self.render_alpha = alpha
+        
         # Effacer l'écran
         self.screen.fill((0, 0, 0))
         
         if self.game_state.is_menu():
             # Menu principal
-            self.background_system.draw_parallax_background(self.screen, self.camera.offset)
+            with self.profiler.section("fond"):
+                self.background_system.draw_parallax_background(self.screen, self.render_offset)
             self.ui_manager.draw_menu(self.screen, self.font, self.small_font, self.title_font, self.selected_level_idx, self.levels)
         
         elif self.game_state.is_paused():
@@ -395,28 +496,17 @@ class Game:
             # Écrans de fin
             if self.game_state.victory:
                 self.ui_manager.draw_victory_screen(self.screen, self.font, self.game_state.score)
-                pygame.display.flip()
-                pygame.time.delay(1500)
-                self.game_state.set_state(GAME_STATES["MENU"])
-                self.game_state.victory = False
-                self.game_state.level_transition_active = False
-                self.music_system.stop()  # Arrête la musique au menu
+                self._present(hold_ms=1500)
+                self._finish_victory()
             
             elif self.game_state.is_game_over():
                 self.ui_manager.draw_game_over_screen(self.screen, self.font, self.game_state.score)
-                pygame.display.flip()
-                pygame.time.delay(1500)
-                self.game_state.set_state(GAME_STATES["MENU"])
-                self.game_state.lives = 3
-                self.game_state.score = 0
-                self.projectile_system.clear()
-                self.particle_system.clear()
-                self.game_state.level_transition_active = False
-                self.music_system.stop()  # Arrête la musique au menu
+                self._present(hold_ms=1500)
+                self._finish_game_over()
         
         # Easter egg
         if self.game_state.fword_timer > 0:
-            fword_surf = self.fword_font.render("BRAVO!", True, (255, 0, 0))
+            fword_surf = TEXT_CACHE.render(self.fword_font, "BRAVO!", True, (255, 0, 0))
             self.screen.blit(fword_surf, (SCREEN_WIDTH//2 - fword_surf.get_width()//2, SCREEN_HEIGHT//2 - fword_surf.get_height()//2))
         
         # Menu GUI
@@ -424,47 +514,208 @@ class Game:
             self._draw_menu_gui()
         
         # Tutoriel
-        self.tutorial_system.draw(self.screen, self.small_font, SCREEN_WIDTH, SCREEN_HEIGHT)
+        with self.profiler.section("tutoriel"):
+            self.tutorial_system.draw(self.screen, self.small_font, SCREEN_WIDTH, SCREEN_HEIGHT)
         
+        # Profileur (F3)
+        with self.profiler.section("profileur"):
+            self.profiler.draw(self.screen, self.profiler_font)
+        
+        with self.profiler.section("flip"):
+            self._present()
+    
+    def _present(self, hold_ms=0):
+        """Affiche l'image (et la maintient hold_ms millisecondes), sauf en mode headless"""
+        if self.headless:
+            return
         pygame.display.flip()
+        if hold_ms:
+            pygame.time.delay(hold_ms)
+    
+    def _finish_victory(self):
+        """Retour au menu après l'écran de victoire"""
+        self.game_state.set_state(GAME_STATES["MENU"])
+        self.game_state.victory = False
+        self.game_state.level_transition_active = False
+        self._stop_music()  # Arrête la musique au menu
+    
+    def _finish_game_over(self):
+        """Retour au menu après l'écran de game over"""
+        self.game_state.set_state(GAME_STATES["MENU"])
+        self.game_state.lives = 3
+        self.game_state.score = 0
+        self.projectile_system.clear()
+        self.particle_system.clear()
+        self.game_state.level_transition_active = False
+        self._stop_music()  # Arrête la musique au menu
     
     def _render_game(self):
         """Rendu du jeu"""
-        # Arrière-plan
-        self.background_system.draw_parallax_background(self.screen, self.camera.offset)
-        
-        # Sol
-        self.background_system.draw_ground(self.screen, self.camera.offset, self.ground_y, self.ground_start_x, self.ground_end_x)
+        profiler = self.profiler
         
-        # Plateformes
-        self.ui_manager.draw_platforms(self.screen, self.platforms, self.platform_colors, self.platform_types, self.camera.offset)
+        with profiler.section("fond"):
+            # Arrière-plan
+            self.background_system.draw_parallax_background(self.screen, self.render_offset)
         
-        # Porte/objectif
-        self.ui_manager.draw_goal(self.screen, self.goal_rect, self.camera.offset)
+        with profiler.section("plateformes"):
+            # Sol et plateformes (morceaux précalculés)
+            self.static_geometry.draw(self.screen, self.render_offset)
+            
+            # Porte/objectif
+            self.ui_manager.draw_goal(self.screen, self.goal_rect, self.render_offset)
         
         # Entités
-        self.entities_renderer.draw_enemies(self.screen, self.enemy_system.monsters, self.camera.offset)
-        self.entities_renderer.draw_player(self.screen, self.player, self.camera.offset, self.input_manager.keys, self.game_state.is_invulnerable, self.game_state.invuln_timer)
-        self.entities_renderer.draw_projectiles(self.screen, self.projectile_system.projectiles, self.camera.offset)
-        self.entities_renderer.draw_particles(self.screen, self.particle_system.particles, self.camera.offset)
+        with profiler.section("entités"):
+            self.entities_renderer.draw_enemies(self.screen, self.enemy_system.monsters, self.render_offset, self.render_alpha)
+            self.entities_renderer.draw_player(self.screen, self.player, self.render_offset, self.input_manager.keys, self.game_state.is_invulnerable, self.game_state.invuln_timer, self.render_player_pos)
+            self.entities_renderer.draw_projectiles(self.screen, self.projectile_system, self.render_offset, self.render_alpha)
+            self.entities_renderer.draw_particles(self.screen, self.particle_system, self.render_offset, self.render_alpha)
         
         # HUD
-        self.ui_manager.draw_hud(self.screen, self.font, self.small_font, self.game_state.score, self.game_state.lives, self.player.stamina, self.game_state.is_invulnerable)
+        with profiler.section("hud"):
+            self.ui_manager.draw_hud(self.screen, self.font, self.small_font, self.game_state.score, self.game_state.lives, self.player.stamina, self.game_state.is_invulnerable)
         
         # Transition de niveau
         self.ui_manager.draw_level_transition(self.screen, self.game_state.level_transition_active, self.game_state.level_transition_phase, self.game_state.level_transition_timer)
     
-    def run(self):
-        """Boucle principale du jeu"""
-        while self.running:
-            self._handle_events()
-            self._update()
-            self._render()
-            self.dt = self.clock.tick(FPS) / 1000
+    def run(self, record_path=None):
+        """Boucle principale du jeu
+        
+        Simulation à pas fixe (PHYSICS_HZ) découplée de l'affichage: le temps
+        réel de chaque image est accumulé puis consommé par pas de self.dt,
+        et le rendu interpole entre les deux derniers états simulés.
+        
+        Args:
+            record_path: str ou None - enregistre les entrées de la session
+                         dans ce fichier (voir replay())
+        """
+        recorder = None
+        if record_path:
+            recorder = InputRecorder(record_path, self.seed, self.selected_level_idx)
         
+        self.clock.tick()
+        while self.running:
+            frame_time = self.clock.tick(self.fps) / 1000
+            events = pygame.event.get()
+            if recorder:
+                recorder.record_frame(frame_time, pygame.key.get_pressed(), pygame.mouse.get_pos(),
+                                      pygame.mouse.get_pressed(), events)
+            self._step_frame(frame_time, events)
+        
+        if recorder:
+            recorder.close()
+        if self.session_profiler:
+            self.session_profiler.close()
+        self.close()
+        METRICS.disable()
         pygame.quit()
         sys.exit()
     
+    def _step_frame(self, frame_time, events):
+        """Traite une image: événements, pas de simulation, rendu"""
+        self.profiler.begin_frame()
+        self._handle_events(events)
+        for _ in range(self.timestep.advance(frame_time)):
+            self._save_previous_state()
+            self._update()
+        self._render(self.timestep.alpha)
+        self._poll_prefetch()
+        self.music_system.update()
+        self.profiler.end_frame()
+        METRICS.end_frame()
+        if self.session_profiler:
+            self.session_profiler.tick(self.game_state.is_playing())
+    
+    def _poll_prefetch(self):
+        """Récupère les niveaux préchargés et lance le décodage de leur musique"""
+        for state in self.level_prefetcher.poll():
+            if state["level_music"]:
+                self.music_system.preload(state["level_music"][0])
+    
+    def close(self):
+        """Arrête les threads d'arrière-plan (musique, préchargement des niveaux)"""
+        self.level_prefetcher.close()
+        self.music_system.close()
+    
+    def replay(self, replayer, stats_path=None):
+        """Rejoue une session enregistrée par run(record_path)
+        
+        Le jeu doit avoir été créé avec la graine du fichier
+        (replayer.seed). Chaque image reçoit les entrées et la durée
+        enregistrées, la simulation est donc identique à la session
+        d'origine; seul le temps de traitement de chaque image est mesuré.
+        
+        Args:
+            replayer: InputReplayer
+            stats_path: str ou None - écrit les statistiques JSON de durée
+                        des images
+        
+        Returns:
+            dict: statistiques de durée des images (voir FrameTimeStats)
+        """
+        if replayer.level_id != self.selected_level_idx:
+            self.selected_level_idx = replayer.level_id
+            self._apply_current_level()
+        
+        stats = FrameTimeStats()
+        self.clock.tick()
+        for frame in replayer:
+            if not self.running:
+                break
+            if self.fps:
+                self.clock.tick(self.fps)
+            start = time.perf_counter()
+            self.input_manager.feed(frame.keys, frame.mouse_pos, frame.mouse_pressed)
+            self._step_frame(frame.frame_time, frame.events)
+            stats.add(time.perf_counter() - start)
+        
+        if stats_path:
+            stats.save(stats_path)
+        return stats.summary()
+    
+    def simulate(self, frames, dt=None, render=False):
+        """Simule frames pas de jeu aussi vite que possible, sans événements
+        
+        Découplé de _handle_events et de l'horloge: chaque pas avance de dt
+        (par défaut le pas fixe de la simulation). Une partie est démarrée si
+        besoin, et relancée quand elle se termine (victoire ou game over),
+        pour les tests d'endurance.
+        
+        Args:
+            frames: int - nombre de pas à simuler
+            dt: float ou None - durée d'un pas (None = 1 / PHYSICS_HZ)
+            render: bool - dessine aussi chaque pas (hors écran en headless)
+        
+        Returns:
+            dict: {"frames", "seconds", "fps", "score"}
+        """
+        if dt is not None:
+            self.dt = dt
+        if not self.game_state.is_playing():
+            self._start_new_game()
+        
+        start = time.perf_counter()
+        for _ in range(frames):
+            self._save_previous_state()
+            self._update()
+            if render:
+                self._render()
+            elif self.game_state.victory:
+                self._finish_victory()
+            elif self.game_state.is_game_over():
+                self._finish_game_over()
+            METRICS.end_frame()
+            if not self.game_state.is_playing():
+                self._start_new_game()
+        elapsed = time.perf_counter() - start
+        
+        return {
+            "frames": frames,
+            "seconds": elapsed,
+            "fps": frames / elapsed if elapsed > 0 else float("inf"),
+            "score": self.game_state.score,
+        }
+    
     def _setup_menu_gui(self):
         """Setup the menu GUI components"""
         # Menu dimensions
@@ -535,6 +786,7 @@ class Game:
         
         # Draw menu background
         menu_surface = pygame.Surface((self.menu_width, self.menu_height))
+        METRICS.add("surfaces.menu_gui")
         menu_surface.fill(WHITE)
         menu_surface.set_alpha(240)
         self.screen.blit(menu_surface, (self.menu_x, self.menu_y))
@@ -544,8 +796,8 @@ class Game:
                         (self.menu_x, self.menu_y, self.menu_width, self.menu_height), 3)
         
         # Draw title
-        font_title = pygame.font.Font(None, 36)
-        title_text = font_title.render("INFORMATIONS SUR LE JOUEUR", True, BLACK)
+        font_title = FONTS.font(None, 36)
+        title_text = TEXT_CACHE.render(font_title, "INFORMATIONS SUR LE JOUEUR", True, BLACK)
         title_rect = title_text.get_rect(center=(self.menu_x + self.menu_width // 2, self.menu_y + 60))
         self.screen.blit(title_text, title_rect)
         
@@ -553,19 +805,19 @@ class Game:
         avatar_rect = pygame.Rect(self.menu_x + 100, self.menu_y + 120, 120, 120)
         pygame.draw.rect(self.screen, GRAY, avatar_rect)
         pygame.draw.rect(self.screen, BLACK, avatar_rect, 2)
-        font_label = pygame.font.Font(None, 24)
-        avatar_text = font_label.render("Avatar", True, DARK_GRAY)
+        font_label = FONTS.font(None, 24)
+        avatar_text = TEXT_CACHE.render(font_label, "Avatar", True, DARK_GRAY)
         avatar_text_rect = avatar_text.get_rect(center=avatar_rect.center)
         self.screen.blit(avatar_text, avatar_text_rect)
         
         # Draw pseudo label
-        pseudo_label = font_label.render("Pseudo:", True, BLACK)
+        pseudo_label = TEXT_CACHE.render(font_label, "Pseudo:", True, BLACK)
         self.screen.blit(pseudo_label, (self.menu_x + 100, self.menu_y + 90))
         
         # Draw input field
         color = BLUE if self.input_active else BLACK
         pygame.draw.rect(self.screen, color, self.input_rect, 2)
-        text_surface = font_label.render(self.input_text, True, BLACK)
+        text_surface = TEXT_CACHE.render(font_label, self.input_text, True, BLACK)
         self.screen.blit(text_surface, (self.input_rect.x + 5, self.input_rect.y + 8))
         
         # Draw power buttons
@@ -575,7 +827,7 @@ class Game:
     def _draw_power_button(self, button, WHITE, BLACK, GRAY, DARK_GRAY, BLUE, LIGHT_BLUE):
         """Draw a single power button"""
         center = button['rect'].center
-        font_button = pygame.font.Font(None, 20)
+        font_button = FONTS.font(None, 20)
         
         # Check if image exists
         if button['image_key'] in self.power_images:
@@ -593,14 +845,84 @@ class Game:
             pygame.draw.circle(self.screen, BLACK, center, 45, 2)
             
             # Draw text
-            text = font_button.render(button['label'], True, BLACK)
+            text = TEXT_CACHE.render(font_button, button['label'], True, BLACK)
             text_rect = text.get_rect(center=center)
             self.screen.blit(text, text_rect)
 
 def main():
     """Point d'entrée"""
-    game = Game()
-    game.run()
+    parser = argparse.ArgumentParser(description="Mon Jeu")
+    parser.add_argument("--fps", type=int, default=FPS,
+                        help="limite d'images par seconde (0 = non limité), sans effet sur la simulation")
+    parser.add_argument("--headless", action="store_true",
+                        help="simulation sans fenêtre ni limite de vitesse, affiche les images simulées par seconde")
+    parser.add_argument("--frames", type=int, default=3600,
+                        help="nombre de pas à simuler en mode headless")
+    parser.add_argument("--dt", type=float, default=None,
+                        help="durée d'un pas en mode headless (défaut: 1 / PHYSICS_HZ)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="graine aléatoire (simulation reproductible)")
+    parser.add_argument("--render", action="store_true",
+                        help="en mode headless, dessine aussi chaque pas hors écran")
+    parser.add_argument("--record", metavar="FICHIER",
+                        help="enregistre les entrées de la session dans FICHIER")
+    parser.add_argument("--replay", metavar="FICHIER",
+                        help="rejoue une session enregistrée, sans limite d'images par seconde (avec --headless: sans fenêtre)")
+    parser.add_argument("--stats", metavar="FICHIER",
+                        help="avec --replay, écrit les statistiques de durée des images (JSON)")
+    parser.add_argument("--profile", metavar="DOSSIER",
+                        help="profile la session (cProfile + piles échantillonnées) dans DOSSIER")
+    parser.add_argument("--profile-seconds", type=float, default=None,
+                        help=f"un fichier pstats toutes les N secondes (défaut: {PROFILE_SNAPSHOT_SECONDS}, "
+                             "sauf si --profile-frames est donné)")
+    parser.add_argument("--profile-frames", type=int, default=None,
+                        help="un fichier pstats toutes les N images profilées")
+    parser.add_argument("--profile-playing-only", action="store_true",
+                        help="ne profile que l'état PLAYING (pas les menus ni la pause)")
+    parser.add_argument("--metrics", metavar="FICHIER",
+                        help="active les compteurs du moteur et les écrit par image (JSON lines)")
+    parser.add_argument("--level-cache-mb", type=float, default=PREPARED_LEVEL_CACHE_BUDGET / (1024 * 1024),
+                        help="mémoire des niveaux préparés gardés en cache (Mo)")
+    args = parser.parse_args()
+    level_cache_budget = int(args.level_cache_mb * 1024 * 1024)
+    
+    if args.metrics:
+        METRICS.enable(args.metrics)
+    
+    session_profiler = None
+    if args.profile:
+        every_seconds = args.profile_seconds
+        if every_seconds is None and args.profile_frames is None:
+            every_seconds = PROFILE_SNAPSHOT_SECONDS
+        session_profiler = SessionProfiler(args.profile, every_seconds, args.profile_frames,
+                                           args.profile_playing_only)
+    
+    if args.replay:
+        replayer = InputReplayer(args.replay)
+        game = Game(fps=0, headless=args.headless, seed=replayer.seed, level_cache_budget=level_cache_budget)  # Rejeu non limité
+        game.session_profiler = session_profiler
+        stats = game.replay(replayer, args.stats)
+        if session_profiler:
+            session_profiler.close()
+        print(json.dumps(stats, indent=2))
+        game.close()
+        METRICS.disable()
+        pygame.quit()
+        return
+    
+    if args.headless:
+        game = Game(headless=True, seed=args.seed, level_cache_budget=level_cache_budget)
+        stats = game.simulate(args.frames, dt=args.dt, render=args.render)
+        print(f"{stats['frames']} images simulées en {stats['seconds']:.3f} s "
+              f"({stats['fps']:.1f} images/s, score {stats['score']})")
+        game.close()
+        METRICS.disable()
+        pygame.quit()
+        return
+    
+    game = Game(fps=args.fps, seed=args.seed, level_cache_budget=level_cache_budget)
+    game.session_profiler = session_profiler
+    game.run(record_path=args.record)
 
 if __name__ == "__main__":
     main()
@@ -4,22 +4,29 @@ import math
 import random
 from config.constants import *
 from config.colors import *
+from game.camera import view_rect
+from game.metrics import METRICS
 
 class BackgroundSystem:
     """Système de rendu de l'arrière-plan"""
     
-    def __init__(self):
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random
         self.clouds = []
         self.init_clouds()
+        
+        # Couches précalculées (voir draw_parallax_background)
+        self.sky = None
+        self.mountain_strips = []
     
     def init_clouds(self):
         """Initialise les nuages"""
         self.clouds = []
         for i in range(12):
-            x = random.randint(-200, 3000)
-            y = random.randint(50, 300)
-            speed = random.uniform(10, 30)
-            scale = random.uniform(0.6, 1.4)
+            x = self.rng.randint(-200, 3000)
+            y = self.rng.randint(50, 300)
+            speed = self.rng.uniform(10, 30)
+            scale = self.rng.uniform(0.6, 1.4)
             self.clouds.append({"x": x, "y": y, "speed": speed, "scale": scale})
     
     def update_clouds(self, dt, camera_offset):
@@ -27,9 +34,9 @@ class BackgroundSystem:
         for c in self.clouds:
             c["x"] += c["speed"] * dt
             if c["x"] - camera_offset.x > 3200:
-                c["x"] = camera_offset.x - random.randint(200, 600)
-                c["y"] = random.randint(50, 300)
-                c["speed"] = random.uniform(10, 30)
+                c["x"] = camera_offset.x - self.rng.randint(200, 600)
+                c["y"] = self.rng.randint(50, 300)
+                c["speed"] = self.rng.uniform(10, 30)
     
     def draw_cloud(self, screen, x, y, scale):
         """Dessine un nuage"""
@@ -40,32 +47,74 @@ class BackgroundSystem:
             rect = pygame.Rect(int(x + ox*scale), int(y + oy*scale), int(w*scale), int(h*scale))
             pygame.draw.ellipse(screen, color, rect)
     
-    def draw_parallax_background(self, screen, camera_offset):
-        """Dessine l'arrière-plan complet avec parallax"""
-        # Ciel dégradé
+    def _build_sky(self, screen):
+        """Précalcule le ciel dégradé (une ligne par rangée de pixels)"""
+        sky = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), 0, screen)
         for i in range(SCREEN_HEIGHT):
             color = (
                 int(70 + (130 - 70) * i / SCREEN_HEIGHT),
                 int(130 + (180 - 130) * i / SCREEN_HEIGHT),
                 int(180 + (230 - 180) * i / SCREEN_HEIGHT)
             )
-            pygame.draw.line(screen, color, (0, i), (SCREEN_WIDTH, i))
+            pygame.draw.line(sky, color, (0, i), (SCREEN_WIDTH, i))
+        return sky
+    
+    def _build_mountain_strip(self, screen, color, base_y):
+        """Précalcule une couche de montagnes en bande répétable horizontalement
+        
+        Le relief a une période qui divise MOUNTAIN_STRIP_WIDTH, et les
+        sommets tombent sur les deux bords: deux bandes côte à côte se
+        raccordent sans couture.
+        
+        Returns:
+            tuple: (Surface, ordonnée de son bord haut à l'écran)
+        """
+        top = base_y - MOUNTAIN_AMPLITUDE
+        strip = pygame.Surface((MOUNTAIN_STRIP_WIDTH, SCREEN_HEIGHT - top), 0, screen)
+        strip.fill((255, 0, 255))  # Couleur transparente (absente des couches)
+        strip.set_colorkey((255, 0, 255), pygame.RLEACCEL)
+        points = [(0, SCREEN_HEIGHT - top)]
+        for x in range(0, MOUNTAIN_STRIP_WIDTH + 1, MOUNTAIN_VERTEX_STEP):
+            y = base_y + int(MOUNTAIN_AMPLITUDE * math.sin(x * 2 * math.pi / MOUNTAIN_WAVE_PERIOD))
+            points.append((x, y - top))
+        points.append((MOUNTAIN_STRIP_WIDTH, SCREEN_HEIGHT - top))
+        pygame.draw.polygon(strip, color, points)
+        return strip, top
+    
+    def draw_parallax_background(self, screen, camera_offset):
+        """Dessine l'arrière-plan complet avec parallax
+        
+        Le ciel et les couches de montagnes sont précalculés au premier
+        appel: chaque image ne fait que les copier (blit), les montagnes
+        défilant selon leur facteur de parallax.
+        """
+        if self.sky is None:
+            self.sky = self._build_sky(screen)
+            self.mountain_strips = [(self._build_mountain_strip(screen, col, base_y), factor)
+                                    for col, factor, base_y in MOUNTAIN_LAYERS]
+        
+        # Ciel dégradé
+        screen.blit(self.sky, (0, 0))
 
         # Montagnes (3 couches)
-        for col, factor, base_y in MOUNTAIN_LAYERS:
-            points = []
-            start_x = -int(camera_offset.x * factor) - 300
-            for x in range(start_x, start_x + SCREEN_WIDTH + 600, 120):
-                y = base_y + int(40 * math.sin(x * 0.01))
-                points.append((x, y))
-            points = [(-1000, SCREEN_HEIGHT), *points, (SCREEN_WIDTH + 1000, SCREEN_HEIGHT)]
-            pygame.draw.polygon(screen, col, points)
+        for (strip, top), factor in self.mountain_strips:
+            x = -(int(camera_offset.x * factor) % MOUNTAIN_STRIP_WIDTH)
+            while x < SCREEN_WIDTH:
+                screen.blit(strip, (x, top))
+                x += MOUNTAIN_STRIP_WIDTH
 
-        # Nuages (parallax léger)
+        # Nuages (parallax léger), écartés hors de la vue de leur couche
+        cloud_offset = camera_offset * 0.2
+        view = view_rect(cloud_offset, screen.get_size())
+        drawn = 0
         for c in self.clouds:
-            cx = c["x"] - camera_offset.x * 0.2
-            cy = c["y"] - camera_offset.y * 0.2
-            self.draw_cloud(screen, cx, cy, c["scale"])
+            scale = c["scale"]
+            # Boîte englobante des ellipses (voir draw_cloud)
+            if not view.colliderect((c["x"] - 40 * scale, c["y"], 180 * scale, 65 * scale)):
+                continue
+            drawn += 1
+            self.draw_cloud(screen, c["x"] - cloud_offset.x, c["y"] - cloud_offset.y, scale)
+        METRICS.cull("clouds", drawn, len(self.clouds))
     
     def draw_ground(self, screen, camera_offset, ground_y, ground_start_x, ground_end_x):
         """Dessine le sol avec texture"""
@@ -78,8 +127,10 @@ class BackgroundSystem:
         pygame.draw.rect(screen, GROUND_COLOR, ground_rect)
         pygame.draw.rect(screen, (25, 100, 25), ground_rect, 3)
         
-        # Texture du sol
-        for i in range(0, 3000, 50):
+        # Texture du sol (seulement les lignes visibles)
+        first = max(0, int((camera_offset.x - 2) // 50) * 50)
+        last = min(3000, int(camera_offset.x + screen.get_width() + 2))
+        for i in range(first, last, 50):
             pygame.draw.line(screen, (44, 160, 44), 
                             (i - camera_offset.x, ground_y - camera_offset.y),
                             (i - camera_offset.x, ground_y - camera_offset.y + 100), 2)
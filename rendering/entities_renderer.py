@@ -1,26 +1,125 @@
 # Rendu des entités (joueur, ennemis, projectiles)
 import pygame
 import math
+from collections import OrderedDict
+import numpy as np
 from config.constants import *
 from config.colors import *
+from game.camera import view_rect
+from game.metrics import METRICS
+
+# Position du centre de la tête dans le sprite du corps du joueur, et taille du sprite
+PLAYER_SPRITE_ORIGIN = (40, 36)
+PLAYER_SPRITE_SIZE = (80, 140)
+# Position de la main dans le sprite du pistolet, et taille du sprite
+GUN_SPRITE_ORIGIN = (30, 30)
+GUN_SPRITE_SIZE = (61, 61)
 
 class EntitiesRenderer:
     """Classe responsable du rendu des entités du jeu"""
     
-    def draw_player(self, screen, player, camera_offset, keys, is_invulnerable, invuln_timer):
-        """Dessine le joueur complet avec toutes ses parties"""
-        p_center_screen = (int(player.pos.x - camera_offset.x), int(player.pos.y - camera_offset.y))
+    def __init__(self):
+        # Sprites pré-rendus des particules: {clé couleur+palier de vie: Surface}
+        self.dot_sprites = {}
+        self.projectile_sprite = None
+        # Sprites pré-rendus du joueur (LRU): {pose: Surface}
+        self.player_sprites = OrderedDict()
+        self.gun_sprites = OrderedDict()
+        # Sprites pré-rendus des ennemis (LRU): {(type, rayon, direction, flash): (Surface, dx, dy)}
+        self.enemy_sprites = OrderedDict()
+    
+    def _cached_sprite(self, cache, key, bake):
+        """Sprite de key dans un cache LRU borné, précalculé par bake(key) au besoin"""
+        sprite = cache.get(key)
+        if sprite is None:
+            sprite = bake(key)
+            cache[key] = sprite
+            if len(cache) > SPRITE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return sprite
+    
+    def _submit_blits(self, screen, blit_sequence):
+        """Envoie une liste (surface, position) en un seul appel C"""
+        if not blit_sequence:
+            return
+        if hasattr(screen, "fblits"):
+            screen.fblits(blit_sequence)
+        else:
+            screen.blits(blit_sequence, doreturn=False)
+    
+    def draw_player(self, screen, player, camera_offset, keys, is_invulnerable, invuln_timer, render_pos=None):
+        """Dessine le joueur complet avec toutes ses parties
+        
+        render_pos permet de dessiner à une position interpolée entre deux pas
+        de simulation (par défaut: player.pos).
+        
+        Le corps et le pistolet sont des sprites précalculés par pose (voir
+        _player_pose et _gun_pose): chaque image ne fait que deux blits.
+        """
+        if render_pos is None:
+            render_pos = player.pos
+        p_center_screen = (int(render_pos.x - camera_offset.x), int(render_pos.y - camera_offset.y))
         moving_now = keys[pygame.K_q] or keys[pygame.K_LEFT] or keys[pygame.K_d] or keys[pygame.K_RIGHT]
         bob = math.sin(player.walk_cycle * 12) * 2 if moving_now else 0
         render_center = (p_center_screen[0], p_center_screen[1] + int(bob))
 
         # Effet d'invulnérabilité (clignotement)
         if not is_invulnerable or int(invuln_timer * 10) % 2 == 0:
-            self._draw_player_body(screen, render_center, player, moving_now)
-            self._draw_player_gun(screen, render_center, player, camera_offset)
+            pose = self._player_pose(player, moving_now)
+            body = self._cached_sprite(self.player_sprites, pose, self._bake_player_body)
+            screen.blit(body, (render_center[0] - PLAYER_SPRITE_ORIGIN[0], render_center[1] - PLAYER_SPRITE_ORIGIN[1]))
+            
+            hand, gun_pose = self._gun_pose(player, camera_offset)
+            gun = self._cached_sprite(self.gun_sprites, gun_pose, self._bake_player_gun)
+            screen.blit(gun, (render_center[0] + hand[0] - GUN_SPRITE_ORIGIN[0],
+                              render_center[1] + hand[1] - GUN_SPRITE_ORIGIN[1]))
+    
+    def _player_pose(self, player, moving_now):
+        """Géométrie entière du corps, relative au centre de la tête
+        
+        Les primitives de pygame.draw tronquent les coordonnées: deux états
+        (phase de marche, direction, au sol, recul) qui donnent la même pose
+        donnent exactement les mêmes pixels. La pose sert de clé au cache.
+        
+        Returns:
+            tuple: (inclinaison du torse, hauteur des mains, demi-portée des
+                    coudes, portée main droite, portée main gauche,
+                    décalage jambe gauche, décalage jambe droite)
+        """
+        tilt = int(player.direction * (2 if moving_now else 0))
+        
+        arm_y = head_radius + 16 - (6 if not player.on_ground else 0)
+        arm_angle = math.sin(player.walk_cycle * 10) * 15
+        arm_offset = arm_length * math.cos(math.radians(arm_angle))
+        
+        # Recul du tir
+        if player.shoot_recoil > 0:
+            recoil_factor = 1.0 - min(1.0, player.shoot_recoil / 0.12) * 0.6
+            arm_offset *= recoil_factor
+            arm_y -= 2
+        if not player.on_ground:
+            arm_offset *= 0.6
+        
+        # Animation de marche
+        walk_offset = 0
+        if moving_now:
+            walk_offset = math.sin(player.walk_cycle * 8) * 8
+        
+        return (tilt, arm_y, int(arm_offset // 2), math.floor(arm_offset), math.floor(-arm_offset),
+                math.floor(walk_offset), math.floor(-walk_offset))
+    
+    def _bake_player_body(self, pose):
+        """Sprite du corps pour une pose (voir _player_pose)"""
+        sprite = pygame.Surface(PLAYER_SPRITE_SIZE, pygame.SRCALPHA)
+        METRICS.add("surfaces.player_sprite")
+        self._draw_player_body(sprite, PLAYER_SPRITE_ORIGIN, pose)
+        return sprite
     
-    def _draw_player_body(self, screen, render_center, player, moving_now):
+    def _draw_player_body(self, screen, render_center, pose):
         """Dessine le corps du joueur"""
+        tilt, arm_y, elbow_half, right_reach, left_reach, left_walk, right_walk = pose
         # Tête avec contour
         pygame.draw.circle(screen, skin_color, render_center, head_radius)
         pygame.draw.circle(screen, (0, 0, 0), render_center, head_radius, 3)
@@ -32,13 +131,13 @@ class EntitiesRenderer:
         self._draw_player_hair(screen, render_center)
         
         # Cou et torse
-        self._draw_player_torso(screen, render_center, player, moving_now)
+        self._draw_player_torso(screen, render_center, tilt)
         
         # Bras
-        self._draw_player_arms(screen, render_center, player, moving_now)
+        self._draw_player_arms(screen, render_center, arm_y, elbow_half, right_reach, left_reach)
         
         # Jambes
-        self._draw_player_legs(screen, render_center, player.walk_cycle, moving_now)
+        self._draw_player_legs(screen, render_center, left_walk, right_walk)
     
     def _draw_player_face(self, screen, render_center):
         """Dessine le visage du joueur"""
@@ -99,7 +198,7 @@ class EntitiesRenderer:
         pygame.draw.line(screen, HAIR_COLOR, (render_center[0] + 7, hair_bottom + 2), (render_center[0] + 5, hair_bottom + 8), 3)
         pygame.draw.line(screen, HAIR_COLOR, (render_center[0], hair_bottom), (render_center[0], hair_bottom + 6), 3)
     
-    def _draw_player_torso(self, screen, render_center, player, moving_now):
+    def _draw_player_torso(self, screen, render_center, tilt):
         """Dessine le torse du joueur"""
         # Cou
         neck_width = 10
@@ -109,37 +208,25 @@ class EntitiesRenderer:
 
         # Torse
         torso_width = 26
-        tilt = player.direction * (2 if moving_now else 0)
         torso_rect = pygame.Rect(0, 0, torso_width, body_height)
-        torso_rect.centerx = render_center[0] + int(tilt)
+        torso_rect.centerx = render_center[0] + tilt
         torso_rect.top = render_center[1] + head_radius
         pygame.draw.rect(screen, SHIRT_COLOR, torso_rect, border_radius=6)
         pygame.draw.rect(screen, (0, 0, 0), torso_rect, 2, border_radius=6)
     
-    def _draw_player_arms(self, screen, render_center, player, moving_now):
-        """Dessine les bras du joueur"""
+    def _draw_player_arms(self, screen, render_center, arm_y, elbow_half, right_reach, left_reach):
+        """Dessine les bras du joueur (géométrie de _player_pose)"""
         shoulder_y = render_center[1] + head_radius + 12
-        base_arm_y = render_center[1] + head_radius + 16
-        arm_y = base_arm_y - (6 if not player.on_ground else 0)
-        arm_angle = math.sin(player.walk_cycle * 10) * 15
-        arm_offset = arm_length * math.cos(math.radians(arm_angle))
-        
-        # Recul du tir
-        if player.shoot_recoil > 0:
-            recoil_factor = 1.0 - min(1.0, player.shoot_recoil / 0.12) * 0.6
-            arm_offset *= recoil_factor
-            arm_y -= 2
-        if not player.on_ground:
-            arm_offset *= 0.6
+        arm_y = render_center[1] + arm_y
         
         # Calcul des positions des bras
-        left_shoulder = (int(render_center[0] - 8), shoulder_y)
-        left_elbow = (int(render_center[0] - 12 - arm_offset//2), arm_y - 5)
-        left_hand = (int(render_center[0] - arm_offset), int(arm_y))
+        left_shoulder = (render_center[0] - 8, shoulder_y)
+        left_elbow = (render_center[0] - 12 - elbow_half, arm_y - 5)
+        left_hand = (render_center[0] + left_reach, arm_y)
         
-        right_shoulder = (int(render_center[0] + 8), shoulder_y)
-        right_elbow = (int(render_center[0] + 12 + arm_offset//2), arm_y - 5)
-        right_hand = (int(render_center[0] + arm_offset), int(arm_y))
+        right_shoulder = (render_center[0] + 8, shoulder_y)
+        right_elbow = (render_center[0] + 12 + elbow_half, arm_y - 5)
+        right_hand = (render_center[0] + right_reach, arm_y)
         
         # Dessin des bras
         pygame.draw.line(screen, SHIRT_COLOR, left_shoulder, left_elbow, 6)
@@ -163,17 +250,12 @@ class EntitiesRenderer:
         pygame.draw.circle(screen, SHIRT_COLOR, right_elbow, 3)
         pygame.draw.circle(screen, (0, 0, 0), right_elbow, 3, 1)
     
-    def _draw_player_legs(self, screen, render_center, walk_cycle, moving_now):
-        """Dessine les jambes du joueur"""
+    def _draw_player_legs(self, screen, render_center, left_walk, right_walk):
+        """Dessine les jambes du joueur (décalages de marche de _player_pose)"""
         leg_width = 8
         foot_width = 12
         foot_height = 6
         
-        # Animation de marche
-        walk_offset = 0
-        if moving_now:
-            walk_offset = math.sin(walk_cycle * 8) * 8
-        
         # Positions des jambes
         torso_rect = pygame.Rect(0, 0, 26, body_height)
         torso_rect.centerx = render_center[0]
@@ -181,12 +263,12 @@ class EntitiesRenderer:
         
         left_leg_x = torso_rect.centerx - 6
         left_leg_y = torso_rect.bottom
-        left_leg_end_y = left_leg_y + leg_height - 5 + walk_offset
+        left_leg_end_y = left_leg_y + leg_height - 5 + left_walk
         left_foot_y = left_leg_end_y
         
         right_leg_x = torso_rect.centerx + 6
         right_leg_y = torso_rect.bottom
-        right_leg_end_y = right_leg_y + leg_height - 5 - walk_offset
+        right_leg_end_y = right_leg_y + leg_height - 5 + right_walk
         right_foot_y = right_leg_end_y
         
         # Dessin des jambes
@@ -202,8 +284,13 @@ class EntitiesRenderer:
         pygame.draw.rect(screen, (0, 0, 0), left_foot_rect, 1, border_radius=3)
         pygame.draw.rect(screen, (0, 0, 0), right_foot_rect, 1, border_radius=3)
     
-    def _draw_player_gun(self, screen, render_center, player, camera_offset):
-        """Dessine le pistolet dans la main du joueur"""
+    def _gun_pose(self, player, camera_offset):
+        """Position de la main avant (relative au centre de la tête) et
+        géométrie entière du pistolet (relative à la main), clé de son sprite
+        
+        Returns:
+            tuple: ((dx, dy) de la main, (crosse, corps, canon) en (dx, dy))
+        """
         mouse_x, mouse_y = pygame.mouse.get_pos()
         mouse_world = pygame.Vector2(mouse_x + camera_offset.x, mouse_y + camera_offset.y)
         aim_vec = (mouse_world - pygame.Vector2(player.pos.x, player.pos.y))
@@ -219,45 +306,106 @@ class EntitiesRenderer:
             recoil_factor = 1.0 - min(1.0, player.shoot_recoil / 0.12) * 0.6
             front_hand_offset *= recoil_factor
         
-        front_hand_x = render_center[0] + (front_hand_offset if aim_dir.x >= 0 else -front_hand_offset)
-        front_hand_y = render_center[1] + head_radius + 16 - (6 if not player.on_ground else 0)
-        front_hand = (int(front_hand_x), int(front_hand_y))
+        hand = (math.floor(front_hand_offset if aim_dir.x >= 0 else -front_hand_offset),
+                head_radius + 16 - (6 if not player.on_ground else 0))
         
         # Paramètres du pistolet
         grip_len, body_len, barrel_len = 8, 12, 10
-        thickness = 5
         
-        # Points du pistolet
-        base = pygame.Vector2(front_hand)
+        # Points du pistolet, relatifs à la main
         perp = pygame.Vector2(-aim_dir.y, aim_dir.x)
-        grip_end = base - perp * 4 + aim_dir * 2
-        body_end = base + aim_dir * body_len
+        grip_end = -perp * 4 + aim_dir * 2
+        body_end = aim_dir * body_len
         barrel_end = body_end + aim_dir * barrel_len
+        gun = tuple((math.floor(p.x), math.floor(p.y)) for p in (grip_end, body_end, barrel_end))
+        return hand, gun
+    
+    def _bake_player_gun(self, gun):
+        """Sprite du pistolet pour une géométrie (voir _gun_pose)"""
+        sprite = pygame.Surface(GUN_SPRITE_SIZE, pygame.SRCALPHA)
+        METRICS.add("surfaces.player_sprite")
+        self._draw_player_gun(sprite, GUN_SPRITE_ORIGIN, gun)
+        return sprite
+    
+    def _draw_player_gun(self, screen, front_hand, gun):
+        """Dessine le pistolet dans la main du joueur"""
+        thickness = 5
+        (gx, gy), (bx, by), (cx, cy) = gun
+        base = front_hand
+        grip_end = (base[0] + gx, base[1] + gy)
+        body_end = (base[0] + bx, base[1] + by)
+        barrel_end = (base[0] + cx, base[1] + cy)
         
         # Dessin du pistolet
         pygame.draw.line(screen, GUN_COLORS["grip"], base, grip_end, thickness)
         pygame.draw.line(screen, GUN_COLORS["body"], base, body_end, thickness)
         pygame.draw.line(screen, GUN_COLORS["barrel"], body_end, barrel_end, 3)
     
-    def draw_enemies(self, screen, enemies, camera_offset):
-        """Dessine tous les ennemis"""
+    def draw_enemies(self, screen, enemies, camera_offset, alpha=1.0):
+        """Dessine les ennemis visibles
+        
+        Chaque variante (type, rayon, direction, flash) est dessinée une
+        seule fois dans un sprite: les ennemis visibles sont ensuite envoyés
+        en un seul lot de blits. alpha interpole la position entre le pas
+        de simulation précédent (0) et le pas courant (1).
+        """
+        view = view_rect(camera_offset, screen.get_size())
+        left, top, right, bottom = view.left, view.top, view.right, view.bottom
+        drawn = 0
+        blit_sequence = []
         for monster in enemies:
-            monster_screen = (int(monster["pos"].x - camera_offset.x), 
-                             int(monster["pos"].y - camera_offset.y))
+            pos = monster["pos"]
+            if alpha < 1.0:
+                pos = monster["prev_pos"].lerp(pos, alpha)
             r = monster["radius"]
+            # Portée du dessin autour du centre (ailes, sac à dos du tank)
+            reach = r + 30
+            if pos.x + reach < left or pos.x - reach > right or pos.y + reach < top or pos.y - reach > bottom:
+                continue
+            drawn += 1
+            monster_screen = (int(pos.x - camera_offset.x), 
+                             int(pos.y - camera_offset.y))
             
-            # Couleur selon flash
-            base_color = MONSTER_COLORS.get(monster["type"], MONSTER_COLORS["basic"])
-            monster_color = (255, 220, 220) if monster["hit_flash"] > 0 else base_color
-            
-            if monster["type"] == "tank":
-                self._draw_tank_enemy(screen, monster_screen, r, monster_color)
-            elif monster["type"] == "fast":
-                self._draw_fast_enemy(screen, monster_screen, r, monster_color, monster["dir"])
-            elif monster["type"] == "flyer":
-                self._draw_flyer_enemy(screen, monster_screen, r, monster_color)
-            else:
-                self._draw_basic_enemy(screen, monster_screen, r, monster_color)
+            # Seul l'ennemi rapide dépend de sa direction (traînée)
+            m_type = monster["type"]
+            key = (m_type, r, monster["dir"] if m_type == "fast" else 0, monster["hit_flash"] > 0)
+            sprite, dx, dy = self._cached_sprite(self.enemy_sprites, key, self._bake_enemy)
+            blit_sequence.append((sprite, (monster_screen[0] + dx, monster_screen[1] + dy)))
+        self._submit_blits(screen, blit_sequence)
+        METRICS.cull("enemies", drawn, len(enemies))
+    
+    def _bake_enemy(self, key):
+        """Sprite d'une variante d'ennemi et position de son coin par rapport au centre
+        
+        Les primitives sont opaques: le sprite est recadré sur les pixels
+        dessinés et utilise une couleur transparente (blit RLE, bien plus
+        rapide qu'un canal alpha).
+        """
+        m_type, r, direction, flash = key
+        half = math.ceil(r) + 31  # Portée du dessin (voir draw_enemies)
+        canvas = pygame.Surface((half * 2 + 1, half * 2 + 1), pygame.SRCALPHA)
+        METRICS.add("surfaces.enemy_sprite")
+        
+        # Couleur selon flash
+        base_color = MONSTER_COLORS.get(m_type, MONSTER_COLORS["basic"])
+        monster_color = (255, 220, 220) if flash else base_color
+        
+        center = (half, half)
+        if m_type == "tank":
+            self._draw_tank_enemy(canvas, center, r, monster_color)
+        elif m_type == "fast":
+            self._draw_fast_enemy(canvas, center, r, monster_color, direction)
+        elif m_type == "flyer":
+            self._draw_flyer_enemy(canvas, center, r, monster_color)
+        else:
+            self._draw_basic_enemy(canvas, center, r, monster_color)
+        
+        bounds = canvas.get_bounding_rect()
+        sprite = pygame.Surface(bounds.size)
+        sprite.fill(SPRITE_COLORKEY)
+        sprite.blit(canvas, (0, 0), bounds)
+        sprite.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+        return sprite, bounds.x - half, bounds.y - half
     
     def _draw_tank_enemy(self, screen, pos, r, color):
         """Dessine un ennemi tank (gros et lent)"""
@@ -318,19 +466,80 @@ class EntitiesRenderer:
         pygame.draw.circle(screen, (0, 0, 0), (pos[0] - 7, pos[1] - 5), 3)
         pygame.draw.circle(screen, (0, 0, 0), (pos[0] + 7, pos[1] - 5), 3)
     
-    def draw_projectiles(self, screen, projectiles, camera_offset):
-        """Dessine tous les projectiles"""
-        for proj in projectiles:
-            proj_screen = (int(proj["pos"].x - camera_offset.x), int(proj["pos"].y - camera_offset.y))
-            pygame.draw.circle(screen, (150, 255, 150), proj_screen, projectile_radius + 2)
-            pygame.draw.circle(screen, (0, 255, 0), proj_screen, projectile_radius)
-            pygame.draw.circle(screen, (255, 255, 255), proj_screen, projectile_radius - 3)
+    def _get_projectile_sprite(self):
+        """Sprite du projectile (halo, corps, cœur), rendu une seule fois"""
+        if self.projectile_sprite is None:
+            r = projectile_radius + 2
+            sprite = pygame.Surface((r * 2 + 1, r * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (150, 255, 150), (r, r), projectile_radius + 2)
+            pygame.draw.circle(sprite, (0, 255, 0), (r, r), projectile_radius)
+            pygame.draw.circle(sprite, (255, 255, 255), (r, r), projectile_radius - 3)
+            self.projectile_sprite = sprite
+        return self.projectile_sprite
+    
+    def _visible_screen_points(self, screen, positions, camera_offset, margin, path):
+        """Écarte les positions monde (N, 2) hors de la vue (à margin pixels
+        près), puis convertit les autres en coordonnées écran entières
+        
+        Returns:
+            tuple: (sx, sy, masque de visibilité)
+        """
+        view = view_rect(camera_offset, screen.get_size(), margin)
+        x = positions[:, 0]
+        y = positions[:, 1]
+        visible = (x >= view.left) & (x < view.right) & (y >= view.top) & (y < view.bottom)
+        points = positions[visible]
+        sx = (points[:, 0] - camera_offset.x).astype(np.int32)
+        sy = (points[:, 1] - camera_offset.y).astype(np.int32)
+        METRICS.cull(path, len(points), len(positions))
+        return sx, sy, visible
+    
+    def draw_projectiles(self, screen, projectiles, camera_offset, alpha=1.0):
+        """Dessine tous les projectiles (projectiles: ProjectileSystem)
+        
+        Un seul sprite pré-rendu, blitté en lot pour les projectiles visibles
+        (positions interpolées par alpha, voir draw_enemies).
+        """
+        positions = projectiles.interpolated_positions(alpha)
+        if len(positions) == 0:
+            return
+        sprite = self._get_projectile_sprite()
+        half = sprite.get_width() // 2
+        sx, sy, _ = self._visible_screen_points(screen, positions, camera_offset, half, "projectiles")
+        self._submit_blits(screen, [(sprite, (x - half, y - half)) for x, y in zip(sx.tolist(), sy.tolist())])
+    
+    def _get_dot_sprite(self, key):
+        """Sprite d'une particule pour une clé (r, g, b, palier de vie) encodée en entier"""
+        sprite = self.dot_sprites.get(key)
+        if sprite is None:
+            r, g, b = (key >> 24) & 255, (key >> 16) & 255, (key >> 8) & 255
+            sprite = pygame.Surface((7, 7), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (r, g, b), (3, 3), 3)
+            self.dot_sprites[key] = sprite
+        return sprite
     
-    def draw_particles(self, screen, particles, camera_offset):
-        """Dessine toutes les particules"""
-        for part in particles:
-            if part["life"] > 0:
-                part_screen = (int(part["pos"].x - camera_offset.x), int(part["pos"].y - camera_offset.y))
-                alpha = int(255 * part["life"])
-                color = tuple(min(255, max(0, int(c * part["life"]))) for c in part["color"])
-                pygame.draw.circle(screen, color, part_screen, 3)
+    def draw_particles(self, screen, particles, camera_offset, alpha=1.0):
+        """Dessine toutes les particules (particles: ParticleSystem)
+        
+        La vie restante est arrondie à PARTICLE_LIFE_BUCKETS paliers: chaque
+        couple (couleur, palier) a son sprite en cache, et toutes les
+        particules visibles sont envoyées en un seul lot de blits
+        (positions interpolées par alpha, voir draw_enemies).
+        """
+        positions, colors, lives = particles.alive(alpha)
+        if len(lives) == 0:
+            return
+        sx, sy, visible = self._visible_screen_points(screen, positions, camera_offset, 4, "particles")
+        colors = colors[visible]
+        buckets = np.ceil(lives[visible] * PARTICLE_LIFE_BUCKETS).astype(np.int64)
+        
+        # Couleur assombrie selon le palier de vie, puis clé entière (r, g, b, palier)
+        faded = np.clip(colors * (buckets[:, None] / PARTICLE_LIFE_BUCKETS), 0, 255).astype(np.int64)
+        keys = (faded[:, 0] << 24) | (faded[:, 1] << 16) | (faded[:, 2] << 8) | buckets
+        
+        sprites = self.dot_sprites
+        blit_sequence = []
+        for key, x, y in zip(keys.tolist(), sx.tolist(), sy.tolist()):
+            sprite = sprites.get(key) or self._get_dot_sprite(key)
+            blit_sequence.append((sprite, (x - 3, y - 3)))
+        self._submit_blits(screen, blit_sequence)
@@ -0,0 +1,118 @@
+# Cache de rendu de la géométrie statique (sol et plateformes)
+from collections import OrderedDict
+import pygame
+from config.constants import *
+from config.colors import *
+from game.camera import view_rect
+from game.metrics import METRICS
+
+# Couleur transparente des morceaux opaques (absente des couleurs fixes du décor)
+_COLORKEY = (255, 0, 255)
+
+
+class StaticGeometryCache:
+    """Sol et plateformes précalculés en morceaux de taille fixe
+
+    La géométrie d'un niveau ne change plus après son chargement: le monde
+    est découpé en carrés de GEOMETRY_CHUNK_SIZE pixels, dessinés à la
+    demande (avec les fonctions de dessin d'origine, décalées à l'origine
+    du morceau) la première fois qu'ils entrent dans la vue. Chaque image
+    ne copie ensuite que les morceaux visibles: le coût dépend de la
+    surface de l'écran, plus du nombre de plateformes.
+
+    Les morceaux sont gardés dans un cache LRU borné en mémoire. Ceux qui
+    contiennent du décor semi-transparent gardent leur canal alpha; les
+    autres sont opaques avec une couleur transparente (blit plus rapide).
+    """
+
+    def __init__(self, ui_manager, background_system, chunk_size=GEOMETRY_CHUNK_SIZE, budget=GEOMETRY_CACHE_BUDGET):
+        self.ui_manager = ui_manager
+        self.background_system = background_system
+        self.chunk_size = chunk_size
+        self.budget = budget
+        self.chunks = OrderedDict()  # (cx, cy) -> (Surface ou None si vide, taille)
+        self.total_bytes = 0
+        self.level = None
+
+    def set_level(self, platforms, platform_colors, platform_types, platform_index,
+                  ground_y, ground_start_x, ground_end_x):
+        """Change la géométrie (les morceaux sont gardés si c'est la même)"""
+        level = (platforms, platform_colors, platform_types, platform_index,
+                 ground_y, ground_start_x, ground_end_x)
+        if level == self.level:
+            return
+        self.level = level
+        self.clear()
+
+    def clear(self):
+        """Oublie tous les morceaux"""
+        self.chunks.clear()
+        self.total_bytes = 0
+
+    def draw(self, screen, camera_offset):
+        """Copie à l'écran les morceaux visibles (dessinés au besoin)"""
+        if self.level is None:
+            return
+        size = self.chunk_size
+        # Même arrondi que Rect.move(-camera_offset.x, -camera_offset.y)
+        dx = int(-camera_offset.x)
+        dy = int(-camera_offset.y)
+        view = view_rect(camera_offset, screen.get_size())
+        x0, x1 = view.left // size, (view.right - 1) // size
+        y0, y1 = view.top // size, (view.bottom - 1) // size
+
+        blits = []
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                surface = self._chunk(cx, cy, screen)
+                if surface is not None:
+                    blits.append((surface, (cx * size + dx, cy * size + dy)))
+        if blits:
+            screen.blits(blits, doreturn=False)
+        METRICS.add("blits.geometry_chunks", len(blits))
+
+    def _chunk(self, cx, cy, screen):
+        """Retourne la Surface du morceau (cx, cy), None s'il est vide"""
+        entry = self.chunks.get((cx, cy))
+        if entry is not None:
+            self.chunks.move_to_end((cx, cy))
+            return entry[0]
+
+        surface = self._bake(cx, cy, screen)
+        nbytes = surface.get_bytesize() * self.chunk_size * self.chunk_size if surface is not None else 0
+        self.chunks[(cx, cy)] = (surface, nbytes)
+        self.total_bytes += nbytes
+        while self.total_bytes > self.budget and len(self.chunks) > 1:
+            _, (_, evicted_bytes) = self.chunks.popitem(last=False)
+            self.total_bytes -= evicted_bytes
+        return surface
+
+    def _bake(self, cx, cy, screen):
+        """Dessine le morceau (cx, cy), ou retourne None s'il est vide"""
+        platforms, platform_colors, platform_types, platform_index, ground_y, ground_start_x, ground_end_x = self.level
+        size = self.chunk_size
+        area = pygame.Rect(cx * size, cy * size, size, size)
+
+        has_ground = area.colliderect((ground_start_x, ground_y, ground_end_x - ground_start_x, 100)) or \
+            area.colliderect((0, ground_y, 3000, 100))  # Texture du sol, voir draw_ground
+        indices = [i for i in platform_index.query(area) if platforms[i].colliderect(area)]
+        if not has_ground and not indices:
+            return None
+
+        rects = [platforms[i] for i in indices]
+        colors = [platform_colors[i] if i < len(platform_colors) else PLATFORM_COLOR for i in indices]
+        types = [platform_types[i] if i < len(platform_types) else "platform" for i in indices]
+
+        if "decor" in types or _COLORKEY in colors:
+            surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        else:
+            surface = pygame.Surface((size, size), 0, screen)
+            surface.fill(_COLORKEY)
+            surface.set_colorkey(_COLORKEY, pygame.RLEACCEL)
+        METRICS.add("surfaces.geometry_chunk")
+
+        origin = pygame.Vector2(area.topleft)
+        if has_ground:
+            self.background_system.draw_ground(surface, origin, ground_y, ground_start_x, ground_end_x)
+        self.ui_manager.draw_platforms(surface, rects, colors, types, origin)
+        return surface
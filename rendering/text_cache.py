@@ -0,0 +1,87 @@
+# Cache des polices et des textes rendus
+from collections import OrderedDict
+import pygame
+from config.constants import *
+from game.metrics import METRICS
+
+
+class FontRegistry:
+    """Polices partagées, créées une seule fois par (nom, taille)
+
+    Créer une pygame.font.Font relit le fichier de police: le faire à
+    chaque image coûte cher, et donne aussi un objet différent à chaque
+    fois (donc aucun succès possible dans le cache de textes).
+    """
+
+    def __init__(self):
+        self.fonts = {}
+
+    def font(self, name, size):
+        """Équivalent partagé de pygame.font.Font(name, size)"""
+        key = ("font", name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self.fonts[key] = pygame.font.Font(name, size)
+        return font
+
+    def sysfont(self, name, size, bold=False, italic=False):
+        """Équivalent partagé de pygame.font.SysFont(name, size, bold, italic)"""
+        key = ("sysfont", name, size, bold, italic)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self.fonts[key] = pygame.font.SysFont(name, size, bold, italic)
+        return font
+
+
+class TextCache:
+    """Cache LRU des surfaces de texte rendues
+
+    render() s'utilise comme Font.render(): un texte déjà rendu avec la
+    même police, la même couleur et le même lissage ne coûte qu'une
+    recherche. Les surfaces retournées sont partagées et ne doivent pas
+    être modifiées. Les succès et échecs sont comptés (stats(), et par
+    image dans METRICS: text_cache.hits / text_cache.misses).
+    """
+
+    def __init__(self, capacity=TEXT_CACHE_SIZE):
+        self.capacity = capacity
+        self.entries = OrderedDict()  # (police, texte, lissage, couleur, fond) -> Surface
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        """Retourne font.render(text, antialias, color, background), depuis le cache si possible"""
+        key = (font, text, antialias, tuple(color), tuple(background) if background is not None else None)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            METRICS.add("text_cache.hits")
+            return surface
+
+        surface = font.render(text, antialias, color, background)
+        self.entries[key] = surface
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+        self.misses += 1
+        METRICS.add("text_cache.misses")
+        return surface
+
+    def stats(self):
+        """Retourne {"hits", "misses", "size", "hit_rate"}"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.entries),
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def clear(self):
+        """Vide le cache (les statistiques sont conservées)"""
+        self.entries.clear()
+
+
+# Registre et cache partagés par tout le jeu
+FONTS = FontRegistry()
+TEXT_CACHE = TextCache()
@@ -1,53 +1,117 @@
 # Interface utilisateur (HUD, menus)
+from collections import OrderedDict
+import numpy as np
 import pygame
 from config.constants import *
 from config.colors import *
+from game.metrics import METRICS
+from game.camera import view_rect
+from rendering.text_cache import FONTS, TEXT_CACHE
+
+# Textes du HUD composés sur le panneau gardés en cache (voir UIManager._hud_text)
+_HUD_TEXT_CACHE_SIZE = 32
 
 class UIManager:
     """Gestionnaire de l'interface utilisateur"""
     
     def __init__(self):
-        pass
+        self.hud_layer = None  # Panneau du HUD déjà composé
+        self.hud_key = None  # Valeurs affichées par hud_layer
+        self.hud_texts = OrderedDict()  # (police, texte, couleur) -> texte composé sur le panneau
     
     def draw_hud(self, screen, font, small_font, score, lives, stamina, is_invulnerable):
-        """Dessine le HUD (Heads-Up Display)"""
-        # Panneau semi-transparent
-        hud_panel = pygame.Surface((300, 210), pygame.SRCALPHA)
-        hud_panel.fill(UI_COLORS["panel"])
-        screen.blit(hud_panel, (10, 10))
+        """Dessine le HUD (Heads-Up Display)
+
+        Le panneau n'est recomposé que si une valeur affichée change (score,
+        vies, largeur de la barre de stamina, invulnérabilité): le reste du
+        temps, le HUD coûte un seul blit, sans allocation.
+        """
+        stamina_ratio = stamina / STAMINA_MAX if STAMINA_MAX else 0
+        fill_width = int(240 * max(0, min(1, stamina_ratio)))
+        key = (font, small_font, score, lives, fill_width, bool(is_invulnerable))
+        if key != self.hud_key:
+            self._build_hud(font, small_font, score, lives, fill_width, is_invulnerable)
+            self.hud_key = key
+        screen.blit(self.hud_layer, (10, 10))
+    
+    def _build_hud(self, font, small_font, score, lives, fill_width, is_invulnerable):
+        """Recompose le panneau du HUD (coordonnées relatives au panneau)
+
+        Les textes sont recopiés tels quels depuis _hud_text (déjà composés
+        sur le fond du panneau), les formes opaques dessinées par-dessus:
+        une recomposition ne coûte que quelques copies de pixels.
+        """
+        if self.hud_layer is None:
+            self.hud_layer = pygame.Surface((300, 210), pygame.SRCALPHA)
+            METRICS.add("surfaces.hud_panel")
+        layer = self.hud_layer
+        layer.fill(UI_COLORS["panel"])
+        
+        def blit_text(text_font, text, color, pos):
+            sprite = self._hud_text(text_font, text, color)
+            # Remplace les pixels du panneau (0 + sprite), sans mélange
+            layer.fill((0, 0, 0, 0), sprite.get_rect(topleft=pos))
+            layer.blit(sprite, pos, special_flags=pygame.BLEND_RGBA_ADD)
 
         # Score
-        score_text = font.render(f"Score: {score}", True, UI_COLORS["text"])
-        screen.blit(score_text, (30, 25))
+        blit_text(font, f"Score: {score}", UI_COLORS["text"], (20, 15))
         
         # Vies avec cœurs
-        lives_text = font.render("Vies:", True, UI_COLORS["text"])
-        screen.blit(lives_text, (30, 70))
+        blit_text(font, "Vies:", UI_COLORS["text"], (20, 60))
         for i in range(lives):
-            heart_x = 130 + i * 35
-            pygame.draw.circle(screen, HEART_COLOR, (heart_x - 5, 85), 10)
-            pygame.draw.circle(screen, HEART_COLOR, (heart_x + 5, 85), 10)
-            pygame.draw.polygon(screen, HEART_COLOR, 
-                               [(heart_x - 15, 85), (heart_x, 100), (heart_x + 15, 85)])
+            heart_x = 120 + i * 35
+            pygame.draw.circle(layer, HEART_COLOR, (heart_x - 5, 75), 10)
+            pygame.draw.circle(layer, HEART_COLOR, (heart_x + 5, 75), 10)
+            pygame.draw.polygon(layer, HEART_COLOR, 
+                               [(heart_x - 15, 75), (heart_x, 90), (heart_x + 15, 75)])
 
         # Stamina
-        stamina_label = small_font.render("Stamina", True, STAMINA_COLORS["text"])
-        screen.blit(stamina_label, (30, 120))
-        stamina_bar_bg = pygame.Rect(30, 150, 240, 20)
-        pygame.draw.rect(screen, STAMINA_COLORS["background"], stamina_bar_bg, border_radius=6)
+        blit_text(small_font, "Stamina", STAMINA_COLORS["text"], (20, 110))
+        stamina_bar_bg = pygame.Rect(20, 140, 240, 20)
+        pygame.draw.rect(layer, STAMINA_COLORS["background"], stamina_bar_bg, border_radius=6)
         
-        stamina_ratio = stamina / STAMINA_MAX if STAMINA_MAX else 0
-        fill_width = int(stamina_bar_bg.width * max(0, min(1, stamina_ratio)))
         if fill_width > 0:
             stamina_bar_fill = pygame.Rect(stamina_bar_bg.left, stamina_bar_bg.top, fill_width, stamina_bar_bg.height)
-            pygame.draw.rect(screen, STAMINA_COLORS["fill"], stamina_bar_fill, border_radius=6)
+            pygame.draw.rect(layer, STAMINA_COLORS["fill"], stamina_bar_fill, border_radius=6)
         
-        pygame.draw.rect(screen, STAMINA_COLORS["border"], stamina_bar_bg, 2, border_radius=6)
+        pygame.draw.rect(layer, STAMINA_COLORS["border"], stamina_bar_bg, 2, border_radius=6)
 
         # Statut d'invulnérabilité
         if is_invulnerable:
-            inv_text = small_font.render("⚡ INVULNÉRABLE", True, UI_COLORS["invulnerable"])
-            screen.blit(inv_text, (30, 180))
+            blit_text(small_font, "⚡ INVULNÉRABLE", UI_COLORS["invulnerable"], (20, 170))
+    
+    def _hud_text(self, font, text, color):
+        """Texte lissé déjà composé sur le fond semi-transparent du panneau
+
+        Chaque pixel est l'équivalent en alpha normal du texte dessiné sur
+        l'écran par-dessus le panneau, calculé en flottants avec un seul
+        arrondi (couleur rapportée à l'alpha arrondi): le HUD composé ne
+        s'écarte du dessin direct que par les arrondis des blits.
+        Gardé dans un petit cache LRU (le score change rarement).
+        """
+        key = (font, text, tuple(color))
+        sprite = self.hud_texts.get(key)
+        if sprite is not None:
+            self.hud_texts.move_to_end(key)
+            return sprite
+        
+        source = TEXT_CACHE.render(font, text, True, color)
+        t = pygame.surfarray.array_alpha(source)[..., None] / 255.0
+        rgb = pygame.surfarray.array3d(source).astype(np.float64)
+        panel = np.array(UI_COLORS["panel"][:3], dtype=np.float64)
+        a = UI_COLORS["panel"][3] / 255.0
+        alpha = np.rint((t + a * (1.0 - t)) * 255.0)
+        color_out = (t * rgb + (1.0 - t) * a * panel) * 255.0 / np.maximum(alpha, 1.0)
+        
+        sprite = pygame.Surface(source.get_size(), pygame.SRCALPHA)
+        pygame.surfarray.pixels3d(sprite)[...] = np.clip(np.rint(color_out), 0, 255)
+        pygame.surfarray.pixels_alpha(sprite)[...] = alpha[..., 0]
+        METRICS.add("surfaces.hud_text")
+        
+        self.hud_texts[key] = sprite
+        if len(self.hud_texts) > _HUD_TEXT_CACHE_SIZE:
+            self.hud_texts.popitem(last=False)
+        return sprite
     
     def draw_button(self, screen, rect, text, font, mouse_pos):
         """Dessine un bouton interactif"""
@@ -56,7 +120,7 @@ class UIManager:
         hover = UI_COLORS["hover"]
         pygame.draw.rect(screen, hover if hovered else base, rect, border_radius=10)
         pygame.draw.rect(screen, UI_COLORS["border"], rect, 3, border_radius=10)
-        txt = font.render(text, True, UI_COLORS["text"])
+        txt = TEXT_CACHE.render(font, text, True, UI_COLORS["text"])
         screen.blit(txt, (rect.centerx - txt.get_width()//2, rect.centery - txt.get_height()//2))
     
     def draw_menu(self, screen, font, small_font, title_font, selected_level_idx, levels):
@@ -66,12 +130,12 @@ class UIManager:
         quit_rect = pygame.Rect(SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 130, 300, 70)
         
         # Titre
-        title_surf = title_font.render("Mon Jeu", True, UI_COLORS["text"])
+        title_surf = TEXT_CACHE.render(title_font, "Mon Jeu", True, UI_COLORS["text"])
         screen.blit(title_surf, (SCREEN_WIDTH//2 - title_surf.get_width()//2, SCREEN_HEIGHT//2 - 120))
 
         # Niveau sélectionné
-        level_name = levels[selected_level_idx].get("name", f"Niveau {selected_level_idx+1}")
-        level_txt = small_font.render(f"Niveau: {level_name}", True, UI_COLORS["text"])
+        level_name = levels.name(selected_level_idx)
+        level_txt = TEXT_CACHE.render(small_font, f"Niveau: {level_name}", True, UI_COLORS["text"])
         screen.blit(level_txt, (SCREEN_WIDTH//2 - level_txt.get_width()//2, SCREEN_HEIGHT//2 - 60))
 
         # Boutons
@@ -80,7 +144,7 @@ class UIManager:
         self.draw_button(screen, quit_rect, "Quitter", font, mouse_pos)
 
         # Instructions
-        hint = small_font.render("Entrée/Espace pour jouer", True, UI_COLORS["text_secondary"])
+        hint = TEXT_CACHE.render(small_font, "Entrée/Espace pour jouer", True, UI_COLORS["text_secondary"])
         screen.blit(hint, (SCREEN_WIDTH//2 - hint.get_width()//2, SCREEN_HEIGHT//2 + 220))
         
         return play_rect, quit_rect
@@ -89,6 +153,7 @@ class UIManager:
         """Dessine le menu de pause"""
         # Fond atténué
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        METRICS.add("surfaces.pause_overlay")
         overlay.fill(UI_COLORS["overlay"])
         screen.blit(overlay, (0, 0))
 
@@ -98,7 +163,7 @@ class UIManager:
         pause_quit_rect = pygame.Rect(SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 160, 300, 70)
         
         # Titre
-        pause_title = title_font.render("Pause", True, UI_COLORS["text"])
+        pause_title = TEXT_CACHE.render(title_font, "Pause", True, UI_COLORS["text"])
         screen.blit(pause_title, (SCREEN_WIDTH//2 - pause_title.get_width()//2, SCREEN_HEIGHT//2 - 120))
 
         # Boutons
@@ -108,7 +173,7 @@ class UIManager:
         self.draw_button(screen, pause_quit_rect, "Quitter", font, mouse_pos)
 
         # Instructions
-        hint = small_font.render("Echap/Entrée/Espace: Reprendre | M: Menu", True, UI_COLORS["text_secondary"])
+        hint = TEXT_CACHE.render(small_font, "Echap/Entrée/Espace: Reprendre | M: Menu", True, UI_COLORS["text_secondary"])
         screen.blit(hint, (SCREEN_WIDTH//2 - hint.get_width()//2, SCREEN_HEIGHT//2 + 250))
         
         return pause_resume_rect, pause_menu_rect, pause_quit_rect
@@ -116,12 +181,13 @@ class UIManager:
     def draw_victory_screen(self, screen, font, score):
         """Dessine l'écran de victoire"""
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        METRICS.add("surfaces.end_overlay")
         overlay.fill(UI_COLORS["overlay"])
         screen.blit(overlay, (0, 0))
         
-        big_text = pygame.font.SysFont(None, 120).render("VICTOIRE !", True, UI_COLORS["victory"])
-        sub_text = font.render("Félicitations !", True, UI_COLORS["text"])
-        score_final = font.render(f"Score Final: {score}", True, UI_COLORS["text"])
+        big_text = TEXT_CACHE.render(FONTS.sysfont(None, 120), "VICTOIRE !", True, UI_COLORS["victory"])
+        sub_text = TEXT_CACHE.render(font, "Félicitations !", True, UI_COLORS["text"])
+        score_final = TEXT_CACHE.render(font, f"Score Final: {score}", True, UI_COLORS["text"])
         
         screen.blit(big_text, (SCREEN_WIDTH//2 - big_text.get_width()//2, SCREEN_HEIGHT//2 - 100))
         screen.blit(sub_text, (SCREEN_WIDTH//2 - sub_text.get_width()//2, SCREEN_HEIGHT//2 + 20))
@@ -130,18 +196,24 @@ class UIManager:
     def draw_game_over_screen(self, screen, font, score):
         """Dessine l'écran de game over"""
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        METRICS.add("surfaces.end_overlay")
         overlay.fill(UI_COLORS["overlay"])
         screen.blit(overlay, (0, 0))
         
-        over_text = pygame.font.SysFont(None, 96).render("GAME OVER", True, UI_COLORS["game_over"])
-        score_final = font.render(f"Score: {score}", True, UI_COLORS["text"])
+        over_text = TEXT_CACHE.render(FONTS.sysfont(None, 96), "GAME OVER", True, UI_COLORS["game_over"])
+        score_final = TEXT_CACHE.render(font, f"Score: {score}", True, UI_COLORS["text"])
         
         screen.blit(over_text, (SCREEN_WIDTH//2 - over_text.get_width()//2, SCREEN_HEIGHT//2 - 60))
         screen.blit(score_final, (SCREEN_WIDTH//2 - score_final.get_width()//2, SCREEN_HEIGHT//2 + 20))
     
     def draw_platforms(self, screen, platforms, platform_colors, platform_types, camera_offset):
-        """Dessine les plateformes"""
+        """Dessine les plateformes (celles hors de la vue sont écartées)"""
+        view = view_rect(camera_offset, screen.get_size())
+        drawn = 0
         for i, plat in enumerate(platforms):
+            if not plat.colliderect(view):
+                continue
+            drawn += 1
             plat_rect_screen = plat.move(-camera_offset.x, -camera_offset.y)
             col = PLATFORM_COLOR
             if i < len(platform_colors) and platform_colors[i]:
@@ -165,13 +237,17 @@ class UIManager:
                 # Décor: rectangle semi-transparent
                 try:
                     surf = pygame.Surface((plat_rect_screen.width, plat_rect_screen.height), pygame.SRCALPHA)
+                    METRICS.add("surfaces.decor")
                     surf.fill((col[0], col[1], col[2], 120))
                     screen.blit(surf, plat_rect_screen.topleft)
                 except Exception:
                     pygame.draw.rect(screen, col, plat_rect_screen)
+        METRICS.cull("platforms", drawn, len(platforms))
     
     def draw_goal(self, screen, goal_rect, camera_offset):
         """Dessine la porte/objectif"""
+        if not goal_rect.colliderect(view_rect(camera_offset, screen.get_size())):
+            return
         goal_rect_screen = goal_rect.move(-camera_offset.x, -camera_offset.y)
         pygame.draw.rect(screen, DOOR_COLOR, goal_rect_screen)
         pygame.draw.rect(screen, DOOR_FRAME, goal_rect_screen, 5)
@@ -198,5 +274,6 @@ class UIManager:
             
             if overlay_alpha > 0:
                 overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+                METRICS.add("surfaces.transition_overlay")
                 overlay.fill((0, 0, 0, overlay_alpha))
                 screen.blit(overlay, (0, 0))